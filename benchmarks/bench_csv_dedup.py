@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark deduplicating a batch against CSV stores of different sizes.
+
+Writes a synthetic CSV store with N rows and times
+Deduplicator.filter_new_jobs on a batch of scraped jobs (half of them
+already stored) three ways:
+
+- full scan: the old CSVStorage.exists, which parsed the whole CSV into
+  Job objects for each lookup and scanned the list
+- cold index: CSVStorage with no side index yet, so it is rebuilt from the
+  CSV once
+- warm index: CSVStorage reading its existing side index
+
+The full scan is run on a sample of the batch and extrapolated.
+
+Usage:
+    python benchmarks/bench_csv_dedup.py --rows 10000 100000 --batch 500
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import Job
+from src.storage import CSVStorage
+from src.utils.deduplicator import Deduplicator
+
+
+class FullScanCSVStorage(CSVStorage):
+    """CSVStorage with the old load-and-scan membership check."""
+
+    def exists(self, job: Job) -> bool:
+        return job in self.load()
+
+    def contains_many(self, jobs):
+        return [self.exists(job) for job in jobs]
+
+
+def make_job(job_id: int) -> Job:
+    """Build a job with the given numeric ID."""
+    return Job(
+        title=f"HR Advisor {job_id}",
+        company="Company",
+        location="Sydney NSW",
+        classification="human-resources-recruitment",
+        subcategory="Generalists",
+        job_url=f"https://www.seek.com.au/job/{job_id}",
+        description="Full time role supporting our people team.",
+    )
+
+
+def run(rows: int, batch: int, sample_size: int, tmp_dir: Path) -> dict:
+    """Time the three lookup paths for one store size."""
+    csv_path = tmp_dir / f"jobs_{rows}.csv"
+    CSVStorage(csv_path).save([make_job(10_000_000 + i) for i in range(rows)])
+
+    jobs = [make_job(10_000_000 + i) for i in range(batch // 2)]
+    jobs += [make_job(90_000_000 + i) for i in range(batch - len(jobs))]
+
+    timings = {}
+
+    sample = jobs[:sample_size]
+    start = time.perf_counter()
+    Deduplicator(FullScanCSVStorage(csv_path)).filter_new_jobs(sample)
+    timings["full_scan"] = (time.perf_counter() - start) * len(jobs) / len(sample)
+
+    CSVStorage(csv_path).index_path.unlink()
+    start = time.perf_counter()
+    cold = Deduplicator(CSVStorage(csv_path)).filter_new_jobs(jobs)
+    timings["cold"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm = Deduplicator(CSVStorage(csv_path)).filter_new_jobs(jobs)
+    timings["warm"] = time.perf_counter() - start
+
+    assert len(cold) == len(warm) == batch - batch // 2, "Index lookups disagree"
+    return timings
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="CSV dedup benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="CSV store sizes")
+    parser.add_argument("--batch", type=int, default=500, help="Scraped jobs per batch")
+    parser.add_argument("--sample", type=int, default=5, help="Lookups to run for the full-scan path")
+    args = parser.parse_args()
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    print(f"Batch of {args.batch} jobs, half already stored")
+    print(f"  {'rows':>8}  {'full scan*':>11}  {'cold index':>10}  {'warm index':>10}  {'speedup':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            t = run(rows, args.batch, args.sample, Path(tmp))
+            print(
+                f"  {rows:>8}  {t['full_scan']:>10.2f}s  {t['cold']:>9.3f}s"
+                f"  {t['warm']:>9.3f}s  {t['full_scan'] / t['warm']:>7.0f}x"
+            )
+
+    print("  * extrapolated from a sample of the batch")
+
+
+if __name__ == "__main__":
+    main()
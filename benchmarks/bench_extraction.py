@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark job card extraction: single in-page evaluate vs per-element queries.
+
+Renders a synthetic results page with N Seek-style job cards and times both
+extraction paths of SeekScraper against it.
+
+Usage:
+    python benchmarks/bench_extraction.py --cards 22 --runs 20
+"""
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from playwright.sync_api import sync_playwright
+
+from src.scraper import SeekScraper
+from src.utils import Config
+
+
+CARD_TEMPLATE = """
+<article data-search-sol-meta="{{}}">
+  <h3><a data-job-id="{i}" data-automation="jobTitle" href="/job/{job_id}?type=standard">HR Advisor {i}</a></h3>
+  <a data-automation="jobCompany">Company {i}</a>
+  <span data-automation="jobLocation">Sydney NSW</span>
+  <span data-automation="jobSalary">$90,000 - $100,000</span>
+  <span data-automation="jobClassification">(Human Resources &amp; Recruitment)</span>
+  <span data-automation="jobListingDate">{i}d ago</span>
+  <span data-automation="jobShortDescription">Full time role supporting our people team.</span>
+</article>
+"""
+
+
+def build_page(num_cards: int) -> str:
+    """Build HTML for a results page with num_cards job cards."""
+    cards = "".join(
+        CARD_TEMPLATE.format(i=i, job_id=80000000 + i) for i in range(num_cards)
+    )
+    return f"<html><body>{cards}</body></html>"
+
+
+def time_runs(func, runs: int) -> list:
+    """Call func runs times and return the elapsed seconds of each call."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Card extraction benchmark")
+    parser.add_argument("--cards", type=int, default=22, help="Job cards per page")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per path")
+    args = parser.parse_args()
+
+    config = Config()
+    logger = logging.getLogger("bench_extraction")
+    scraper = SeekScraper(config, logger)
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=True)
+        try:
+            page = browser.new_page()
+            page.set_content(build_page(args.cards))
+
+            evaluate_jobs = scraper._extract_jobs_by_evaluate(page)
+            element_jobs = scraper._extract_jobs_by_element(page)
+            assert [j.to_dict() | {"scraped_at": None} for j in evaluate_jobs] == \
+                [j.to_dict() | {"scraped_at": None} for j in element_jobs], \
+                "Extraction paths disagree"
+
+            results = {
+                "evaluate": time_runs(lambda: scraper._extract_jobs_by_evaluate(page), args.runs),
+                "elements": time_runs(lambda: scraper._extract_jobs_by_element(page), args.runs),
+            }
+        finally:
+            browser.close()
+
+    print(f"{args.cards} cards/page, {args.runs} runs")
+    for name, timings in results.items():
+        print(
+            f"  {name:<9} median {statistics.median(timings) * 1000:8.2f} ms"
+            f"  min {min(timings) * 1000:8.2f} ms"
+        )
+
+    speedup = statistics.median(results["elements"]) / statistics.median(results["evaluate"])
+    print(f"  speedup  {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
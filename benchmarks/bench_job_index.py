@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark API job lookups with and without the secondary indexes.
+
+Builds N synthetic jobs and times, per request:
+
+- get_job: BaseStorage.get_job's linear scan versus the JobIndex ID map
+- filtered page: a company + location filter over the loaded list,
+  re-sorted by scraped_at (the old list_jobs path), versus
+  JobIndex.query, both first call (cold) and repeated (cached)
+- latest page: sort-and-slice versus the pre-sorted order
+
+Usage:
+    python benchmarks/bench_job_index.py --jobs 10000 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.job_index import JobIndex
+from src.models import Job
+
+COMPANIES = ["Acme Recruitment", "Beta Health", "Gamma & Sons", "Delta People", "Epsilon Group"]
+LOCATIONS = ["Sydney NSW", "Melbourne VIC", "Brisbane QLD", "Perth WA", "Adelaide SA"]
+JOB_TYPES = ["Full time", "Part time", "Contract/Temp", "Casual/Vacation"]
+
+
+def make_jobs(count: int):
+    """Build jobs with varied companies, locations and scrape times."""
+    rng = random.Random(42)
+    return [
+        Job(
+            title=f"HR Advisor {i}",
+            company=f"{rng.choice(COMPANIES)} {i % 500}",
+            location=rng.choice(LOCATIONS),
+            classification="human-resources-recruitment",
+            subcategory="Generalists",
+            job_url=f"https://www.seek.com.au/job/{10_000_000 + i}",
+            job_type=rng.choice(JOB_TYPES),
+            scraped_at=f"2026-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}T12:00:00.{i:06d}",
+        )
+        for i in range(count)
+    ]
+
+
+def timed(fn, repeat: int) -> float:
+    """Average seconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def scan_query(jobs, company: str, location: str, page_size: int):
+    """The old list_jobs path: filter the full list, sort, slice."""
+    matches = [
+        job for job in jobs
+        if company in job.company.lower() and location in job.location.lower()
+    ]
+    matches.sort(key=lambda x: x.scraped_at, reverse=True)
+    return len(matches), matches[:page_size]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Job index benchmark")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[10_000, 100_000], help="Database sizes")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls to average per measurement")
+    parser.add_argument("--page-size", type=int, default=50, help="Jobs per page")
+    args = parser.parse_args()
+
+    print(f"Milliseconds per request (page size {args.page_size})")
+    print(
+        f"  {'jobs':>7}  {'build':>7}  {'get scan':>9}  {'get idx':>8}"
+        f"  {'filter scan':>11}  {'idx cold':>9}  {'idx warm':>9}  {'latest sort':>11}  {'latest idx':>10}"
+    )
+
+    for count in args.jobs:
+        jobs = make_jobs(count)
+        target = jobs[count // 2].job_id
+
+        start = time.perf_counter()
+        index = JobIndex(jobs)
+        build = time.perf_counter() - start
+
+        filters = {"company": "acme", "location": "sydney"}
+        cold = timed(lambda: index.query(filters, limit=args.page_size), 1)
+        assert index.query(filters, limit=args.page_size) == scan_query(jobs, "acme", "sydney", args.page_size)
+
+        t = {
+            "get_scan": timed(lambda: next(job for job in jobs if job.job_id == target), args.repeat),
+            "get_idx": timed(lambda: index.get(target), args.repeat),
+            "filter_scan": timed(lambda: scan_query(jobs, "acme", "sydney", args.page_size), args.repeat),
+            "filter_warm": timed(lambda: index.query(filters, limit=args.page_size), args.repeat),
+            "latest_sort": timed(
+                lambda: sorted(jobs, key=lambda x: x.scraped_at, reverse=True)[:args.page_size], args.repeat
+            ),
+            "latest_idx": timed(lambda: index.query({}, limit=args.page_size), args.repeat),
+        }
+
+        ms = {key: value * 1000 for key, value in t.items()}
+        print(
+            f"  {count:>7}  {build:>6.2f}s  {ms['get_scan']:>9.3f}  {ms['get_idx']:>8.4f}"
+            f"  {ms['filter_scan']:>11.2f}  {cold * 1000:>9.2f}  {ms['filter_warm']:>9.4f}"
+            f"  {ms['latest_sort']:>11.2f}  {ms['latest_idx']:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
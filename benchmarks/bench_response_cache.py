@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark serving /jobs/latest with and without the response cache.
+
+Builds N synthetic jobs and times, per request:
+
+- serialize: building JobResponse models and encoding them to JSON, as
+  every request did before the cache
+- cached: ResponseCache.respond for a repeated request (bytes reused)
+- 304: ResponseCache.respond with a matching If-None-Match
+
+Also reports the body size uncompressed, gzipped and (if installed)
+brotli-compressed.
+
+Usage:
+    python benchmarks/bench_response_cache.py --jobs 1000 5000
+"""
+
+import argparse
+import gzip
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from starlette.requests import Request
+
+from src.api.models import JobResponse
+from src.api.response_cache import ResponseCache, brotli
+from src.models import Job
+
+
+def make_jobs(count: int):
+    """Build jobs with short descriptions."""
+    return [
+        Job(
+            title=f"HR Advisor {i}",
+            company=f"Company {i % 300}",
+            location="Sydney NSW",
+            classification="human-resources-recruitment",
+            subcategory="Generalists",
+            job_url=f"https://www.seek.com.au/job/{10_000_000 + i}",
+            description=f"Payroll, onboarding and employee relations for team {i}. " * 4,
+        )
+        for i in range(count)
+    ]
+
+
+def make_request(headers: dict) -> Request:
+    """Build a GET /api/v1/jobs/latest request."""
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/jobs/latest",
+        "query_string": b"limit=1000",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+    })
+
+
+def timed(fn, repeat: int) -> float:
+    """Average seconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Response cache benchmark")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1000, 5000], help="Jobs per response")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls to average per measurement")
+    args = parser.parse_args()
+
+    print(f"  {'jobs':>6}  {'serialize':>10}  {'cached':>8}  {'304':>8}  {'raw KB':>7}  {'gzip KB':>7}  {'br KB':>6}")
+    for count in args.jobs:
+        jobs = make_jobs(count)
+
+        def build():
+            return [JobResponse(**j.to_dict(), job_id=j.job_id) for j in jobs]
+
+        cache = ResponseCache()
+        accept = "br, gzip" if brotli is not None else "gzip"
+        first = cache.respond(make_request({"Accept-Encoding": accept}), "g1", None, build)
+        etag = first.headers["etag"]
+
+        serialize = timed(lambda: ResponseCache().respond(make_request({}), "g1", None, build), args.repeat)
+        cached = timed(lambda: cache.respond(make_request({"Accept-Encoding": accept}), "g1", None, build), args.repeat)
+        not_modified = timed(lambda: cache.respond(make_request({"If-None-Match": etag}), "g1", None, build), args.repeat)
+
+        raw = cache.respond(make_request({}), "g1", None, build).body
+        br_size = f"{len(brotli.compress(raw, quality=5)) / 1024:>6.0f}" if brotli is not None else f"{'-':>6}"
+        print(
+            f"  {count:>6}  {serialize * 1000:>8.1f}ms  {cached * 1000:>6.2f}ms  {not_modified * 1000:>6.3f}ms"
+            f"  {len(raw) / 1024:>7.0f}  {len(gzip.compress(raw, 6)) / 1024:>7.0f}  {br_size}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark full-text job search against scanning the job list.
+
+Builds N synthetic jobs whose descriptions draw words from a Zipf-like
+vocabulary and times, per query:
+
+- scan: the client-side approach the endpoint replaces, a substring
+  check of every query word over title, company and description
+- search cold: SearchIndex.search right after a sync (postings scored)
+- search warm: the same query again (ranked postings cached)
+
+Also reports the time to build the index and to sync one new batch.
+
+Usage:
+    python benchmarks/bench_search_index.py --jobs 10000 50000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.search_index import SearchIndex
+from src.models import Job
+
+TITLES = ["HR Advisor", "Payroll Officer", "Talent Acquisition Partner", "People Manager", "Recruiter"]
+TERMS = "payroll onboarding recruitment workforce planning employee relations compliance training".split()
+QUERIES = ["payroll officer", "talent acquisition", "employee relations advisor", "onboarding"]
+
+
+def make_jobs(count: int, start: int = 0):
+    """Build jobs with descriptions of 150 words."""
+    rng = random.Random(start)
+    vocab = TERMS + [f"word{i}" for i in range(5000)]
+    weights = [1 / (i + 1) for i in range(len(vocab))]
+    return [
+        Job(
+            title=rng.choice(TITLES),
+            company=f"Company {i % 300}",
+            location="Sydney NSW",
+            classification="human-resources-recruitment",
+            subcategory="Generalists",
+            job_url=f"https://www.seek.com.au/job/{10_000_000 + i}",
+            description=" ".join(rng.choices(vocab, weights, k=150)),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def scan(jobs, query: str):
+    """Return jobs containing any query word, the client-side way."""
+    words = query.lower().split()
+    return [
+        job for job in jobs
+        if any(word in f"{job.title} {job.company} {job.description}".lower() for word in words)
+    ]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Search index benchmark")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[10_000, 50_000], help="Database sizes")
+    parser.add_argument("--batch", type=int, default=100, help="New jobs per sync")
+    args = parser.parse_args()
+
+    for count in args.jobs:
+        jobs = make_jobs(count)
+        jobs_by_id = {job.job_id: job for job in jobs}
+
+        index = SearchIndex()
+        start = time.perf_counter()
+        index.sync(jobs_by_id)
+        build = time.perf_counter() - start
+
+        jobs_by_id.update((job.job_id, job) for job in make_jobs(args.batch, start=count))
+        start = time.perf_counter()
+        index.sync(jobs_by_id)
+        sync = time.perf_counter() - start
+
+        print(f"{count} jobs: build {build:.1f}s, sync of {args.batch} new jobs {sync * 1000:.0f}ms")
+        print(f"  {'query':<28}  {'matches':>7}  {'scan':>8}  {'cold':>8}  {'warm':>8}")
+        for query in QUERIES:
+            start = time.perf_counter()
+            scan(jobs, query)
+            scanned = time.perf_counter() - start
+
+            start = time.perf_counter()
+            total, _ = index.search(query, limit=20)
+            cold = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index.search(query, limit=20)
+            warm = time.perf_counter() - start
+
+            print(
+                f"  {query:<28}  {total:>7}  {scanned * 1000:>6.0f}ms"
+                f"  {cold * 1000:>6.1f}ms  {warm * 1000:>6.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Benchmark seen-job lookups: per-job file parsing vs SeenIndex vs CompactSeenIndex.
+
+Writes a synthetic seen jobs file with N entries and times filtering a batch
+of scraped jobs (half of them seen) through Deduplicator.filter_new_jobs,
+once with a storage that re-reads the file on every ``exists`` call (the old
+behaviour), once with JSONStorage's SeenIndex and once with a
+CompactSeenIndex (with a 1% Bloom filter). Load time is included for both
+indexes, and the on-disk size of each format is reported.
+
+The per-job path re-parses the whole file for every job, so it is only run
+for a sample of the batch on large indexes and extrapolated.
+
+Usage:
+    python benchmarks/bench_seen_index.py --sizes 1000 10000 100000 1000000 --batch 500
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import Job
+from src.storage import JSONStorage, CompactSeenIndex
+from src.utils.deduplicator import Deduplicator
+
+
+class PerJobParseStorage(JSONStorage):
+    """JSONStorage whose lookups re-read the seen jobs file every time."""
+
+    def exists(self, job: Job) -> bool:
+        with open(self.seen_jobs_path, "r", encoding="utf-8") as f:
+            return job.job_id in json.load(f)
+
+    def contains_many(self, jobs):
+        return [self.exists(job) for job in jobs]
+
+
+def make_job(job_id: int) -> Job:
+    """Build a minimal job with the given numeric ID."""
+    return Job(
+        title=f"HR Advisor {job_id}",
+        company="Company",
+        location="Sydney NSW",
+        classification="human-resources-recruitment",
+        subcategory="Generalists",
+        job_url=f"https://www.seek.com.au/job/{job_id}?type=standard#sol=abc",
+    )
+
+
+def write_seen_file(path: Path, size: int) -> None:
+    """Write a seen jobs file with size entries."""
+    timestamp = datetime.now().isoformat()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({str(10_000_000 + i): timestamp for i in range(size)}, f)
+
+
+def run(size: int, batch: int, max_parses: int, tmp_dir: Path) -> dict:
+    """Time both lookup paths for one index size."""
+    seen_path = tmp_dir / f"seen_{size}.json"
+    write_seen_file(seen_path, size)
+
+    # Half the batch is already seen, half is new
+    jobs = [make_job(10_000_000 + i) for i in range(batch // 2)]
+    jobs += [make_job(90_000_000 + i) for i in range(batch - len(jobs))]
+    logging.getLogger("src").setLevel(logging.WARNING)
+
+    indexed = JSONStorage(tmp_dir / "jobs.json", seen_path)
+    start = time.perf_counter()
+    new_indexed = Deduplicator(indexed).filter_new_jobs(jobs)
+    indexed_seconds = time.perf_counter() - start
+
+    compact_path = tmp_dir / f"seen_{size}.idx"
+    CompactSeenIndex(compact_path, legacy_path=seen_path, bloom_fp_rate=0.01)._ensure_loaded()
+    compact = JSONStorage(
+        tmp_dir / "jobs.json", seen_path,
+        seen_index=CompactSeenIndex(compact_path, bloom_fp_rate=0.01)
+    )
+    start = time.perf_counter()
+    new_compact = Deduplicator(compact).filter_new_jobs(jobs)
+    compact_seconds = time.perf_counter() - start
+    assert new_compact == new_indexed, "Compact index disagrees"
+
+    sample = jobs[:max_parses] if max_parses else jobs
+    per_job = PerJobParseStorage(tmp_dir / "jobs.json", seen_path)
+    start = time.perf_counter()
+    new_per_job = Deduplicator(per_job).filter_new_jobs(sample)
+    per_job_seconds = (time.perf_counter() - start) * len(jobs) / len(sample)
+
+    sample_ids = {job.job_id for job in sample}
+    assert new_per_job == [job for job in new_indexed if job.job_id in sample_ids], "Lookup paths disagree"
+    sizes = (seen_path.stat().st_size, compact_path.stat().st_size)
+    seen_path.unlink()
+    compact_path.unlink()
+
+    return {
+        "indexed": indexed_seconds,
+        "compact": compact_seconds,
+        "json_bytes": sizes[0],
+        "compact_bytes": sizes[1],
+        "per_job": per_job_seconds,
+        "extrapolated": len(sample) < len(jobs),
+    }
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Seen index benchmark")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+        help="Seen index sizes to test"
+    )
+    parser.add_argument("--batch", type=int, default=500, help="Scraped jobs per batch")
+    parser.add_argument(
+        "--max-parses", type=int, default=20,
+        help="Per-job lookups to actually run on indexes over 10k entries (0 = all)"
+    )
+    args = parser.parse_args()
+
+    print(f"Batch of {args.batch} jobs, half already seen")
+    print(
+        f"  {'index size':>10}  {'per-job parse':>14}  {'SeenIndex':>10}  {'speedup':>8}"
+        f"  {'Compact':>9}  {'JSON file':>10}  {'idx file':>9}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            max_parses = args.max_parses if size > 10_000 else 0
+            result = run(size, args.batch, max_parses, Path(tmp))
+            marker = "*" if result["extrapolated"] else " "
+            print(
+                f"  {size:>10}  {result['per_job']:>12.3f}s{marker}"
+                f"  {result['indexed']:>9.3f}s"
+                f"  {result['per_job'] / result['indexed']:>7.0f}x"
+                f"  {result['compact']:>8.3f}s"
+                f"  {result['json_bytes'] / 1e6:>8.1f}MB"
+                f"  {result['compact_bytes'] / 1e6:>7.1f}MB"
+            )
+
+    print("  * extrapolated from a sample of the batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Check search API parsing against the recorded Seek search response.
+
+Parses benchmarks/fixtures/seek_search_response.json with
+parse_search_response and compares the Job fields that storage and dedup
+rely on with the values recorded in the fixture. The fixture covers both
+payload shapes: nested (advertiser/locations/classifications) and the
+older flat fields. Exits non-zero on any mismatch.
+
+Usage:
+    python benchmarks/check_search_api.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models import Job
+from src.scraper.search_api import parse_search_response
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "seek_search_response.json"
+BASE_URL = "https://www.seek.com.au"
+CLASSIFICATION = "Human Resources & Recruitment"
+
+# Fields of each fixture entry, in result order
+EXPECTED = [
+    {
+        "job_id": "88560261",
+        "title": "People & Culture Business Officer",
+        "company": "Van Schaik's Bio Gro",
+        "location": "Dandenong South VIC",
+        "salary": "$75,000 – $85,000 per year",
+        "job_url": "https://www.seek.com.au/job/88560261",
+    },
+    {
+        "job_id": "88585680",
+        "title": "Talent Acquisition Partner",
+        "company": "Fisher & Paykel Appliances",
+        "location": "Macquarie Park, Sydney NSW",
+        # Empty salaryLabel means no salary
+        "salary": None,
+        "job_url": "https://www.seek.com.au/job/88585680",
+    },
+    {
+        "job_id": "88191362",
+        "title": "HR Coordinator",
+        "company": "Northern Health",
+        "location": "Epping",
+        "salary": "$90k + super",
+        "job_url": "https://www.seek.com.au/job/88191362",
+    },
+]
+
+
+def main():
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        recorded = json.load(f)
+
+    jobs = parse_search_response(recorded, BASE_URL, CLASSIFICATION)
+
+    errors = []
+    if len(jobs) != len(EXPECTED):
+        errors.append(f"parsed {len(jobs)} jobs, expected {len(EXPECTED)}")
+
+    for i, (job, expected) in enumerate(zip(jobs, EXPECTED)):
+        for field, value in expected.items():
+            actual = getattr(job, field)
+            if actual != value:
+                errors.append(f"job {i} {field}: {actual!r} != {value!r}")
+        if job.job_url != Job.canonical_url(job.job_url):
+            errors.append(f"job {i} job_url is not canonical: {job.job_url!r}")
+        if job.job_id != recorded["data"][i]["id"]:
+            errors.append(f"job {i} job_id does not match the fixture ID {recorded['data'][i]['id']!r}")
+
+    if errors:
+        print(f"{FIXTURE.name}: {len(errors)} mismatch(es)")
+        for error in errors:
+            print(f"  {error}")
+        sys.exit(1)
+
+    print(f"{FIXTURE.name}: {len(jobs)} jobs parsed as expected")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from src.utils import Config, setup_logger
 from src.scraper import SeekScraper
-from src.storage import JSONStorage, CSVStorage
+from src.storage import JSONStorage, JSONLStorage, CSVStorage, storage_from_config
 from src.utils.deduplicator import Deduplicator
 from src.models import Job
 
@@ -29,7 +29,7 @@ def main():
         "--output-format",
         choices=["json", "csv", "both"],
         default="json",
-        help="Output format (default: json)"
+        help="Output format: json saves to the job database (storage.backend) (default: json)"
     )
     parser.add_argument(
         "--headless",
@@ -37,6 +37,21 @@ def main():
         default=None,
         help="Run browser in headless mode (true/false)"
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted scrape from its last completed page"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Compact the JSONL job log (storage.backend: jsonl) and exit"
+    )
+    parser.add_argument(
+        "--migrate-seen-jobs",
+        action="store_true",
+        help="Re-key the seen jobs file by canonical job ID and exit"
+    )
 
     args = parser.parse_args()
 
@@ -65,30 +80,46 @@ def main():
     logger.info("=" * 60)
 
     try:
+        # Initialize storage (storage.backend selects json, jsonl, partitioned, sqlite or csv)
+        storage = storage_from_config(config, logger)
+
+        if args.compact:
+            if not isinstance(storage, JSONLStorage):
+                logger.info("Compaction only applies to the jsonl storage backend")
+                return
+            storage.compact()
+            return
+
+        if args.migrate_seen_jobs:
+            if not isinstance(storage, JSONStorage):
+                logger.info("Seen jobs are already keyed by job ID in this backend")
+                return
+            removed = storage.migrate_seen_jobs()
+            logger.info(f"Removed {removed} duplicate seen-job entries")
+            return
+
+        # Seen jobs let the scraper stop once it reaches known listings
+        is_seen = None
+        if not args.no_dedup:
+            is_seen = storage.exists
+
         # Initialize scraper
-        scraper = SeekScraper(config, logger)
+        scraper = SeekScraper(config, logger, is_seen=is_seen)
 
         # Scrape jobs
         logger.info("Starting scraping process...")
-        jobs = scraper.scrape()
+        jobs = scraper.scrape(resume=args.resume)
 
         if not jobs:
             logger.warning("No jobs found")
             return
 
-        # Initialize storage
-        json_storage = JSONStorage(
-            output_path=config.get_output_path("json"),
-            seen_jobs_path=config.get_seen_jobs_path(),
-            retention_days=config.get("deduplication.retention_days", 30)
-        )
-
         # Deduplication
         if not args.no_dedup:
             logger.info("Running deduplication...")
             deduplicator = Deduplicator(
-                storage=json_storage,
-                key_field=config.get("deduplication.key_field", "job_url")
+                storage=storage,
+                key_field=config.get("deduplication.key_field", "job_id")
             )
 
             # Remove duplicates within batch
@@ -106,8 +137,8 @@ def main():
 
         # Save to storage
         if args.output_format in ["json", "both"]:
-            logger.info("Saving to JSON...")
-            json_storage.save(jobs)
+            logger.info(f"Saving to {config.get('storage.backend', 'json')} database...")
+            storage.save(jobs)
 
         if args.output_format in ["csv", "both"]:
             logger.info("Saving to CSV...")
@@ -116,7 +147,7 @@ def main():
 
         # Cleanup old jobs (older than retention_days)
         logger.info("Cleaning up old jobs...")
-        removed_count = json_storage.cleanup_old_jobs()
+        removed_count = storage.cleanup_old_jobs()
         if removed_count > 0:
             logger.info(f"Removed {removed_count} jobs older than {config.get('deduplication.retention_days', 30)} days")
 
@@ -138,7 +169,7 @@ def main():
             logger.info(f"  URL: {sample.job_url}")
 
     except KeyboardInterrupt:
-        logger.info("Scraping interrupted by user")
+        logger.info("Scraping interrupted by user (run with --resume to continue from the last completed page)")
         sys.exit(0)
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
@@ -1,29 +1,121 @@
 """FastAPI application for Seek Job Scraper."""
 
 import asyncio
+from contextlib import asynccontextmanager
 from typing import Optional, List
 from datetime import datetime
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, status
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from .models import (
     ScrapeRequest, ScrapeResponse, ScrapeStatusResponse,
-    JobResponse, JobsListResponse, WebhookRegistration,
+    JobResponse, JobsListResponse, JobSearchResult, JobSearchResponse, WebhookRegistration,
     WebhookResponse, HealthResponse, ErrorResponse, JobStatus
 )
+from .job_index import decode_cursor, encode_cursor, sort_key
 from .job_manager import job_manager
-from ..storage import JSONStorage
+from .job_repository import job_repository
+from .response_cache import response_cache
+from ..models import Job
 from ..utils import Config
 
 
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated ``fields`` parameter into JobResponse fields.
+
+    Args:
+        fields: e.g. "title,company,job_url", or None for every field
+
+    Returns:
+        Field names (job_id always included), or None for every field
+
+    Raises:
+        HTTPException: 400 if a field is unknown
+    """
+    if not fields:
+        return None
+
+    selected = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in JobResponse.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. "
+                   f"Valid fields: {', '.join(JobResponse.model_fields)}"
+        )
+    if "job_id" not in selected:
+        selected.append("job_id")
+    return selected
+
+
+def parse_since(since: Optional[str]) -> Optional[str]:
+    """Normalize a ``since`` parameter to an ISO timestamp.
+
+    Job.scraped_at is naive local time, and timestamps are compared as
+    strings, so a value with a UTC offset (or "Z") is converted to local
+    time and its offset dropped.
+
+    Args:
+        since: ISO date or datetime, e.g. "2025-10-14", "2025-10-14T10:30:00"
+            or "2025-10-14T00:30:00Z"
+
+    Returns:
+        ISO timestamp comparable with Job.scraped_at, or None
+
+    Raises:
+        HTTPException: 400 if it is not an ISO date or datetime
+    """
+    if not since:
+        return None
+    try:
+        parsed = datetime.fromisoformat(since[:-1] + "+00:00" if since.endswith(("Z", "z")) else since)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid since timestamp: {since}")
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+def job_payload(job: Job, fields: Optional[List[str]] = None) -> dict:
+    """Serialize a job for a response, keeping only the selected fields."""
+    data = job.to_dict()
+    data["job_id"] = job.job_id
+    if fields is None:
+        return data
+    return {name: data[name] for name in fields}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop process-wide resources."""
+    loop = asyncio.get_event_loop()
+    config = Config()
+
+    # Load the job database once; read endpoints are served from memory
+    await loop.run_in_executor(None, job_repository.open, config)
+
+    if config.get("browser_pool.mode", "threads") == "async":
+        await job_manager.start_async_browser(config)
+    else:
+        await loop.run_in_executor(None, job_manager.start_browser_pool, config)
+
+    try:
+        yield
+    finally:
+        await job_manager.close_async_browser()
+        await loop.run_in_executor(None, job_manager.close_browser_pool)
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
 
     app = FastAPI(
+        lifespan=lifespan,
         title="Seek Job Scraper API",
         description="""
         # Seek Job Scraper REST API
@@ -259,51 +351,90 @@ def create_app() -> FastAPI:
         description="Retrieve all scraped jobs with pagination"
     )
     async def list_jobs(
-        page: int = Query(1, ge=1, description="Page number"),
+        request: Request,
+        page: int = Query(1, ge=1, description="Page number (ignored when cursor or since is given)"),
         page_size: int = Query(50, ge=1, le=200, description="Items per page"),
         company: Optional[str] = Query(None, description="Filter by company name"),
-        location: Optional[str] = Query(None, description="Filter by location")
+        location: Optional[str] = Query(None, description="Filter by location"),
+        job_type: Optional[str] = Query(None, description="Filter by job type (e.g. Full time)"),
+        subcategory: Optional[str] = Query(None, description="Filter by subcategory"),
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+        since: Optional[str] = Query(None, description="Only jobs scraped at or after this ISO date/time"),
+        fields: Optional[str] = Query(
+            None, description="Comma-separated fields to return (e.g. title,company,job_url); job_id is always included"
+        )
     ):
-        """List all scraped jobs from storage."""
-        try:
-            config = Config()
-            storage = JSONStorage(
-                output_path=config.get_output_path("json"),
-                seen_jobs_path=config.get_seen_jobs_path()
-            )
-
-            # Load all jobs
-            jobs = storage.load()
-
-            # Apply filters
-            if company:
-                jobs = [j for j in jobs if company.lower() in j.company.lower()]
-            if location:
-                jobs = [j for j in jobs if location.lower() in j.location.lower()]
-
-            # Sort by scraped_at descending
-            jobs.sort(key=lambda x: x.scraped_at, reverse=True)
-
-            # Pagination
-            total = len(jobs)
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            page_jobs = jobs[start_idx:end_idx]
-
-            # Convert to response models
-            job_responses = [
-                JobResponse(
-                    **j.to_dict(),
-                    job_id=j.job_id
-                ) for j in page_jobs
-            ]
+        """List all scraped jobs from storage.
 
-            return JobsListResponse(
-                total=total,
-                page=page,
-                page_size=page_size,
-                jobs=job_responses
-            )
+        Jobs come newest first. Follow next_cursor for stable keyset
+        pagination; pollers can pass since= with the time of their last
+        sync and fields= to fetch only new rows with a small payload.
+        Responses carry an ETag; send it back in If-None-Match to get a
+        304 while nothing changed.
+        """
+        try:
+            state = job_repository.state()
+
+            def build():
+                selected = parse_fields(fields)
+                filters = dict(company=company, location=location, job_type=job_type, subcategory=subcategory)
+
+                if cursor or since:
+                    try:
+                        after = decode_cursor(cursor) if cursor else None
+                    except ValueError as e:
+                        raise HTTPException(status_code=400, detail=str(e))
+                    total, page_jobs, next_key = job_repository.page_jobs(
+                        limit=page_size,
+                        after=after,
+                        since=parse_since(since),
+                        state=state,
+                        **filters
+                    )
+                else:
+                    # Filter, sort by scraped_at descending and paginate
+                    offset = (page - 1) * page_size
+                    total, page_jobs = job_repository.query_jobs(
+                        limit=page_size, offset=offset, state=state, **filters
+                    )
+                    more = offset + len(page_jobs) < total
+                    next_key = sort_key(page_jobs[-1]) if page_jobs and more else None
+
+                next_cursor = encode_cursor(next_key) if next_key else None
+
+                if selected is not None:
+                    return {
+                        "total": total,
+                        "page": page,
+                        "page_size": page_size,
+                        "jobs": [job_payload(j, selected) for j in page_jobs],
+                        "next_cursor": next_cursor,
+                    }
+
+                # Convert to response models
+                job_responses = [
+                    JobResponse(
+                        **j.to_dict(),
+                        job_id=j.job_id
+                    ) for j in page_jobs
+                ]
+
+                return JobsListResponse(
+                    total=total,
+                    page=page,
+                    page_size=page_size,
+                    jobs=job_responses,
+                    next_cursor=next_cursor
+                )
+
+            if since:
+                # A since-bounded page may read partitions from disk
+                return await asyncio.get_event_loop().run_in_executor(
+                    None, response_cache.respond, request, state.generation, state.last_modified, build
+                )
+            return response_cache.respond(request, state.generation, state.last_modified, build)
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=500,
@@ -318,31 +449,84 @@ def create_app() -> FastAPI:
         description="Retrieve the most recently scraped jobs"
     )
     async def get_latest_jobs(
-        limit: int = Query(1000, ge=1, le=5000, description="Number of jobs to return")
+        request: Request,
+        limit: int = Query(1000, ge=1, le=5000, description="Number of jobs to return"),
+        since: Optional[str] = Query(None, description="Only jobs scraped at or after this ISO date/time"),
+        fields: Optional[str] = Query(
+            None, description="Comma-separated fields to return (e.g. title,company,job_url); job_id is always included"
+        )
     ):
         """Get the latest scraped jobs."""
         try:
-            config = Config()
-            storage = JSONStorage(
-                output_path=config.get_output_path("json"),
-                seen_jobs_path=config.get_seen_jobs_path()
+            state = job_repository.state()
+
+            def build():
+                selected = parse_fields(fields)
+                _, latest_jobs, _ = job_repository.page_jobs(limit=limit, since=parse_since(since), state=state)
+
+                if selected is not None:
+                    return [job_payload(j, selected) for j in latest_jobs]
+
+                return [
+                    JobResponse(
+                        **j.to_dict(),
+                        job_id=j.job_id
+                    ) for j in latest_jobs
+                ]
+
+            if since:
+                # A since-bounded page may read partitions from disk
+                return await asyncio.get_event_loop().run_in_executor(
+                    None, response_cache.respond, request, state.generation, state.last_modified, build
+                )
+            return response_cache.respond(request, state.generation, state.last_modified, build)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to retrieve latest jobs: {str(e)}"
             )
 
-            jobs = storage.load()
-            jobs.sort(key=lambda x: x.scraped_at, reverse=True)
-
-            latest_jobs = jobs[:limit]
-
-            return [
-                JobResponse(
-                    **j.to_dict(),
-                    job_id=j.job_id
-                ) for j in latest_jobs
-            ]
+    @app.get(
+        "/api/v1/jobs/search",
+        response_model=JobSearchResponse,
+        tags=["Jobs"],
+        summary="Search jobs",
+        description="Full-text search over job title, company and description, ranked by relevance (BM25)"
+    )
+    async def search_jobs(
+        request: Request,
+        q: str = Query(..., min_length=1, description="Search words (a job matches any of them)"),
+        limit: int = Query(20, ge=1, le=200, description="Number of results to return"),
+        offset: int = Query(0, ge=0, le=10000, description="Number of top results to skip")
+    ):
+        """Search jobs by relevance."""
+        try:
+            state = job_repository.state()
+
+            def build():
+                total, results = job_repository.search(q, limit=limit, offset=offset, state=state)
+
+                return JobSearchResponse(
+                    query=q,
+                    total=total,
+                    limit=limit,
+                    offset=offset,
+                    jobs=[
+                        JobSearchResult(
+                            **job.to_dict(),
+                            job_id=job.job_id,
+                            score=round(score, 4)
+                        ) for job, score in results
+                    ]
+                )
+
+            return response_cache.respond(request, state.generation, state.last_modified, build)
         except Exception as e:
             raise HTTPException(
                 status_code=500,
-                detail=f"Failed to retrieve latest jobs: {str(e)}"
+                detail=f"Failed to search jobs: {str(e)}"
             )
 
     @app.get(
@@ -352,28 +536,25 @@ def create_app() -> FastAPI:
         summary="Get job by ID",
         description="Retrieve a specific job by its ID"
     )
-    async def get_job(job_id: str):
+    async def get_job(request: Request, job_id: str):
         """Get a specific job by ID."""
         try:
-            config = Config()
-            storage = JSONStorage(
-                output_path=config.get_output_path("json"),
-                seen_jobs_path=config.get_seen_jobs_path()
-            )
+            state = job_repository.state()
 
-            jobs = storage.load()
-
-            for job in jobs:
-                if job.job_id == job_id:
+            def build():
+                job = job_repository.get_job(job_id, state=state)
+                if job is not None:
                     return JobResponse(
                         **job.to_dict(),
                         job_id=job.job_id
                     )
 
-            raise HTTPException(
-                status_code=404,
-                detail=f"Job {job_id} not found"
-            )
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Job {job_id} not found"
+                )
+
+            return response_cache.respond(request, state.generation, state.last_modified, build)
         except HTTPException:
             raise
         except Exception as e:
@@ -0,0 +1,286 @@
+"""Secondary indexes over an in-memory job snapshot."""
+
+import base64
+import binascii
+import json
+import re
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..models import Job
+
+
+# Job fields with an inverted token index
+INDEXED_FIELDS = ("company", "location", "job_type", "subcategory")
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# Filter results kept per snapshot, so repeated dashboard queries only slice
+MAX_CACHED_QUERIES = 256
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def sort_key(job: Job) -> Tuple[str, str]:
+    """Total order of jobs for listing and cursors: scrape time, then ID."""
+    return job.scraped_at, job.job_id
+
+
+def encode_cursor(key: Tuple[str, str]) -> str:
+    """Encode a sort key as an opaque, URL-safe cursor."""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor made by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not (isinstance(key, list) and len(key) == 2 and all(isinstance(part, str) for part in key)):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return key[0], key[1]
+
+
+class JobIndex:
+    """Immutable snapshot of the job database with secondary indexes.
+
+    Holds jobs ordered newest first by (scraped_at, job_id), a total
+    order that keyset cursors resume from, and indexes them by position
+    in that order:
+
+    - ``jobs_by_id``: canonical job ID -> Job
+    - ``sort_keys``: ascending (scraped_at, job_id) keys, for ``since``
+      bounds and cursors
+    - one inverted index per INDEXED_FIELDS entry: token -> ascending
+      positions of the jobs whose field contains it
+
+    Filters keep the API's case-insensitive substring semantics. Each
+    filter token is looked up against the field's token vocabulary
+    (which is small compared with the jobs), the position lists of the
+    matching tokens are merged, and only those candidates are checked
+    against the full substring. Positions are ranks in newest-first
+    order, so sorting them restores recency without comparing
+    timestamps. Results are cached per filter, so a repeated query costs
+    only the size of the page; the cache is locked, as pages may be built
+    on worker threads.
+    """
+
+    def __init__(self, jobs: Iterable[Job]):
+        """Index jobs.
+
+        Args:
+            jobs: Stored jobs; a later record of the same ID wins
+        """
+        self.jobs_by_id: Dict[str, Job] = {job.job_id: job for job in jobs}
+        self.newest_first: List[Job] = sorted(
+            self.jobs_by_id.values(), key=sort_key, reverse=True
+        )
+        self.sort_keys: List[Tuple[str, str]] = [sort_key(job) for job in reversed(self.newest_first)]
+
+        self.tokens: Dict[str, Dict[str, List[int]]] = {field: {} for field in INDEXED_FIELDS}
+        for pos, job in enumerate(self.newest_first):
+            for field in INDEXED_FIELDS:
+                postings = self.tokens[field]
+                for token in set(tokenize(getattr(job, field))):
+                    postings.setdefault(token, []).append(pos)
+
+        self._results: "OrderedDict[tuple, List[int]]" = OrderedDict()
+        self._results_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.newest_first)
+
+    def updated(self, jobs: List[Job]) -> "JobIndex":
+        """Return a snapshot with jobs added or superseded; this one is unchanged.
+
+        New jobs that sort after every indexed job (the records a scrape
+        appends) only need their own tokens indexed: they take the first
+        positions and the existing postings are shifted behind them.
+        Anything else re-indexes the merged jobs.
+
+        Args:
+            jobs: Jobs in write order; a later record of the same ID wins
+
+        Returns:
+            JobIndex
+        """
+        if not jobs:
+            return self
+
+        added = JobIndex(jobs)
+        newest = self.sort_keys[-1] if self.sort_keys else None
+        if any(job_id in self.jobs_by_id for job_id in added.jobs_by_id) or (
+            newest is not None and added.sort_keys[0] <= newest
+        ):
+            return JobIndex([*self.jobs_by_id.values(), *added.jobs_by_id.values()])
+
+        shift = len(added)
+        added.jobs_by_id = {**self.jobs_by_id, **added.jobs_by_id}
+        added.newest_first = added.newest_first + self.newest_first
+        added.sort_keys = self.sort_keys + added.sort_keys
+        for field in INDEXED_FIELDS:
+            postings = added.tokens[field]
+            for token, positions in self.tokens[field].items():
+                postings[token] = postings.get(token, []) + [pos + shift for pos in positions]
+        return added
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by its canonical ID."""
+        return self.jobs_by_id.get(job_id)
+
+    def count_since(self, since: str) -> int:
+        """Number of jobs scraped at or after an ISO timestamp.
+
+        Those are the first ``count_since(since)`` jobs of ``newest_first``.
+        """
+        return len(self.sort_keys) - bisect_left(self.sort_keys, (since,))
+
+    def rank_after(self, key: Tuple[str, str]) -> int:
+        """Position in ``newest_first`` of the first job older than a sort key."""
+        return len(self.sort_keys) - bisect_left(self.sort_keys, key)
+
+    def query(
+        self,
+        filters: Dict[str, Optional[str]],
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> Tuple[int, List[Job]]:
+        """Filter by field substrings and return one page, newest first.
+
+        Args:
+            filters: INDEXED_FIELDS name -> case-insensitive substring;
+                empty values are ignored
+            limit: Maximum number of jobs to return (None = all)
+            offset: Number of matching jobs to skip
+
+        Returns:
+            Tuple of (total matching jobs, jobs in the requested page)
+        """
+        end = None if limit is None else offset + limit
+        positions = self._positions(filters)
+        if positions is None:
+            return len(self.newest_first), self.newest_first[offset:end]
+
+        jobs = self.newest_first
+        return len(positions), [jobs[pos] for pos in positions[offset:end]]
+
+    def page(
+        self,
+        filters: Dict[str, Optional[str]],
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        since: Optional[str] = None
+    ) -> Tuple[int, List[Job], Optional[Tuple[str, str]]]:
+        """Return the page of matches following a cursor (keyset pagination).
+
+        Both bounds are found by bisection, so a page costs its own size
+        however deep into the results it is, and jobs saved between
+        requests do not shift later pages.
+
+        Args:
+            filters: INDEXED_FIELDS name -> case-insensitive substring
+            limit: Maximum number of jobs to return
+            after: Sort key of the last job of the previous page, or None
+                to start from the newest job
+            since: ISO timestamp; only jobs scraped at or after it
+
+        Returns:
+            Tuple of (total matching jobs within ``since``, jobs in the
+            page, sort key to pass as ``after`` for the next page or None
+            on the last page)
+        """
+        start = 0 if after is None else self.rank_after(after)
+        end = len(self.newest_first) if since is None else self.count_since(since)
+
+        positions = self._positions(filters)
+        if positions is None:
+            total = end
+            ranks = range(start, min(start + limit, end))
+            has_more = start + limit < end
+        else:
+            first, last = bisect_left(positions, start), bisect_left(positions, end)
+            total = last
+            ranks = positions[first:min(first + limit, last)]
+            has_more = first + limit < last
+
+        jobs = [self.newest_first[pos] for pos in ranks]
+        next_key = sort_key(jobs[-1]) if jobs and has_more else None
+        return total, jobs, next_key
+
+    def _positions(self, filters: Dict[str, Optional[str]]) -> Optional[List[int]]:
+        """Sorted positions of the jobs matching the filters, cached.
+
+        Returns:
+            List of positions, or None if no filter is set (every job)
+        """
+        key = tuple(sorted((field, value.lower()) for field, value in filters.items() if value))
+        if not key:
+            return None
+
+        with self._results_lock:
+            positions = self._results.get(key)
+            if positions is not None:
+                self._results.move_to_end(key)
+                return positions
+
+        positions = self._match(key)
+        with self._results_lock:
+            self._results[key] = positions
+            if len(self._results) > MAX_CACHED_QUERIES:
+                self._results.popitem(last=False)
+        return positions
+
+    def _match(self, key: Tuple[Tuple[str, str], ...]) -> List[int]:
+        """Positions of the jobs matching every (field, lowercase substring)."""
+        candidates: Optional[set] = None
+        for field, value in key:
+            field_candidates = self._candidates(field, value)
+            if field_candidates is None:
+                continue
+            candidates = field_candidates if candidates is None else candidates & field_candidates
+            if not candidates:
+                return []
+
+        positions = range(len(self.newest_first)) if candidates is None else sorted(candidates)
+        jobs = self.newest_first
+        return [
+            pos for pos in positions
+            if all(value in (getattr(jobs[pos], field) or "").lower() for field, value in key)
+        ]
+
+    def _candidates(self, field: str, value: str) -> Optional[set]:
+        """Superset of the positions whose field contains ``value``.
+
+        If ``value`` is a substring of a field, each of its tokens is a
+        substring of some token of that field, so unioning the postings of
+        every vocabulary token containing it loses no match.
+
+        Returns:
+            Set of positions, or None if ``value`` has no tokens to look
+            up (every job is a candidate)
+        """
+        query_tokens = tokenize(value)
+        if not query_tokens:
+            return None
+
+        postings = self.tokens[field]
+        candidates: Optional[set] = None
+        for query_token in set(query_tokens):
+            matched = set()
+            for token, token_positions in postings.items():
+                if query_token in token:
+                    matched.update(token_positions)
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                break
+        return candidates
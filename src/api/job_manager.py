@@ -9,9 +9,10 @@ import threading
 import requests
 
 from .models import JobStatus, ScrapeRequest
+from .job_repository import job_repository
 from ..utils import Config, setup_logger
-from ..scraper import SeekScraper
-from ..storage import JSONStorage
+from ..scraper import SeekScraper, AsyncSeekScraper, BrowserPool
+from ..storage import storage_from_config
 from ..utils.deduplicator import Deduplicator
 from ..models import Job
 
@@ -39,6 +40,69 @@ class JobManager:
         self.jobs: Dict[str, ScrapeJob] = {}
         self.lock = threading.Lock()
         self.webhooks: Dict[str, dict] = {}
+        self.browser_pool: Optional[BrowserPool] = None
+        self.scraper_mode = "threads"
+        self.async_playwright = None
+        self.async_browser = None
+
+    def start_browser_pool(self, config: Config):
+        """Launch the shared browser pool (called once at server boot).
+
+        If the browsers cannot be launched, scrapes fall back to launching
+        their own browser.
+        """
+        if not config.get("browser_pool.enabled", True):
+            return
+
+        pool = BrowserPool(
+            size=config.get("browser_pool.size", 2),
+            max_uses=config.get("browser_pool.max_uses", 50),
+            browser_type=config.get("scraper.browser_type", "chromium"),
+            headless=config.get("scraper.headless", True),
+            acquire_timeout=config.get("browser_pool.acquire_timeout")
+        )
+        try:
+            pool.start()
+        except Exception as e:
+            print(f"Failed to start browser pool, scrapes will launch their own browser: {e}")
+            pool.close()
+            return
+
+        self.browser_pool = pool
+
+    async def start_async_browser(self, config: Config):
+        """Launch one async browser shared by all scrapes on the event loop.
+
+        Used when browser_pool.mode is "async". If the browser cannot be
+        launched, each scrape launches its own.
+        """
+        self.scraper_mode = "async"
+
+        from playwright.async_api import async_playwright
+
+        try:
+            self.async_playwright = await async_playwright().start()
+            browser_type = config.get("scraper.browser_type", "chromium")
+            launcher = getattr(self.async_playwright, browser_type, self.async_playwright.chromium)
+            self.async_browser = await launcher.launch(headless=config.get("scraper.headless", True))
+        except Exception as e:
+            print(f"Failed to start async browser, scrapes will launch their own browser: {e}")
+            await self.close_async_browser()
+
+    async def close_async_browser(self):
+        """Close the shared async browser and its driver."""
+        if self.async_browser is not None:
+            await self.async_browser.close()
+            self.async_browser = None
+        if self.async_playwright is not None:
+            await self.async_playwright.stop()
+            self.async_playwright = None
+
+    def close_browser_pool(self):
+        """Close the shared browser pool (called at server shutdown)."""
+        if self.browser_pool is not None:
+            self.browser_pool.close()
+            self.browser_pool = None
 
     def create_job(self, request: ScrapeRequest) -> str:
         """Create a new scraping job and return its ID."""
@@ -162,14 +226,30 @@ class JobManager:
                 console=False
             )
 
-            # Run scraper in thread pool (Playwright is sync)
+            # Storage and dedup do blocking file/database I/O (and may wait
+            # on a file lock), so they run in the thread pool, never on the loop
             loop = asyncio.get_event_loop()
-            jobs = await loop.run_in_executor(
-                None,
-                self._run_scraper_sync,
-                config,
-                logger
-            )
+
+            # Initialize storage (storage.backend selects json, jsonl, partitioned, sqlite or csv)
+            storage = await loop.run_in_executor(None, storage_from_config, config, logger)
+
+            # Seen jobs let the scraper stop once it reaches known listings
+            is_seen = storage.exists
+
+            if self.scraper_mode == "async":
+                # Run natively on the event loop over the shared driver
+                scraper = AsyncSeekScraper(config, logger, browser=self.async_browser, is_seen=is_seen)
+                jobs = await scraper.scrape(resume=job.request.resume)
+            else:
+                # Run scraper in thread pool (Playwright is sync)
+                jobs = await loop.run_in_executor(
+                    None,
+                    self._run_scraper_sync,
+                    config,
+                    logger,
+                    is_seen,
+                    job.request.resume
+                )
 
             if not jobs:
                 self.update_job_status(
@@ -181,26 +261,8 @@ class JobManager:
                 )
                 return
 
-            # Initialize storage
-            json_storage = JSONStorage(
-                output_path=config.get_output_path("json"),
-                seen_jobs_path=config.get_seen_jobs_path(),
-                retention_days=config.get("deduplication.retention_days", 30)
-            )
-
-            # Deduplication
-            deduplicator = Deduplicator(
-                storage=json_storage,
-                key_field=config.get("deduplication.key_field", "job_url")
-            )
-
             jobs_found = len(jobs)
-            jobs = deduplicator.remove_within_batch_duplicates(jobs)
-            new_jobs = deduplicator.filter_new_jobs(jobs)
-
-            # Save to storage
-            if new_jobs:
-                json_storage.save(new_jobs)
+            new_jobs = await loop.run_in_executor(None, self._save_new_jobs, config, storage, jobs)
 
             # Update job status
             self.update_job_status(
@@ -221,12 +283,15 @@ class JobManager:
             # Call job-specific webhook if provided
             if job.request.webhook_url:
                 try:
-                    requests.post(str(job.request.webhook_url), json=webhook_data, timeout=10)
+                    await loop.run_in_executor(
+                        None,
+                        lambda: requests.post(str(job.request.webhook_url), json=webhook_data, timeout=10)
+                    )
                 except Exception as e:
                     logger.error(f"Failed to call job webhook: {e}")
 
             # Call registered webhooks
-            self.trigger_webhooks("scrape.completed", job_id, webhook_data)
+            await loop.run_in_executor(None, self.trigger_webhooks, "scrape.completed", job_id, webhook_data)
 
         except Exception as e:
             error_msg = str(e)
@@ -237,12 +302,39 @@ class JobManager:
             )
 
             # Trigger failure webhooks
-            self.trigger_webhooks("scrape.failed", job_id, {"error": error_msg})
+            await asyncio.get_event_loop().run_in_executor(
+                None, self.trigger_webhooks, "scrape.failed", job_id, {"error": error_msg}
+            )
+
+    def _save_new_jobs(self, config: Config, storage, jobs: List[Job]) -> List[Job]:
+        """Deduplicate scraped jobs and save the new ones (for thread pool execution).
+
+        Args:
+            config: Configuration object
+            storage: Storage backend to check and save to
+            jobs: Scraped jobs
+
+        Returns:
+            Jobs that were not seen before
+        """
+        deduplicator = Deduplicator(
+            storage=storage,
+            key_field=config.get("deduplication.key_field", "job_id")
+        )
+
+        jobs = deduplicator.remove_within_batch_duplicates(jobs)
+        new_jobs = deduplicator.filter_new_jobs(jobs)
+
+        # Save to storage
+        if new_jobs:
+            storage.save(new_jobs)
+            job_repository.notify(storage, new_jobs)
+        return new_jobs
 
-    def _run_scraper_sync(self, config: Config, logger) -> List[Job]:
+    def _run_scraper_sync(self, config: Config, logger, is_seen=None, resume: bool = False) -> List[Job]:
         """Run scraper synchronously (for thread pool execution)."""
-        scraper = SeekScraper(config, logger)
-        return scraper.scrape()
+        scraper = SeekScraper(config, logger, browser_pool=self.browser_pool, is_seen=is_seen)
+        return scraper.scrape(resume=resume)
 
 
 # Global job manager instance
@@ -0,0 +1,311 @@
+"""In-memory job repository serving the read endpoints."""
+
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from ..models import Job
+from .job_index import JobIndex, sort_key
+from .search_index import SearchIndex
+from ..storage import BaseStorage, PartitionedStorage, storage_from_config
+from ..utils import Config
+
+
+class RepositoryState(NamedTuple):
+    """One loaded version of the job database, swapped in as a whole."""
+
+    snapshot: JobIndex
+    # Data files' stamp when loaded (None after a failed first load)
+    stamp: Optional[tuple]
+    # storage.tail_position marker the next reload reads appended records from
+    position: Any
+    generation: str
+    last_modified: Optional[datetime]
+
+
+class JobRepository:
+    """Process-wide cache of the job database for the API.
+
+    The database is loaded once, then requests are answered from an
+    in-memory snapshot with secondary indexes (JobIndex). At most once
+    per ``check_interval`` a request stats the storage's data files; if
+    they changed (a cron scrape or cleanup wrote them), a background
+    thread brings the snapshot up to date and swaps it in while requests
+    keep using the current one. On append-only backends only the records
+    appended since the last load are read and applied
+    (``BaseStorage.read_tail``); otherwise, or after a compaction or
+    cleanup, the database is loaded whole. Scrapes run by the API trigger
+    the reload right away through ``notify``. A full-text SearchIndex is
+    kept alongside and synced on each reload, re-tokenizing only jobs
+    that changed.
+
+    The snapshot, the stamp it was loaded at, its ``generation`` (a
+    digest of the stamp) and ``last_modified`` time form one immutable
+    RepositoryState, replaced with a single assignment. Endpoints take the
+    state once and pass it to every query, so the ETag and Last-Modified
+    validators the response layer derives from it always describe the
+    jobs in the body.
+    """
+
+    def __init__(self):
+        self.config: Optional[Config] = None
+        self.storage: Optional[BaseStorage] = None
+        self.check_interval = 1.0
+        self.logger = logging.getLogger(__name__)
+        self._state: Optional[RepositoryState] = None
+        self.search_index = SearchIndex()
+        self._next_check = 0.0
+        self._reloading = False
+        self._lock = threading.Lock()
+
+    def open(self, config: Optional[Config] = None) -> None:
+        """Select the job database and load it (called once at server boot).
+
+        Args:
+            config: Configuration object (defaults to config/config.yaml)
+        """
+        config = config or Config()
+        self.config = config
+        self.storage = storage_from_config(config, self.logger)
+        self.check_interval = config.get("api.cache_check_interval", 1.0)
+        self._reload()
+
+    def state(self) -> RepositoryState:
+        """Current state, scheduling a reload if the database changed.
+
+        Returns:
+            RepositoryState
+        """
+        state = self._state
+        if state is None:
+            with self._lock:
+                if self._state is None:
+                    self.open(self.config)
+            return self._state
+
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            if self._file_stamp() != state.stamp:
+                self._start_reload()
+
+        return state
+
+    def get_job(self, job_id: str, state: Optional[RepositoryState] = None) -> Optional[Job]:
+        """Look up a job by its canonical ID.
+
+        Args:
+            job_id: Canonical job ID
+            state: State to answer from (default: the current one)
+
+        Returns:
+            Job, or None if not stored
+        """
+        return (state or self.state()).snapshot.get(job_id)
+
+    def query_jobs(
+        self,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        job_type: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        state: Optional[RepositoryState] = None
+    ) -> Tuple[int, List[Job]]:
+        """Filter jobs by substring and return one page, newest first.
+
+        Same contract as BaseStorage.query_jobs, plus job_type and
+        subcategory filters.
+
+        Args:
+            company: Case-insensitive substring of the company name
+            location: Case-insensitive substring of the location
+            limit: Maximum number of jobs to return (None = all)
+            offset: Number of matching jobs to skip
+            job_type: Case-insensitive substring of the job type
+            subcategory: Case-insensitive substring of the subcategory
+            state: State to answer from (default: the current one)
+
+        Returns:
+            Tuple of (total matching jobs, jobs in the requested page)
+        """
+        filters = {
+            "company": company,
+            "location": location,
+            "job_type": job_type,
+            "subcategory": subcategory,
+        }
+        return (state or self.state()).snapshot.query(filters, limit=limit, offset=offset)
+
+    def page_jobs(
+        self,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+        since: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        job_type: Optional[str] = None,
+        subcategory: Optional[str] = None,
+        state: Optional[RepositoryState] = None
+    ) -> Tuple[int, List[Job], Optional[Tuple[str, str]]]:
+        """Return one page of jobs after a cursor, newest first.
+
+        On the partitioned backend an unfiltered first page bounded by
+        ``since`` (``/latest?since=``, pollers) is read from storage, which
+        opens only the partitions the bound reaches; every other page comes
+        from the snapshot.
+
+        Args:
+            limit: Maximum number of jobs to return
+            after: Sort key the previous page ended at, or None
+            since: ISO timestamp; only jobs scraped at or after it
+            company: Case-insensitive substring of the company name
+            location: Case-insensitive substring of the location
+            job_type: Case-insensitive substring of the job type
+            subcategory: Case-insensitive substring of the subcategory
+            state: State to answer from (default: the current one)
+
+        Returns:
+            Tuple of (total matching jobs, jobs in the page, sort key of
+            the next page or None)
+        """
+        filters = {
+            "company": company,
+            "location": location,
+            "job_type": job_type,
+            "subcategory": subcategory,
+        }
+        if since is not None and after is None and not any(filters.values()) and isinstance(
+            self.storage, PartitionedStorage
+        ):
+            total, jobs = self.storage.query_jobs(limit=limit, since=since)
+            next_key = sort_key(jobs[-1]) if jobs and len(jobs) < total else None
+            return total, jobs, next_key
+
+        return (state or self.state()).snapshot.page(filters, limit, after=after, since=since)
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        state: Optional[RepositoryState] = None
+    ) -> Tuple[int, List[Tuple[Job, float]]]:
+        """Full-text search over title, company and description.
+
+        Args:
+            query: Search words
+            limit: Maximum number of results to return
+            offset: Number of top results to skip
+            state: State to answer from (default: the current one)
+
+        Returns:
+            Tuple of (total matching jobs, [(job, BM25 score)] best first)
+        """
+        snapshot = (state or self.state()).snapshot
+        # During a sync the index can be ahead of or behind the snapshot;
+        # count and rank only the snapshot's jobs then
+        total, ranked = self.search_index.search(
+            query, limit=limit, offset=offset, jobs=snapshot.jobs_by_id, version=snapshot
+        )
+        return total, [(snapshot.get(job_id), score) for job_id, score in ranked]
+
+    def notify(self, storage: BaseStorage, jobs: List[Job]) -> None:
+        """Reload now that a writer in this process saved jobs.
+
+        The reload runs in the background, so the new jobs show up without
+        waiting for the next check and without blocking the event loop.
+        Writers using a different database (e.g. a scrape with its own
+        config) are ignored.
+
+        Args:
+            storage: Storage the jobs were saved to
+            jobs: Saved jobs
+        """
+        if self._state is None or self.storage is None or not jobs:
+            return
+        if storage.data_files() == self.storage.data_files():
+            self._start_reload()
+
+    def _start_reload(self) -> None:
+        """Reload in a background thread unless one is already running."""
+        with self._lock:
+            if self._reloading:
+                return
+            self._reloading = True
+        threading.Thread(target=self._reload, name="job-repository-reload", daemon=True).start()
+
+    def _reload(self) -> None:
+        """Bring the snapshot up to date with storage and swap the new state in.
+
+        If the first load fails, an empty snapshot is served (and the load
+        retried at the next check) instead of failing every request.
+        """
+        state = self._state
+        try:
+            # Stamp and tail position first: a write during the load
+            # triggers another reload, which reads it again
+            stamp = self._file_stamp()
+            start = time.perf_counter()
+            tail = None
+            if state is not None and state.position is not None:
+                tail = self.storage.read_tail(state.position)
+
+            if tail is not None:
+                appended, position = tail
+                snapshot = state.snapshot.updated(appended)
+                if self.search_index.version is state.snapshot:
+                    indexed, removed = self.search_index.update(appended, version=snapshot), 0
+                else:
+                    indexed, removed = self.search_index.sync(snapshot.jobs_by_id, version=snapshot)
+                loaded = f"Applied {len(appended)} appended records ({len(snapshot)} jobs)"
+            else:
+                position = self.storage.tail_position()
+                snapshot = JobIndex(self.storage.load())
+                indexed, removed = self.search_index.sync(snapshot.jobs_by_id, version=snapshot)
+                loaded = f"Loaded {len(snapshot)} jobs"
+
+            self._state = self._new_state(snapshot, stamp, position)
+            self.logger.info(
+                f"{loaded} into the API cache in {time.perf_counter() - start:.2f}s "
+                f"(search index: {indexed} indexed, {removed} removed)"
+            )
+        except Exception as e:
+            if state is None:
+                self.logger.error(f"Failed to load jobs, serving an empty snapshot: {e}")
+                self._state = self._new_state(JobIndex([]), None, None)
+            else:
+                self.logger.error(f"Failed to reload jobs, serving the previous snapshot: {e}")
+        finally:
+            self._reloading = False
+
+    @staticmethod
+    def _new_state(snapshot: JobIndex, stamp: Optional[tuple], position: Any) -> RepositoryState:
+        """Derive the validators of a snapshot loaded at ``stamp``."""
+        mtimes = [entry[0] for entry in stamp or () if entry is not None]
+        return RepositoryState(
+            snapshot=snapshot,
+            stamp=stamp,
+            position=position,
+            generation=hashlib.blake2b(repr(stamp).encode("utf-8"), digest_size=8).hexdigest(),
+            last_modified=datetime.fromtimestamp(max(mtimes) / 1e9, tz=timezone.utc) if mtimes else None,
+        )
+
+    def _file_stamp(self) -> tuple:
+        """Modification time and size of each of the storage's data files."""
+        stamp = []
+        for path in self.storage.data_files():
+            try:
+                stat = path.stat()
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+
+# Global job repository instance
+job_repository = JobRepository()
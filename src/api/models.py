@@ -55,7 +55,7 @@ class ScrapeRequest(BaseModel):
     )
     headless: Optional[bool] = Field(
         True,
-        description="Run browser in headless mode"
+        description="Run browser in headless mode (ignored when the server's browser pool is in use)"
     )
     max_pages: Optional[int] = Field(
         None,
@@ -65,12 +65,17 @@ class ScrapeRequest(BaseModel):
         None,
         description="Webhook URL to POST results to when scraping completes"
     )
+    resume: bool = Field(
+        False,
+        description="Resume the last failed scrape from its last completed page"
+    )
 
     class Config:
         json_schema_extra = {
             "example": {
                 "headless": True,
                 "max_pages": 5,
+                "resume": False,
                 "webhook_url": "https://your-n8n-instance.com/webhook/job-results"
             }
         }
@@ -127,6 +132,10 @@ class JobsListResponse(BaseModel):
     page: int = Field(1, description="Current page number")
     page_size: int = Field(50, description="Number of items per page")
     jobs: List[JobResponse] = Field(..., description="List of jobs")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Pass as cursor to fetch the next page (null on the last page)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -134,6 +143,32 @@ class JobsListResponse(BaseModel):
                 "total": 150,
                 "page": 1,
                 "page_size": 50,
+                "jobs": [],
+                "next_cursor": "WyIyMDI1LTEwLTE0VDEwOjMwOjAwIiwgIjEyMzQ1Njc4Il0"
+            }
+        }
+
+
+class JobSearchResult(JobResponse):
+    """Job matching a full-text search, with its relevance score."""
+    score: float = Field(..., description="BM25 relevance score (higher is better)")
+
+
+class JobSearchResponse(BaseModel):
+    """Response model for the job search endpoint."""
+    query: str = Field(..., description="Search query")
+    total: int = Field(..., description="Total number of matching jobs")
+    limit: int = Field(20, description="Maximum number of results returned")
+    offset: int = Field(0, description="Number of top results skipped")
+    jobs: List[JobSearchResult] = Field(..., description="Matching jobs, best first")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "query": "payroll officer",
+                "total": 12,
+                "limit": 20,
+                "offset": 0,
                 "jobs": []
             }
         }
@@ -0,0 +1,175 @@
+"""Conditional, compressed and cached JSON responses for the read endpoints."""
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+try:
+    import brotli
+except ImportError:  # Optional dependency; gzip is used instead
+    brotli = None
+
+
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_SIZE = 1024
+
+# Bytes of serialized and compressed bodies kept across requests
+MAX_CACHED_BYTES = 64 * 1024 * 1024
+
+
+class ResponseCache:
+    """Serve job listings as cached, pre-serialized bytes with validators.
+
+    A response is identified by its path and query parameters plus the job
+    database generation (see RepositoryState.generation), which changes
+    whenever the data files do. From those comes a weak ETag, shared by
+    every content coding of the same JSON, so a client revalidating with
+    ``If-None-Match`` (or ``If-Modified-Since``) gets a 304 before
+    anything is built. Otherwise the serialized JSON for that key is
+    reused, and compressed once per encoding (brotli if installed and
+    accepted, else gzip) for bodies of MIN_COMPRESS_SIZE bytes or more.
+    Least recently used keys are evicted once all their bodies together
+    exceed ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int = MAX_CACHED_BYTES):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Total size of the bodies to keep
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str, str], Dict[str, bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def respond(
+        self,
+        request: Request,
+        generation: str,
+        last_modified: Optional[datetime],
+        build: Callable[[], Any]
+    ) -> Response:
+        """Answer a GET from the cache, building the content only on a miss.
+
+        Args:
+            request: Incoming request
+            generation: Current job database generation
+            last_modified: When the job database last changed, if known
+            build: Returns the JSON content (models, dicts or lists);
+                may raise HTTPException
+
+        Returns:
+            304 Not Modified, or a 200 JSON response
+        """
+        key = (request.url.path, str(sorted(request.query_params.multi_items())), generation)
+        # Weak: the gzip, brotli and identity bodies are equivalent, not byte-identical
+        etag = 'W/"' + hashlib.blake2b(repr(key).encode("utf-8"), digest_size=12).hexdigest() + '"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+
+        if self._not_modified(request, etag, last_modified):
+            return Response(status_code=304, headers=headers)
+
+        with self._lock:
+            variants = self._entries.get(key)
+            if variants is not None:
+                self._entries.move_to_end(key)
+
+        if variants is None:
+            body = json.dumps(
+                jsonable_encoder(build()), ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+            variants = {"identity": body}
+            with self._lock:
+                if key not in self._entries:
+                    self._entries[key] = variants
+                    self._size += len(body)
+                    self._evict()
+
+        encoding = self._choose_encoding(request, len(variants["identity"]))
+        if encoding not in variants:
+            # Racing requests may both compress; the result is the same
+            compressed = self._compress(variants["identity"], encoding)
+            with self._lock:
+                if encoding not in variants:
+                    variants[encoding] = compressed
+                    if self._entries.get(key) is variants:
+                        self._size += len(compressed)
+                        self._evict()
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+
+        return Response(content=variants[encoding], media_type="application/json", headers=headers)
+
+    def _evict(self) -> None:
+        """Drop least recently used keys until the cache fits. Caller holds ``_lock``."""
+        while self._size > self.max_bytes and self._entries:
+            _, variants = self._entries.popitem(last=False)
+            self._size -= sum(len(body) for body in variants.values())
+
+    @staticmethod
+    def _not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+        """Whether the client's cached copy is still current."""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since and
+            # compares weakly: W/"x" and "x" match
+            opaque = etag[2:]
+            candidates = [tag.strip() for tag in if_none_match.split(",")]
+            return any(tag == "*" or tag.removeprefix("W/") == opaque for tag in candidates)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            # HTTP dates have one-second resolution
+            return last_modified.replace(microsecond=0) <= since
+        return False
+
+    @staticmethod
+    def _choose_encoding(request: Request, size: int) -> str:
+        """Pick the best content coding the client accepts."""
+        if size < MIN_COMPRESS_SIZE:
+            return "identity"
+
+        accepted = set()
+        for part in request.headers.get("accept-encoding", "").split(","):
+            name, _, params = part.strip().partition(";")
+            if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                continue
+            accepted.add(name.strip().lower())
+
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return "identity"
+
+    @staticmethod
+    def _compress(body: bytes, encoding: str) -> bytes:
+        """Compress a body with the given content coding."""
+        if encoding == "br":
+            return brotli.compress(body, quality=5)
+        return gzip.compress(body, compresslevel=6)
+
+
+# Global response cache instance
+response_cache = ResponseCache()
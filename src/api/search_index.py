@@ -0,0 +1,288 @@
+"""Full-text search over jobs with BM25 ranking."""
+
+import hashlib
+import heapq
+import math
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Container, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from ..models import Job
+from .job_index import tokenize
+
+
+# Term frequency weight per field: a query word in the title counts for
+# more than the same word in the description
+FIELD_WEIGHTS = {"title": 3, "company": 2, "description": 1}
+
+# Words common to most ads; they add nothing to ranking but would make
+# every query walk nearly every document
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or our the "
+    "this to we will with you your".split()
+)
+
+# Documents indexed per lock hold while syncing, so searches never wait long
+SYNC_BATCH = 200
+
+# Terms whose ranked postings are kept between searches
+MAX_CACHED_TERMS = 512
+
+
+def search_terms(text: str) -> List[str]:
+    """Tokenize text for the search index, dropping stopwords."""
+    return [token for token in tokenize(text) if token not in STOPWORDS]
+
+
+def _content_hash(job: Job) -> bytes:
+    """Digest of the indexed fields; a job is re-indexed when it changes."""
+    text = "\x1f".join(getattr(job, field) or "" for field in FIELD_WEIGHTS)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class SearchIndex:
+    """Inverted index over job title, company and description.
+
+    Each term maps to the jobs containing it with a field-weighted term
+    frequency; documents are ranked with BM25 (k1, b) over those
+    frequencies. The index lives across job snapshots and is kept in step
+    with ``sync``, which only tokenizes jobs whose indexed text changed
+    (by content hash) and drops the ones that are gone, so a save costs
+    the size of the new jobs rather than the database; ``update`` indexes
+    appended jobs without comparing the rest. Both record the ``version``
+    (snapshot) the index now matches, and ``search`` can be restricted to
+    a snapshot's jobs while it matches another one.
+
+    A term's postings are scored once and kept sorted by score until the
+    next sync. Single-word queries then slice the top of that list, and
+    multi-word queries walk the lists in parallel with Fagin's threshold
+    algorithm, stopping as soon as no unseen job can reach the top k.
+
+    Searches and syncs may run on different threads (event loop and
+    reload thread); both hold ``lock``, and syncs release it every
+    SYNC_BATCH documents, clearing the ranked postings again at the end.
+    Syncs are serialized by their own lock.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """Initialize an empty index.
+
+        Args:
+            k1: BM25 term frequency saturation
+            b: BM25 document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self._doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self._doc_versions: Dict[str, bytes] = {}
+        self.version: Any = None
+        self._total_length = 0
+        self._ranked: "OrderedDict[str, Tuple[List[Tuple[float, str]], Dict[str, float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def sync(self, jobs_by_id: Mapping[str, Job], version: Any = None) -> Tuple[int, int]:
+        """Bring the index in line with the current jobs.
+
+        Args:
+            jobs_by_id: Canonical job ID -> Job for every stored job
+            version: Snapshot holding those jobs, recorded as ``version``
+
+        Returns:
+            Tuple of (documents indexed, documents removed)
+        """
+        with self._sync_lock:
+            removed = [job_id for job_id in self._doc_versions if job_id not in jobs_by_id]
+            changed = [
+                job for job_id, job in jobs_by_id.items()
+                if self._doc_versions.get(job_id) != _content_hash(job)
+            ]
+
+            self._apply(removed, changed, version)
+
+        return len(changed), len(removed)
+
+    def update(self, jobs: Iterable[Job], version: Any = None) -> int:
+        """Index jobs that were added or changed, leaving the others alone.
+
+        Args:
+            jobs: Jobs in write order; a later record of the same ID wins
+            version: Snapshot the index matches afterwards, recorded as
+                ``version``
+
+        Returns:
+            Number of documents indexed
+        """
+        with self._sync_lock:
+            latest = {job.job_id: job for job in jobs}
+            changed = [
+                job for job_id, job in latest.items()
+                if self._doc_versions.get(job_id) != _content_hash(job)
+            ]
+            self._apply([], changed, version)
+
+        return len(changed)
+
+    def _apply(self, removed: List[str], changed: List[Job], version: Any) -> None:
+        """Remove and (re-)index documents in batches. Caller holds ``_sync_lock``."""
+        with self.lock:
+            self.version = None
+            if removed or changed:
+                # Scores depend on document counts and lengths
+                self._ranked.clear()
+
+        for start in range(0, len(removed), SYNC_BATCH):
+            with self.lock:
+                for job_id in removed[start:start + SYNC_BATCH]:
+                    self._remove(job_id)
+
+        for start in range(0, len(changed), SYNC_BATCH):
+            with self.lock:
+                for job in changed[start:start + SYNC_BATCH]:
+                    self._add(job)
+
+        with self.lock:
+            if removed or changed:
+                # Searches between batches cached scores of a partial index
+                self._ranked.clear()
+            self.version = version
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        jobs: Optional[Container[str]] = None,
+        version: Any = None
+    ) -> Tuple[int, List[Tuple[str, float]]]:
+        """Rank jobs against a free-text query.
+
+        Args:
+            query: Search words; a job matches if it contains any of them
+            limit: Maximum number of results to return
+            offset: Number of top results to skip
+            jobs: Only count and return these job IDs (a snapshot's jobs),
+                unless the index matches ``version``
+            version: Snapshot ``jobs`` belongs to
+
+        Returns:
+            Tuple of (total matching jobs, [(job_id, score)] best first)
+        """
+        terms = set(search_terms(query))
+        k = offset + limit
+        with self.lock:
+            if version is not None and version is self.version:
+                # The index holds exactly the snapshot's jobs
+                jobs = None
+
+            ranked = [self._ranked_postings(term) for term in terms]
+            ranked = [entry for entry in ranked if entry[0]]
+            if not ranked:
+                return 0, []
+
+            if len(ranked) == 1:
+                by_score = ranked[0][0]
+                if jobs is not None:
+                    by_score = [entry for entry in by_score if entry[1] in jobs]
+                return len(by_score), [(job_id, score) for score, job_id in by_score[offset:k]]
+
+            matching = set().union(*(self.postings[term] for term in terms if term in self.postings))
+            if jobs is not None:
+                matching = {job_id for job_id in matching if job_id in jobs}
+            total = len(matching)
+
+            # Threshold algorithm: after each round of sorted access, no
+            # unseen job can score more than the sum of the current scores
+            top: List[Tuple[float, str]] = []
+            seen = set()
+            depth = 0
+            while True:
+                threshold = 0.0
+                exhausted = True
+                for by_score, _ in ranked:
+                    if depth >= len(by_score):
+                        continue
+                    exhausted = False
+                    score, job_id = by_score[depth]
+                    threshold += score
+                    if job_id in seen:
+                        continue
+                    seen.add(job_id)
+                    if job_id not in matching:
+                        continue
+                    entry = (sum(scores.get(job_id, 0.0) for _, scores in ranked), job_id)
+                    if len(top) < k:
+                        heapq.heappush(top, entry)
+                    elif entry > top[0]:
+                        heapq.heapreplace(top, entry)
+                depth += 1
+                if exhausted or (len(top) >= k and top[0][0] >= threshold):
+                    break
+
+        best = sorted(top, reverse=True)[offset:]
+        return total, [(job_id, score) for score, job_id in best]
+
+    def _ranked_postings(self, term: str) -> Tuple[List[Tuple[float, str]], Dict[str, float]]:
+        """BM25 scores of a term's postings, best first and by job ID. Caller holds ``lock``."""
+        cached = self._ranked.get(term)
+        if cached is not None:
+            self._ranked.move_to_end(term)
+            return cached
+
+        postings = self.postings.get(term)
+        if not postings:
+            return [], {}
+
+        doc_count = len(self.doc_lengths)
+        avg_length = self._total_length / doc_count
+        k1, b = self.k1, self.b
+        idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+        doc_lengths = self.doc_lengths
+
+        scores = {
+            job_id: idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * doc_lengths[job_id] / avg_length))
+            for job_id, tf in postings.items()
+        }
+        by_score = sorted(((score, job_id) for job_id, score in scores.items()), reverse=True)
+
+        cached = self._ranked[term] = (by_score, scores)
+        if len(self._ranked) > MAX_CACHED_TERMS:
+            self._ranked.popitem(last=False)
+        return cached
+
+    def _add(self, job: Job) -> None:
+        """Index (or re-index) one job. Caller holds ``lock``."""
+        job_id = job.job_id
+        if job_id in self._doc_versions:
+            self._remove(job_id)
+
+        counts: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in search_terms(getattr(job, field)):
+                counts[term] += weight
+
+        for term, tf in counts.items():
+            self.postings.setdefault(term, {})[job_id] = tf
+
+        length = sum(counts.values())
+        self.doc_lengths[job_id] = length
+        self._doc_terms[job_id] = tuple(counts)
+        self._doc_versions[job_id] = _content_hash(job)
+        self._total_length += length
+
+    def _remove(self, job_id: str) -> None:
+        """Drop one job from the index. Caller holds ``lock``."""
+        for term in self._doc_terms.pop(job_id, ()):
+            postings = self.postings[term]
+            del postings[job_id]
+            if not postings:
+                del self.postings[term]
+
+        self._total_length -= self.doc_lengths.pop(job_id, 0)
+        self._doc_versions.pop(job_id, None)
+
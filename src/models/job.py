@@ -1,8 +1,14 @@
 """Job data model."""
 
+import re
 from dataclasses import dataclass, asdict
 from typing import Optional
 from datetime import datetime
+from urllib.parse import urlsplit
+
+
+# Numeric Seek job ID in a job URL path, e.g. /job/88560261
+JOB_ID_PATTERN = re.compile(r"/job/(\d+)")
 
 
 @dataclass
@@ -37,18 +43,62 @@ class Job:
 
     @property
     def job_id(self) -> str:
-        """Extract job ID from URL."""
-        # Seek URLs typically end with /job/{id}
-        if "/job/" in self.job_url:
-            return self.job_url.split("/job/")[-1].split("?")[0]
-        return self.job_url
+        """Extract job ID from URL.
+
+        The ID is cached on the instance (outside the dataclass fields)
+        and recomputed only if job_url changes, since hashing, dedup and
+        lookups ask for it many times per job.
+        """
+        cached = self.__dict__.get("_job_id")
+        if cached is None or cached[0] is not self.job_url:
+            cached = self.__dict__["_job_id"] = (self.job_url, self.id_from_url(self.job_url))
+        return cached[1]
+
+    @staticmethod
+    def id_from_url(job_url: str) -> str:
+        """Extract the canonical job ID from a job URL.
+
+        Seek links carry tracking parameters (type, ref, origin) and a
+        per-impression ``#sol=`` fragment, so the same ad shows up under
+        many URLs. The numeric ID after /job/ is the stable identity.
+
+        Args:
+            job_url: Job URL, with or without tracking parameters, or an
+                already canonical ID
+
+        Returns:
+            Numeric job ID, or the URL without query and fragment if it
+            has no /job/{id} path
+        """
+        match = JOB_ID_PATTERN.search(job_url)
+        if match:
+            return match.group(1)
+        return job_url.split("#")[0].split("?")[0]
+
+    @classmethod
+    def canonical_url(cls, job_url: str) -> str:
+        """Strip tracking parameters and fragments from a job URL.
+
+        Args:
+            job_url: Absolute job URL
+
+        Returns:
+            URL of the form {scheme}://{host}/job/{id} (or /job/{id} for
+            a relative URL)
+        """
+        match = JOB_ID_PATTERN.search(job_url)
+        if not match:
+            return job_url.split("#")[0].split("?")[0]
+        parts = urlsplit(job_url)
+        prefix = f"{parts.scheme}://{parts.netloc}" if parts.netloc else ""
+        return f"{prefix}/job/{match.group(1)}"
 
     def __hash__(self):
-        """Hash based on job URL."""
-        return hash(self.job_url)
+        """Hash based on canonical job ID."""
+        return hash(self.job_id)
 
     def __eq__(self, other):
-        """Compare jobs based on URL."""
+        """Compare jobs based on canonical job ID."""
         if isinstance(other, Job):
-            return self.job_url == other.job_url
+            return self.job_id == other.job_id
         return False
@@ -1,5 +1,8 @@
 """Scraper modules for Seek jobs."""
 
+from .base_scraper import BaseScraper
 from .seek_scraper import SeekScraper
+from .async_seek_scraper import AsyncSeekScraper
+from .browser_pool import BrowserPool
 
-__all__ = ["SeekScraper"]
+__all__ = ["BaseScraper", "SeekScraper", "AsyncSeekScraper", "BrowserPool"]
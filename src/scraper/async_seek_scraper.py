@@ -0,0 +1,503 @@
+"""Async Seek scraper using Playwright's async API."""
+
+import asyncio
+import logging
+import time
+from typing import Callable, List, Optional
+
+from playwright.async_api import (
+    async_playwright, Page, Browser,
+    Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+)
+
+from ..models import Job
+from ..utils import Config
+from .base_scraper import BaseScraper, PageSession
+from .retry import PageLoadError, RETRYABLE_ERRORS
+from .selectors import (
+    JOB_CARD_SELECTOR, FIELD_SELECTORS, EXTRACT_CARDS_SCRIPT,
+    CARDS_SIGNATURE_SCRIPT, CARDS_CHANGED_SCRIPT, NEXT_PAGE_SELECTORS
+)
+
+
+class AsyncSeekScraper(BaseScraper):
+    """Scraper for Seek.com.au job listings that runs on an asyncio loop.
+
+    Shares page planning, card parsing, filtering and checkpointing with
+    SeekScraper through BaseScraper, so it produces the same Job objects.
+    Every method that talks to the browser is a coroutine here, and cards
+    are always read with the single-evaluate extraction. Pass a ``browser`` launched from a shared
+    ``async_playwright`` instance to run many scrapes over one driver
+    connection.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        logger: logging.Logger,
+        browser: Optional[Browser] = None,
+        is_seen: Optional[Callable[[Job], bool]] = None
+    ):
+        """Initialize the scraper.
+
+        Args:
+            config: Configuration object
+            logger: Logger instance
+            browser: Shared async browser to open contexts on. When omitted,
+                a browser is launched for this scrape only.
+            is_seen: Membership check against previously seen jobs. Enables
+                incremental mode (stop paginating once pages are known).
+        """
+        super().__init__(config, logger, is_seen=is_seen)
+        self.browser = browser
+
+    async def scrape(self, resume: bool = False) -> List[Job]:
+        """Scrape job listings.
+
+        Args:
+            resume: Continue from the last checkpointed page instead of
+                starting over
+
+        Returns:
+            List of Job objects
+        """
+        self.logger.info("Starting async Seek scraper...")
+        await self._off_loop(self._prepare_resume, resume)
+        self._log_settings()
+
+        if self.browser is not None:
+            jobs = await self._scrape_with_browser(self.browser)
+        else:
+            async with async_playwright() as playwright:
+                browser = await self._launch_browser(playwright)
+                try:
+                    jobs = await self._scrape_with_browser(browser)
+                finally:
+                    await browser.close()
+
+        # Finished cleanly, nothing left to resume
+        await self._off_loop(self._finish)
+
+        self.resource_blocker.log_summary()
+        self.logger.info(f"Total jobs scraped: {len(jobs)}")
+        return jobs
+
+    async def _scrape_with_browser(self, browser: Browser) -> List[Job]:
+        """Run the scrape on a launched or shared browser.
+
+        Args:
+            browser: Browser instance
+
+        Returns:
+            List of Job objects
+        """
+        self._start_run()
+        try:
+            if self.concurrency > 1:
+                return await self._scrape_concurrent(browser)
+            return await self._scrape_sequential(browser)
+        finally:
+            self._end_run()
+
+    async def _off_loop(self, func: Callable, *args):
+        """Run blocking file or database work in a worker thread.
+
+        Seen-job lookups and checkpoint reads and writes hit storage (and
+        may wait on its file lock), so they must not stall the event loop
+        that serves the API.
+
+        Args:
+            func: Blocking callable
+            *args: Arguments for func
+
+        Returns:
+            Result of func
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _scrape_sequential(self, browser: Browser) -> List[Job]:
+        """Scrape results pages one by one by clicking "Next".
+
+        Args:
+            browser: Browser instance
+
+        Returns:
+            List of Job objects
+        """
+        jobs = list(self._initial_jobs)
+        session = PageSession(browser)
+        await self._open_page(session)
+
+        page_num = self._start_page
+        try:
+            await self._load_page(session, page_num)
+
+            while page_num <= self.max_pages:
+                self.logger.info(f"Scraping page {page_num}...")
+
+                page_jobs = await self._read_loaded_page(session, page_num)
+                if await self._off_loop(self._complete_page, page_num, session.page.url, page_jobs, jobs):
+                    break
+
+                # From here on a failure is a failure of the next page
+                page_num += 1
+                if not await self._advance(session, page_num):
+                    self.logger.info("No more pages to scrape")
+                    break
+
+        except RETRYABLE_ERRORS as e:
+            self._give_up(page_num, e)
+
+        finally:
+            await self._close_session(session)
+
+        return jobs
+
+    async def _scrape_concurrent(self, browser: Browser) -> List[Job]:
+        """Scrape results pages in batches over a pool of browser contexts.
+
+        Args:
+            browser: Browser instance
+
+        Returns:
+            List of Job objects
+        """
+        self.logger.info(f"Scraping concurrently with {self.concurrency} browser contexts")
+
+        jobs = list(self._initial_jobs)
+        sessions = [PageSession(browser) for _ in range(self.concurrency)]
+
+        try:
+            for session in sessions:
+                await self._open_page(session)
+
+            for page_nums in self._page_batches():
+                batch = list(zip(sessions, page_nums))
+
+                results = await asyncio.gather(
+                    *(self._fetch_page(session, num) for session, num in batch),
+                    return_exceptions=True
+                )
+
+                # Collect results in page order
+                for num, page_jobs in zip(page_nums, results):
+                    if isinstance(page_jobs, RETRYABLE_ERRORS):
+                        self._give_up(num, page_jobs)
+                        return jobs
+                    if isinstance(page_jobs, BaseException):
+                        raise page_jobs
+
+                    if not page_jobs:
+                        self.logger.info("No more pages to scrape")
+                        return jobs
+
+                    if await self._off_loop(self._complete_page, num, self._build_page_url(num), page_jobs, jobs):
+                        return jobs
+
+        finally:
+            for session in sessions:
+                await self._close_session(session)
+
+        return jobs
+
+    async def _fetch_page(self, session: PageSession, page_num: int) -> List[Job]:
+        """Load a results page and read its jobs (concurrent mode).
+
+        Args:
+            session: Session to load the page in
+            page_num: 1-based results page number
+
+        Returns:
+            List of Job objects (unfiltered); empty at the end of results
+        """
+        await self._load_page(session, page_num, wait_until="commit")
+        page_jobs = await self._read_page_jobs(session.page)
+        if not page_jobs:
+            page_jobs = await self._confirm_end_of_results(session, page_num)
+        return page_jobs
+
+    async def _open_page(self, session: PageSession):
+        """Open a fresh context and page for a session.
+
+        Args:
+            session: Session to (re)populate
+        """
+        session.context = await session.browser.new_context()
+        session.page = await session.context.new_page()
+        await self._set_page_defaults(session.page)
+
+    async def _close_session(self, session: PageSession):
+        """Close a session's context, ignoring browser errors.
+
+        Args:
+            session: Session to close
+        """
+        if session.page is not None:
+            self._search_responses.pop(session.page, None)
+        if session.context is not None:
+            try:
+                await session.context.close()
+            except PlaywrightError as e:
+                self.logger.debug(f"Error closing context: {e}")
+        session.context = None
+        session.page = None
+
+    async def _recover(self, session: PageSession, failed_attempts: int):
+        """Recreate the session's context once a page keeps failing.
+
+        Args:
+            session: Session whose page failed
+            failed_attempts: Failed attempts so far
+        """
+        if self.retrier.should_recreate_context(failed_attempts):
+            self.logger.warning("Recreating browser context after repeated failures")
+            self.retrier.context_recreations += 1
+            await self._close_session(session)
+            await self._open_page(session)
+
+    async def _navigate(self, page: Page, url: str, wait_until: str = "domcontentloaded"):
+        """Navigate to a URL, treating server errors as failures.
+
+        Args:
+            page: Playwright page
+            url: URL to load
+            wait_until: Playwright load state to wait for
+
+        Raises:
+            PageLoadError: If the server answered 429 or 5xx
+        """
+        await self.pacer.acquire_async()
+        response = await page.goto(url, wait_until=wait_until)
+        if response is not None and (response.status == 429 or response.status >= 500):
+            raise PageLoadError(f"HTTP {response.status} for {url}")
+
+    async def _load_page(self, session: PageSession, page_num: int, wait_until: str = "domcontentloaded"):
+        """Navigate a session to a results page, retrying failures.
+
+        Args:
+            session: Session to navigate
+            page_num: 1-based results page number
+            wait_until: Playwright load state to wait for
+        """
+        page_url = self._build_page_url(page_num)
+        self.logger.info(f"Navigating to page {page_num}: {page_url}")
+        await self.retrier.call_async(
+            "navigate",
+            lambda: self._navigate(session.page, page_url, wait_until),
+            on_retry=lambda failed: self._recover(session, failed)
+        )
+
+    async def _read_loaded_page(self, session: PageSession, page_num: int) -> List[Job]:
+        """Read a page that is expected to have listings, reloading it on failure.
+
+        Args:
+            session: Session showing the page
+            page_num: 1-based results page number
+
+        Returns:
+            List of Job objects (unfiltered)
+        """
+        page_url = self._build_page_url(page_num)
+        reload = False
+
+        async def read():
+            if reload:
+                await self._navigate(session.page, page_url)
+            return await self._read_page_jobs(session.page, strict=True)
+
+        async def on_retry(failed):
+            nonlocal reload
+            reload = True
+            await self._recover(session, failed)
+
+        return await self.retrier.call_async("read_page", read, on_retry=on_retry)
+
+    async def _confirm_end_of_results(self, session: PageSession, page_num: int) -> List[Job]:
+        """Reload an empty page once to tell a real end of results from a hiccup.
+
+        Args:
+            session: Session showing the empty page
+            page_num: 1-based results page number
+
+        Returns:
+            Jobs found after reloading (empty at the end of results)
+        """
+        self.logger.debug(f"Page {page_num} has no listings, reloading once to confirm")
+        try:
+            await self._navigate(session.page, self._build_page_url(page_num))
+        except RETRYABLE_ERRORS as e:
+            self.logger.debug(f"Reload of page {page_num} failed: {e}")
+            return []
+
+        page_jobs = await self._read_page_jobs(session.page)
+        if page_jobs:
+            self.retrier.recovered["read_page"] += 1
+        return page_jobs
+
+    async def _advance(self, session: PageSession, page_num: int) -> bool:
+        """Move to the next results page, loading it directly if the click fails.
+
+        Args:
+            session: Session showing the current page
+            page_num: 1-based number of the page to move to
+
+        Returns:
+            False if there is no next page
+        """
+        try:
+            return await self._goto_next_page(session.page)
+        except RETRYABLE_ERRORS as e:
+            self.logger.warning(f"Next page navigation failed ({e}), loading page {page_num} directly")
+            await self._load_page(session, page_num)
+            return True
+
+    async def _launch_browser(self, playwright) -> Browser:
+        """Launch browser instance.
+
+        Args:
+            playwright: Async Playwright instance
+
+        Returns:
+            Browser instance
+        """
+        launcher = getattr(playwright, self.browser_type, playwright.chromium)
+        return await launcher.launch(headless=self.headless)
+
+    async def _set_page_defaults(self, page: Page):
+        """Set default page configuration.
+
+        Args:
+            page: Playwright page
+        """
+        user_agent = self.config.get("scraper.user_agent")
+        if user_agent:
+            await page.set_extra_http_headers({"User-Agent": user_agent})
+
+        timeout = self.config.get("scraper.request_timeout", 30) * 1000
+        page.set_default_timeout(timeout)
+
+        await self.resource_blocker.attach_async(page)
+
+        if self.use_search_api:
+            self._capture_search_responses(page)
+
+    async def _read_page_jobs(self, page: Page, strict: bool = False) -> List[Job]:
+        """Read every job on the current page, before filtering.
+
+        Args:
+            page: Playwright page
+            strict: Raise instead of returning an empty list when no
+                listings appear
+
+        Returns:
+            List of Job objects (unfiltered)
+
+        Raises:
+            PageLoadError: In strict mode, if no listings appear
+        """
+        if self.use_search_api:
+            jobs = await self._extract_jobs_from_search_response(page)
+            if jobs is not None:
+                return jobs
+
+        try:
+            await page.wait_for_selector(JOB_CARD_SELECTOR, timeout=10000)
+        except PlaywrightTimeout:
+            if strict:
+                raise PageLoadError("Timeout waiting for job listings")
+            self.logger.warning("Timeout waiting for job listings")
+            return []
+
+        if self.use_search_api:
+            jobs = await self._extract_jobs_from_search_response(page)
+            if jobs is not None:
+                return jobs
+            self.logger.debug("No search response captured, falling back to DOM extraction")
+
+        cards = await page.evaluate(EXTRACT_CARDS_SCRIPT, [JOB_CARD_SELECTOR, FIELD_SELECTORS])
+        return self._jobs_from_cards(cards)
+
+    async def _extract_jobs_from_search_response(self, page: Page) -> Optional[List[Job]]:
+        """Build jobs from the latest captured search API response.
+
+        Args:
+            page: Playwright page
+
+        Returns:
+            List of Job objects (unfiltered), or None if no usable
+            response was captured
+        """
+        for response in self._take_search_responses(page):
+            try:
+                payload = await response.json()
+            except Exception as e:
+                self.logger.debug(f"Could not decode search response {response.url}: {e}")
+                continue
+
+            jobs = self._jobs_from_search_payload(payload)
+            if jobs is not None:
+                return jobs
+
+        return None
+
+    async def _goto_next_page(self, page: Page) -> bool:
+        """Navigate to next page if available.
+
+        Args:
+            page: Playwright page
+
+        Returns:
+            True if navigation succeeded, False if there is no next page
+
+        Raises:
+            playwright Error: If the button was found but navigation failed
+        """
+        for selector in NEXT_PAGE_SELECTORS:
+            next_button = await page.query_selector(selector)
+
+            if next_button and await next_button.is_visible():
+                self.logger.debug(f"Found next button with selector: {selector}")
+                signature = await page.evaluate(CARDS_SIGNATURE_SCRIPT, JOB_CARD_SELECTOR)
+                # Drop responses left over from the current page
+                self._search_responses.get(page, []).clear()
+                await self.pacer.acquire_async()
+                self.logger.info("Clicking next page button")
+                await next_button.click()
+                await self._wait_for_page_change(page, signature)
+                return True
+
+        self.logger.debug("No next page button found with any selector")
+        return False
+
+    async def _wait_for_page_change(self, page: Page, signature: Optional[str]) -> str:
+        """Wait until the next results page is ready after clicking "Next".
+
+        Args:
+            page: Playwright page
+            signature: Card signature taken before navigating
+
+        Returns:
+            Name of the signal that fired
+        """
+        deadline = time.monotonic() + self.ready_timeout
+        poll_ms = 250
+
+        while time.monotonic() < deadline:
+            if self._search_responses.get(page):
+                return "search_response"
+            try:
+                await page.wait_for_function(
+                    CARDS_CHANGED_SCRIPT,
+                    arg=[JOB_CARD_SELECTOR, signature],
+                    timeout=poll_ms
+                )
+                return "cards_changed"
+            except PlaywrightTimeout:
+                continue
+
+        self.logger.debug("No readiness signal, waiting for network idle")
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.ready_timeout * 1000)
+        except PlaywrightTimeout:
+            self.logger.warning("Timeout waiting for next page to settle")
+        return "network_idle"
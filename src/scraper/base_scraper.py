@@ -0,0 +1,494 @@
+"""Browser-independent parts of a Seek scrape, shared by the sync and async scrapers."""
+
+import logging
+from typing import Any, Callable, Iterator, List, Optional
+from urllib.parse import urljoin, quote
+
+from ..models import Job
+from ..utils import Config
+from .pacing import TokenBucket
+from .search_api import is_search_response, parse_search_response
+from .resource_blocker import ResourceBlocker
+from .checkpoint import ScrapeCheckpoint
+from .retry import Retrier, RetryPolicy
+
+
+class PageSession:
+    """A browser context with a single page, replaced when it keeps failing."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.context = None
+        self.page = None
+
+
+class BaseScraper:
+    """Everything about a Seek scrape except talking to the browser.
+
+    Holds the scrape settings and decides what the browser loop does:
+    which pages to load (``_page_batches``), how search responses and
+    job cards become Job objects, which jobs are kept, when incremental
+    mode stops paginating, and what is checkpointed or given up.
+    SeekScraper and AsyncSeekScraper only add the browser I/O, blocking
+    or awaitable. ``_complete_page`` and the checkpoint helpers touch
+    storage and the checkpoint file, so the async scraper runs them in
+    a worker thread.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        logger: logging.Logger,
+        is_seen: Optional[Callable[[Job], bool]] = None
+    ):
+        """Initialize the scrape settings.
+
+        Args:
+            config: Configuration object
+            logger: Logger instance
+            is_seen: Membership check against previously seen jobs. Enables
+                incremental mode (stop paginating once pages are known).
+        """
+        self.config = config
+        self.logger = logger
+        self.is_seen = is_seen
+        self.base_url = config.get("scraper.base_url")
+        self.classification = config.get("scraper.classification")
+        self.excluded_subcategories = set(config.get("scraper.excluded_subcategories", []))
+        self.excluded_companies = set(config.get("scraper.excluded_companies", []))
+        self.max_pages = config.get("scraper.max_pages", 20)
+        self.retry_attempts = config.get("scraper.retry_attempts", 3)
+        self.retry_delay = config.get("scraper.retry_delay", 5)
+        self.headless = config.get("scraper.headless", True)
+        self.browser_type = config.get("scraper.browser_type", "chromium")
+        self.concurrency = max(1, config.get("scraper.concurrency", 1))
+        self.ready_timeout = config.get("scraper.ready_timeout", 15)
+        self.pacer = TokenBucket(
+            rate=config.get("scraper.requests_per_second", 1.0),
+            burst=config.get("scraper.request_burst", 1)
+        )
+        self.extraction_mode = config.get("scraper.extraction_mode", "evaluate")
+        self.use_search_api = config.get("scraper.use_search_api", True)
+        self._search_responses = {}
+        self.resource_blocker = ResourceBlocker(config.get("scraper.block_resources", []), logger)
+        self.incremental = is_seen is not None and config.get("scraper.incremental.enabled", True)
+        self.seen_ratio = config.get("scraper.incremental.seen_ratio", 0.8)
+        self.known_pages = max(1, config.get("scraper.incremental.known_pages", 2))
+        self._known_streak = 0
+        self.checkpoint = None
+        if config.get("scraper.checkpoint.enabled", True):
+            self.checkpoint = ScrapeCheckpoint(config.get_checkpoint_path(), logger)
+        self._start_page = 1
+        self._initial_jobs: List[Job] = []
+        self._incomplete = False
+        self.retrier = Retrier(RetryPolicy.from_config(config), logger)
+
+    def _log_settings(self):
+        """Log the filters this scrape applies."""
+        subclassification_ids = self.config.get("scraper.subclassification_ids")
+        if subclassification_ids:
+            num_subcats = len(subclassification_ids.split(','))
+            self.logger.info(f"Using subclassification filter: {num_subcats} subcategories (excluding Recruitment - Agency at source)")
+        else:
+            self.logger.info(f"No subclassification filter (will filter {len(self.excluded_subcategories)} subcategories after scraping)")
+
+        self.logger.info(f"Excluding {len(self.excluded_companies)} recruitment agencies by company name")
+
+    def _prepare_resume(self, resume: bool):
+        """Set the starting page and jobs from the checkpoint, if resuming.
+
+        Args:
+            resume: Whether to resume from the checkpoint
+        """
+        self._start_page = 1
+        self._initial_jobs = []
+
+        if not resume or not self.checkpoint:
+            return
+
+        state = self.checkpoint.load(self._build_search_url())
+        if not state:
+            self.logger.info("No checkpoint to resume from, starting from page 1")
+            return
+
+        self._start_page = state["page_num"] + 1
+        self._initial_jobs = state["jobs"]
+        self.logger.info(
+            f"Resuming after page {state['page_num']} with {len(self._initial_jobs)} jobs already gathered"
+        )
+
+    def _start_run(self):
+        """Reset per-run state before the first page."""
+        self._known_streak = 0
+        self._incomplete = False
+        self.retrier.reset()
+
+    def _end_run(self):
+        """Drop captured responses and report retries after the last page."""
+        self._search_responses.clear()
+        self.retrier.log_summary()
+
+    def _finish(self):
+        """Remove the checkpoint once the scrape finished cleanly."""
+        if self.checkpoint and not self._incomplete:
+            self.checkpoint.clear(self._build_search_url())
+
+    def _page_batches(self) -> Iterator[List[int]]:
+        """Plan the results pages to load, ``concurrency`` at a time.
+
+        Yields:
+            Lists of consecutive 1-based page numbers, up to max_pages
+        """
+        page_num = self._start_page
+        while page_num <= self.max_pages:
+            last_page = min(page_num + self.concurrency - 1, self.max_pages)
+            yield list(range(page_num, last_page + 1))
+            page_num = last_page + 1
+
+    def _complete_page(self, page_num: int, page_url: str, page_jobs: List[Job], jobs: List[Job]) -> bool:
+        """Keep a scraped page's jobs, checkpoint them and decide whether to stop.
+
+        Looks jobs up with ``is_seen`` and writes the checkpoint file, so
+        it blocks on storage.
+
+        Args:
+            page_num: 1-based results page number
+            page_url: URL of that page
+            page_jobs: Jobs read from the page (before filtering)
+            jobs: All jobs gathered so far; the kept jobs are appended
+
+        Returns:
+            True if no further pages should be fetched
+        """
+        stop_early = self._should_stop_early(page_jobs, page_num)
+
+        page_jobs = self._filter_jobs(page_jobs)
+        jobs.extend(page_jobs)
+        self._save_checkpoint(page_num, page_url, jobs)
+
+        self.logger.info(f"Found {len(page_jobs)} jobs on page {page_num}")
+        return stop_early
+
+    def _save_checkpoint(self, page_num: int, page_url: str, jobs: List[Job]):
+        """Record a completed page so a failed scrape can resume after it.
+
+        Args:
+            page_num: Completed 1-based page number
+            page_url: URL of that page
+            jobs: All jobs gathered so far
+        """
+        if not self.checkpoint:
+            return
+
+        try:
+            self.checkpoint.save(self._build_search_url(), page_num, page_url, jobs)
+        except OSError as e:
+            self.logger.warning(f"Could not write checkpoint: {e}")
+
+    def _give_up(self, page_num: int, error: Exception):
+        """Stop the scrape at a page that kept failing, keeping the checkpoint.
+
+        Args:
+            page_num: Page that could not be scraped
+            error: Last error
+        """
+        self._incomplete = True
+        self.logger.error(
+            f"Giving up at page {page_num} after retries ({error}); "
+            "results so far are kept and the scrape can be resumed"
+        )
+
+    def _should_stop_early(self, page_jobs: List[Job], page_num: int) -> bool:
+        """Track already-seen pages and decide whether to stop paginating.
+
+        A page counts as known when at least scraper.incremental.seen_ratio
+        of its jobs were seen before. Pagination stops after
+        scraper.incremental.known_pages known pages in a row.
+
+        Args:
+            page_jobs: Jobs read from the page (before filtering)
+            page_num: 1-based results page number
+
+        Returns:
+            True if no further pages should be fetched
+        """
+        if not self.incremental or not page_jobs:
+            return False
+
+        seen = sum(1 for job in page_jobs if self.is_seen(job))
+        if seen / len(page_jobs) >= self.seen_ratio:
+            self._known_streak += 1
+        else:
+            self._known_streak = 0
+
+        self.logger.info(f"Page {page_num}: {seen}/{len(page_jobs)} jobs already seen")
+
+        if self._known_streak >= self.known_pages:
+            self.logger.info(
+                f"Stopping early: {self._known_streak} page(s) in a row of already-seen jobs"
+            )
+            return True
+        return False
+
+    def _capture_search_responses(self, page):
+        """Record search API responses received by a page.
+
+        The body is read later, when the page is scraped, so the event
+        handler itself stays cheap.
+
+        Args:
+            page: Playwright page (sync or async)
+        """
+        captured = self._search_responses.setdefault(page, [])
+
+        def on_response(response):
+            if response.ok and is_search_response(response.url):
+                captured.append(response)
+
+        page.on("response", on_response)
+
+    def _take_search_responses(self, page) -> List[Any]:
+        """Consume the responses captured for a page, newest first.
+
+        Args:
+            page: Playwright page (sync or async)
+
+        Returns:
+            Captured responses; the next page starts fresh
+        """
+        captured = self._search_responses.get(page)
+        if not captured:
+            return []
+
+        responses = list(reversed(captured))
+        captured.clear()
+        return responses
+
+    def _build_search_url(self) -> str:
+        """Build search URL for HR & Recruitment classification.
+
+        Returns:
+            Search URL
+        """
+        # Seek uses a slug-based URL structure for classifications
+        # HR & Recruitment: /jobs-in-human-resources-recruitment
+        classification_slug = self.config.get(
+            "scraper.classification_slug",
+            "jobs-in-human-resources-recruitment"
+        )
+        base_url = f"{self.base_url}/{classification_slug}"
+
+        # Build query parameters
+        params = []
+
+        # Add date range filter if specified
+        # daterange=3 means "last 3 days"
+        date_range = self.config.get("scraper.date_range")
+        if date_range and date_range > 0:
+            params.append(f"daterange={date_range}")
+
+        # Add subclassification filter if specified
+        # This filters at the source (more efficient)
+        # Example: 6323,6322,6321 (all HR subcategories except Recruitment - Agency)
+        subclassification_ids = self.config.get("scraper.subclassification_ids")
+        if subclassification_ids:
+            # URL encode the comma-separated IDs
+            encoded_ids = quote(subclassification_ids, safe='')
+            params.append(f"subclassification={encoded_ids}")
+
+        # Newest first, so already-seen jobs cluster on the later pages
+        if self.incremental:
+            params.append("sortmode=ListedDate")
+
+        # Combine parameters
+        if params:
+            return f"{base_url}?{'&'.join(params)}"
+
+        return base_url
+
+    def _build_page_url(self, page_num: int) -> str:
+        """Build search URL for a specific results page.
+
+        Args:
+            page_num: 1-based results page number
+
+        Returns:
+            Search URL for that page
+        """
+        search_url = self._build_search_url()
+        if page_num <= 1:
+            return search_url
+
+        separator = "&" if "?" in search_url else "?"
+        return f"{search_url}{separator}page={page_num}"
+
+    def _filter_jobs(self, jobs: List[Job]) -> List[Job]:
+        """Apply subcategory and company filters.
+
+        Args:
+            jobs: List of Job objects
+
+        Returns:
+            List of jobs that should be kept
+        """
+        included = []
+        for job in jobs:
+            if self._should_include_job(job):
+                included.append(job)
+            else:
+                self.logger.debug(f"Excluded job: {job.title} ({job.subcategory})")
+        return included
+
+    def _jobs_from_search_payload(self, payload) -> Optional[List[Job]]:
+        """Map a decoded search API payload to jobs.
+
+        Args:
+            payload: Decoded JSON body
+
+        Returns:
+            List of Job objects (unfiltered), or None if the payload is not
+            a search results response
+        """
+        if not isinstance(payload, dict) or not isinstance(payload.get("data"), list):
+            return None
+
+        jobs = parse_search_response(payload, self.base_url, self.classification)
+        self.logger.debug(f"Parsed {len(jobs)} jobs from search response")
+        return jobs
+
+    def _jobs_from_cards(self, cards: List[dict]) -> List[Job]:
+        """Build jobs from the fields of every card extracted from a page.
+
+        Args:
+            cards: One field mapping per job card (see ``_build_job``)
+
+        Returns:
+            List of Job objects (unfiltered)
+        """
+        self.logger.debug(f"Found {len(cards)} job cards on page")
+
+        jobs = []
+        for fields in cards:
+            try:
+                job = self._build_job(fields)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                self.logger.error(f"Error extracting job data: {e}")
+
+        return jobs
+
+    def _build_job(self, fields: dict) -> Optional[Job]:
+        """Build a Job from extracted card fields.
+
+        Args:
+            fields: Mapping of field name -> text (or None), plus "href"
+
+        Returns:
+            Job object or None
+        """
+        title = fields.get("title")
+        if title is None:
+            self.logger.debug("Could not find title element in card")
+            return None
+
+        href = fields.get("href")
+        if not href:
+            self.logger.debug(f"No href found for title: {title}")
+            return None
+
+        company = fields.get("company")
+        location = fields.get("location")
+        subcategory = fields.get("subcategory")
+        posted_date = fields.get("posted_date")
+        salary = fields.get("salary")
+        job_type = fields.get("job_type")
+        description = fields.get("description")
+
+        # If job_type is null, try to infer from description and salary
+        if job_type is None and description:
+            job_type = self._infer_job_type(description, salary)
+
+        return Job(
+            title=title,
+            company=company if company is not None else "Unknown",
+            location=location if location is not None else "Unknown",
+            classification=self.classification,
+            subcategory=subcategory if subcategory is not None else "Unknown",
+            job_url=Job.canonical_url(urljoin(self.base_url, href)),
+            salary=salary,
+            # Set default value if posted date is not found
+            posted_date=posted_date if posted_date is not None else "Recently",
+            job_type=job_type,
+            description=description
+        )
+
+    def _infer_job_type(self, description: str, salary: str = None) -> str:
+        """Infer job type from description and salary text.
+
+        Args:
+            description: Job description text
+            salary: Salary text (optional)
+
+        Returns:
+            Inferred job type or None
+        """
+        if not description:
+            return None
+
+        # Combine description and salary for analysis
+        text = description.lower()
+        if salary:
+            text += " " + salary.lower()
+
+        # Check for contract/temp keywords first (highest priority)
+        contract_keywords = ['contract', 'contractor', 'temp', 'temporary', 'fixed term', 'fixed-term']
+        if any(keyword in text for keyword in contract_keywords):
+            return "Contract/Temp"
+
+        # Check for casual keywords
+        casual_keywords = ['casual', 'vacation', 'on call', 'on-call', 'relief', 'fill-in']
+        if any(keyword in text for keyword in casual_keywords):
+            return "Casual"
+
+        # Check for part-time keywords
+        part_time_keywords = ['part time', 'part-time', 'p/t', 'pt ', 'parttime']
+        if any(keyword in text for keyword in part_time_keywords):
+            return "Part-time"
+
+        # Check for full-time keywords
+        full_time_keywords = ['full time', 'full-time', 'f/t', 'ft ', 'fulltime', 'permanent', 'ongoing']
+        if any(keyword in text for keyword in full_time_keywords):
+            return "Full-time"
+
+        # Default to Full-time if no specific type is mentioned (most common)
+        return "Full-time"
+
+    def _should_include_job(self, job: Job) -> bool:
+        """Check if job should be included based on filters.
+
+        Args:
+            job: Job object
+
+        Returns:
+            True if job should be included
+        """
+        # Check if subcategory is in excluded list
+        for excluded in self.excluded_subcategories:
+            if excluded.lower() in job.subcategory.lower():
+                self.logger.debug(f"Excluded by subcategory '{excluded}': {job.title}")
+                return False
+
+        # Check if company name contains BOTH "recruitment" AND "agency" (case-insensitive)
+        company_lower = job.company.lower()
+        if "recruitment" in company_lower and "agency" in company_lower:
+            self.logger.debug(f"Excluded by keyword filter (recruitment + agency): {job.title} at {job.company}")
+            return False
+
+        # Check if company is in excluded list (case-insensitive partial match)
+        for excluded_company in self.excluded_companies:
+            if excluded_company.lower() in job.company.lower():
+                self.logger.debug(f"Excluded by company '{excluded_company}': {job.title} at {job.company}")
+                return False
+
+        return True
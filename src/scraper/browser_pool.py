@@ -0,0 +1,163 @@
+"""Long-lived pool of Playwright browsers shared across scrapes."""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from playwright.sync_api import sync_playwright, Browser
+
+
+class _BrowserSlot:
+    """One pooled browser and the thread that owns it.
+
+    Sync Playwright objects may only be used from the thread that created
+    them, so every slot runs all of its browser work on a dedicated
+    single-thread executor.
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"browser-pool-{index}")
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self.uses = 0
+
+
+class BrowserPool:
+    """Bounded pool of warm browsers that scrapes borrow and return.
+
+    Browsers are launched once (at server boot via ``start``), health-checked
+    before every use and relaunched after ``max_uses`` scrapes to keep memory
+    growth in check.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_uses: int = 50,
+        browser_type: str = "chromium",
+        headless: bool = True,
+        acquire_timeout: Optional[float] = None,
+        logger: logging.Logger = None
+    ):
+        """Initialize the pool.
+
+        Args:
+            size: Number of browsers (and concurrent scrapes)
+            max_uses: Scrapes served by a browser before it is relaunched
+            browser_type: chromium, firefox or webkit
+            headless: Run browsers in headless mode
+            acquire_timeout: Seconds to wait for a free browser (None = forever)
+            logger: Logger instance
+        """
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.browser_type = browser_type
+        self.headless = headless
+        self.acquire_timeout = acquire_timeout
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._slots = [_BrowserSlot(i) for i in range(self.size)]
+        self._idle: "queue.Queue[_BrowserSlot]" = queue.Queue(maxsize=self.size)
+        for slot in self._slots:
+            self._idle.put(slot)
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Launch every browser up front so scrapes never pay a cold start."""
+        futures = [slot.executor.submit(self._ensure_browser, slot) for slot in self._slots]
+        for future in futures:
+            future.result()
+        self.logger.info(f"Browser pool started with {self.size} {self.browser_type} browsers")
+
+    def run(self, func: Callable[[Browser], Any]) -> Any:
+        """Borrow a browser, call ``func(browser)`` on its thread, return it.
+
+        Args:
+            func: Work to run with the borrowed browser. It should close any
+                contexts it opens so the browser goes back clean.
+
+        Returns:
+            Whatever ``func`` returns
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        try:
+            slot = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No browser available within {self.acquire_timeout}s")
+
+        try:
+            return slot.executor.submit(self._run_on_slot, slot, func).result()
+        finally:
+            self._idle.put(slot)
+
+    def close(self) -> None:
+        """Close every browser and stop the slot threads."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        for slot in self._slots:
+            try:
+                slot.executor.submit(self._shutdown_slot, slot).result()
+            except Exception as e:
+                self.logger.warning(f"Error closing pooled browser {slot.index}: {e}")
+            slot.executor.shutdown(wait=True)
+
+        self.logger.info("Browser pool closed")
+
+    def stats(self) -> dict:
+        """Return pool usage counters."""
+        return {
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "uses": [slot.uses for slot in self._slots],
+        }
+
+    def _run_on_slot(self, slot: _BrowserSlot, func: Callable[[Browser], Any]) -> Any:
+        """Health-check, recycle if needed, then run the work (slot thread)."""
+        if slot.uses >= self.max_uses:
+            self.logger.info(f"Recycling pooled browser {slot.index} after {slot.uses} uses")
+            self._close_browser(slot)
+
+        self._ensure_browser(slot)
+        slot.uses += 1
+        return func(slot.browser)
+
+    def _ensure_browser(self, slot: _BrowserSlot) -> None:
+        """Launch the slot's browser if missing or disconnected (slot thread)."""
+        if slot.browser is not None and slot.browser.is_connected():
+            return
+
+        if slot.browser is not None:
+            self.logger.warning(f"Pooled browser {slot.index} is disconnected, relaunching")
+            self._close_browser(slot)
+
+        if slot.playwright is None:
+            slot.playwright = sync_playwright().start()
+
+        launcher = getattr(slot.playwright, self.browser_type, slot.playwright.chromium)
+        slot.browser = launcher.launch(headless=self.headless)
+        slot.uses = 0
+
+    def _close_browser(self, slot: _BrowserSlot) -> None:
+        """Close the slot's browser, ignoring errors (slot thread)."""
+        if slot.browser is not None:
+            try:
+                slot.browser.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing pooled browser {slot.index}: {e}")
+        slot.browser = None
+
+    def _shutdown_slot(self, slot: _BrowserSlot) -> None:
+        """Close the browser and stop Playwright (slot thread)."""
+        self._close_browser(slot)
+        if slot.playwright is not None:
+            slot.playwright.stop()
+            slot.playwright = None
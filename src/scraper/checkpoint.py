@@ -0,0 +1,128 @@
+"""Page-level checkpoints so interrupted scrapes can resume."""
+
+import hashlib
+import json
+import logging
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from ..models import Job
+from ..storage.atomic import atomic_write, file_lock
+
+
+class ScrapeCheckpoint:
+    """Small state files recording the last completed results page.
+
+    Each search gets its own file next to ``path``, named after a hash of
+    its URL, so a cron run and API scrapes of other searches never touch
+    each other's progress. The file holds the search URL, the last
+    completed page number and URL, every job gathered so far and the ID
+    of the run that wrote it. It is rewritten after each page, under the
+    file's lock, and removed when that run completes; a run only removes
+    a checkpoint it wrote (or resumed), never one a concurrent scrape of
+    the same search is still updating.
+    """
+
+    def __init__(self, path: Path, logger: logging.Logger = None):
+        """Initialize the checkpoint.
+
+        Args:
+            path: Base path of the checkpoint files (e.g.
+                data/scrape_checkpoint.json -> data/scrape_checkpoint-<hash>.json)
+            logger: Logger instance
+        """
+        self.path = Path(path)
+        self.logger = logger or logging.getLogger(__name__)
+        self.run_id = uuid.uuid4().hex
+
+    def path_for(self, search_url: str) -> Path:
+        """Return the checkpoint file of a search.
+
+        Args:
+            search_url: Base search URL of the scrape
+
+        Returns:
+            Path to the search's checkpoint file
+        """
+        digest = hashlib.sha1(search_url.encode("utf-8")).hexdigest()[:12]
+        return self.path.with_name(f"{self.path.stem}-{digest}{self.path.suffix}")
+
+    def save(self, search_url: str, page_num: int, page_url: str, jobs: List[Job]) -> None:
+        """Record a completed page.
+
+        Args:
+            search_url: Base search URL of the scrape
+            page_num: Last completed 1-based page number
+            page_url: URL of that page
+            jobs: All jobs gathered so far
+        """
+        state = {
+            "search_url": search_url,
+            "run_id": self.run_id,
+            "page_num": page_num,
+            "page_url": page_url,
+            "jobs": [job.to_dict() for job in jobs],
+            "updated_at": datetime.now().isoformat(),
+        }
+
+        path = self.path_for(search_url)
+        with file_lock(path):
+            with atomic_write(path) as f:
+                json.dump(state, f, ensure_ascii=False)
+
+    def load(self, search_url: str) -> Optional[dict]:
+        """Load the checkpoint for a search, if one exists.
+
+        The run resuming a checkpoint takes it over: its later saves and
+        final clear apply to that file.
+
+        Args:
+            search_url: Base search URL of the scrape being resumed
+
+        Returns:
+            Dictionary with page_num, page_url and jobs (as Job objects),
+            or None if there is no usable checkpoint
+        """
+        path = self.path_for(search_url)
+        with file_lock(path):
+            state = self._read(path)
+
+        if state is None:
+            return None
+
+        if state.get("search_url") != search_url:
+            self.logger.warning("Ignoring checkpoint from a different search")
+            return None
+
+        self.run_id = state.get("run_id") or self.run_id
+        state["jobs"] = [Job.from_dict(data) for data in state.get("jobs", [])]
+        return state
+
+    def clear(self, search_url: str) -> None:
+        """Remove the search's checkpoint file and its lock file if this run wrote it.
+
+        Args:
+            search_url: Base search URL of the scrape
+        """
+        path = self.path_for(search_url)
+        with file_lock(path) as lock:
+            state = self._read(path)
+            if state is not None and state.get("run_id") not in (None, self.run_id):
+                self.logger.info("Keeping checkpoint of a concurrent scrape of the same search")
+                return
+            path.unlink(missing_ok=True)
+            lock.remove()
+
+    def _read(self, path: Path) -> Optional[dict]:
+        """Read a checkpoint file. Caller holds its lock."""
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
@@ -0,0 +1,72 @@
+"""Token-bucket pacing for polite request rates."""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how often requests may start.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Each
+    request takes one token, blocking until one is available.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (0 or less disables pacing)
+            burst: Maximum tokens that can accumulate
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            wait = self._reserve()
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Take one token without blocking the event loop.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            wait = self._reserve()
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _reserve(self) -> float:
+        """Take a token, possibly going into debt, and return the wait time.
+
+        Must be called with the lock held.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
@@ -0,0 +1,123 @@
+"""Request routing that aborts resources the scraper never reads."""
+
+import logging
+from collections import Counter
+from typing import Iterable
+
+from playwright.sync_api import Route
+
+from .search_api import is_search_response
+
+
+# Resource types Playwright reports for a request
+RESOURCE_TYPES = {
+    "document", "stylesheet", "image", "media", "font", "script",
+    "texttrack", "xhr", "fetch", "eventsource", "websocket", "manifest", "other",
+}
+
+# Typical transfer size per blocked resource type, used to estimate savings.
+# Aborted requests never report a real size, so this is only an estimate.
+TYPICAL_BYTES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 35_000,
+    "stylesheet": 30_000,
+    "script": 60_000,
+}
+DEFAULT_TYPICAL_BYTES = 10_000
+
+
+class ResourceBlocker:
+    """Abort requests by resource type or URL pattern and count the savings."""
+
+    def __init__(self, rules: Iterable[str], logger: logging.Logger = None):
+        """Initialize the blocker.
+
+        Args:
+            rules: Entries from scraper.block_resources. Playwright resource
+                types (e.g. "image", "font") block by type; anything else is
+                a URL substring (e.g. "google-analytics.com")
+            logger: Logger instance
+        """
+        rules = [rule.strip() for rule in rules if rule and rule.strip()]
+        self.blocked_types = {rule for rule in rules if rule in RESOURCE_TYPES}
+        self.blocked_patterns = [rule for rule in rules if rule not in RESOURCE_TYPES]
+        # Never block the results page itself
+        self.blocked_types.discard("document")
+        self.logger = logger or logging.getLogger(__name__)
+        self.blocked_requests = Counter()
+        self.estimated_bytes_saved = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any blocking rule is configured."""
+        return bool(self.blocked_types or self.blocked_patterns)
+
+    def attach(self, target) -> None:
+        """Install the routing handler on a page or browser context.
+
+        Args:
+            target: Playwright Page or BrowserContext
+        """
+        if self.enabled:
+            target.route("**/*", self._handle_route)
+
+    async def attach_async(self, target) -> None:
+        """Install the routing handler on an async page or browser context.
+
+        Args:
+            target: Async Playwright Page or BrowserContext
+        """
+        if self.enabled:
+            await target.route("**/*", self._handle_route_async)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Decide whether a request should be aborted.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type
+
+        Returns:
+            True if the request should be aborted
+        """
+        if resource_type == "document" or is_search_response(url):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return any(pattern in url for pattern in self.blocked_patterns)
+
+    def _handle_route(self, route: Route) -> None:
+        """Abort or continue an intercepted request."""
+        if self._check(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _handle_route_async(self, route) -> None:
+        """Abort or continue an intercepted request (async API)."""
+        if self._check(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _check(self, request) -> bool:
+        """Decide on a request and count it if blocked."""
+        if not self.should_block(request.url, request.resource_type):
+            return False
+
+        self.blocked_requests[request.resource_type] += 1
+        self.estimated_bytes_saved += TYPICAL_BYTES.get(request.resource_type, DEFAULT_TYPICAL_BYTES)
+        return True
+
+    def log_summary(self) -> None:
+        """Log how many requests were blocked and the estimated bytes saved."""
+        if not self.enabled:
+            return
+
+        total = sum(self.blocked_requests.values())
+        by_type = ", ".join(f"{rtype}={count}" for rtype, count in self.blocked_requests.most_common())
+        self.logger.info(
+            f"Blocked {total} requests (~{self.estimated_bytes_saved / 1024 / 1024:.1f} MB saved)"
+            + (f": {by_type}" if by_type else "")
+        )
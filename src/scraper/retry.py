@@ -0,0 +1,192 @@
+"""Retry engine with exponential backoff for scraper operations."""
+
+import asyncio
+import logging
+import random
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+from playwright.sync_api import Error as PlaywrightError
+
+
+class PageLoadError(Exception):
+    """A results page failed to load or render its job listings."""
+
+
+# Errors worth retrying: Playwright failures (including timeouts) and pages
+# that loaded without usable content
+RETRYABLE_ERRORS = (PlaywrightError, PageLoadError)
+
+
+class RetryPolicy:
+    """Backoff settings shared by every retried operation."""
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 5,
+        max_delay: float = 60,
+        jitter: float = 0.5,
+        budgets: Optional[Dict[str, int]] = None,
+        recreate_context_after: int = 2
+    ):
+        """Initialize the policy.
+
+        Args:
+            attempts: Tries per call, including the first one
+            base_delay: Delay in seconds before the first retry; doubles on
+                each further retry
+            max_delay: Upper bound for a single delay
+            jitter: Random spread applied to each delay, as a fraction
+                (0.5 means +/-50%)
+            budgets: Maximum retries per operation name over a whole scrape
+            recreate_context_after: Failed attempts on a page after which
+                its browser context is thrown away and recreated
+        """
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.budgets = budgets or {}
+        self.recreate_context_after = max(1, recreate_context_after)
+
+    @classmethod
+    def from_config(cls, config) -> "RetryPolicy":
+        """Build a policy from scraper.retry_* settings."""
+        return cls(
+            attempts=config.get("scraper.retry_attempts", 3),
+            base_delay=config.get("scraper.retry_delay", 5),
+            max_delay=config.get("scraper.retry.max_delay", 60),
+            jitter=config.get("scraper.retry.jitter", 0.5),
+            budgets=config.get("scraper.retry.budgets", {}),
+            recreate_context_after=config.get("scraper.retry.recreate_context_after", 2)
+        )
+
+    def delay(self, retry_number: int) -> float:
+        """Backoff delay before the given retry (1-based), with jitter."""
+        delay = min(self.max_delay, self.base_delay * (2 ** (retry_number - 1)))
+        if self.jitter:
+            delay *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, delay)
+
+
+class Retrier:
+    """Runs operations under a RetryPolicy and records retry metrics."""
+
+    def __init__(self, policy: RetryPolicy, logger: logging.Logger = None):
+        """Initialize the retrier.
+
+        Args:
+            policy: Retry policy
+            logger: Logger instance
+        """
+        self.policy = policy
+        self.logger = logger or logging.getLogger(__name__)
+        self.retries = Counter()
+        self.recovered = Counter()
+        self.failures = Counter()
+        self.context_recreations = 0
+
+    def reset(self) -> None:
+        """Clear metrics and budgets before a new scrape."""
+        self.retries.clear()
+        self.recovered.clear()
+        self.failures.clear()
+        self.context_recreations = 0
+
+    def call(
+        self,
+        operation: str,
+        func: Callable[[], Any],
+        on_retry: Callable[[int], None] = None,
+        attempts: Optional[int] = None
+    ) -> Any:
+        """Call ``func`` and retry it on retryable errors.
+
+        Args:
+            operation: Operation name, used for budgets and metrics
+            func: Work to run
+            on_retry: Called with the number of failed attempts so far,
+                after the backoff delay and before the next attempt
+            attempts: Override the policy's attempts for this call
+
+        Returns:
+            Whatever ``func`` returns
+
+        Raises:
+            The last error once attempts or the operation budget run out
+        """
+        attempt = 1
+        while True:
+            try:
+                result = func()
+            except RETRYABLE_ERRORS as e:
+                delay = self._before_retry(operation, attempt, attempts, e)
+                time.sleep(delay)
+                if on_retry:
+                    on_retry(attempt)
+                attempt += 1
+                continue
+
+            if attempt > 1:
+                self.recovered[operation] += 1
+            return result
+
+    async def call_async(self, operation: str, func, on_retry=None, attempts: Optional[int] = None) -> Any:
+        """Async counterpart of ``call``; ``func`` and ``on_retry`` are coroutine functions."""
+        attempt = 1
+        while True:
+            try:
+                result = await func()
+            except RETRYABLE_ERRORS as e:
+                delay = self._before_retry(operation, attempt, attempts, e)
+                await asyncio.sleep(delay)
+                if on_retry:
+                    await on_retry(attempt)
+                attempt += 1
+                continue
+
+            if attempt > 1:
+                self.recovered[operation] += 1
+            return result
+
+    def _before_retry(self, operation: str, attempt: int, attempts: Optional[int], error: Exception) -> float:
+        """Decide whether another attempt is allowed and return its delay.
+
+        Re-raises ``error`` when attempts or the operation budget are used up.
+        """
+        attempts = attempts or self.policy.attempts
+        budget = self.policy.budgets.get(operation)
+        out_of_budget = budget is not None and self.retries[operation] >= budget
+
+        if attempt >= attempts or out_of_budget:
+            self.failures[operation] += 1
+            reason = "retry budget exhausted" if out_of_budget else f"failed after {attempt} attempts"
+            self.logger.error(f"{operation} {reason}: {error}")
+            raise error
+
+        delay = self.policy.delay(attempt)
+        self.retries[operation] += 1
+        self.logger.warning(
+            f"{operation} failed (attempt {attempt}/{attempts}), retrying in {delay:.1f}s: {error}"
+        )
+        return delay
+
+    def should_recreate_context(self, failed_attempts: int) -> bool:
+        """Whether a page's context should be recreated after this many failures."""
+        return failed_attempts >= self.policy.recreate_context_after
+
+    def summary(self) -> dict:
+        """Return retry metrics for the last scrape."""
+        return {
+            "retries": dict(self.retries),
+            "recovered": dict(self.recovered),
+            "failures": dict(self.failures),
+            "context_recreations": self.context_recreations,
+        }
+
+    def log_summary(self) -> None:
+        """Log retry metrics if anything was retried."""
+        if self.retries or self.failures:
+            self.logger.info(f"Retry summary: {self.summary()}")
@@ -0,0 +1,111 @@
+"""Mapping of Seek's search API responses to Job objects.
+
+The results page is populated from a JSON search API call. When that response
+is captured, its payload can be turned into jobs directly without reading the
+rendered DOM. Seek has shipped a few shapes of this payload over time, so the
+field lookups below accept both the older flat fields and the newer nested
+ones.
+"""
+
+from typing import Any, List, Optional
+
+from ..models import Job
+
+
+# Path fragments identifying the job search API call (current and legacy)
+SEARCH_API_PATTERNS = ("/api/jobsearch/", "/api/chalice-search/")
+
+
+def is_search_response(url: str) -> bool:
+    """Check whether a response URL is a job search API call.
+
+    Args:
+        url: Response URL
+
+    Returns:
+        True if the URL is a search API call
+    """
+    return "/search" in url and any(pattern in url for pattern in SEARCH_API_PATTERNS)
+
+
+def parse_search_response(payload: dict, base_url: str, classification: str) -> List[Job]:
+    """Convert a search API payload into Job objects.
+
+    Args:
+        payload: Decoded JSON body of the search response
+        base_url: Seek base URL used to build job links
+        classification: Classification name to set on each job
+
+    Returns:
+        List of Job objects, in result order
+    """
+    jobs = []
+    for item in payload.get("data") or []:
+        job = _parse_job(item, base_url, classification)
+        if job:
+            jobs.append(job)
+    return jobs
+
+
+def _parse_job(item: dict, base_url: str, classification: str) -> Optional[Job]:
+    """Convert a single search result into a Job.
+
+    Args:
+        item: One entry of the payload's "data" list
+        base_url: Seek base URL used to build job links
+        classification: Classification name to set on the job
+
+    Returns:
+        Job object or None if the entry has no ID or title
+    """
+    job_id = item.get("id")
+    title = item.get("title")
+    if not job_id or not title:
+        return None
+
+    return Job(
+        title=title.strip(),
+        company=_first_text(
+            _get(item, "advertiser", "description"),
+            item.get("companyName"),
+        ) or "Unknown",
+        location=_first_text(
+            _get(item, "locations", 0, "label"),
+            item.get("location"),
+        ) or "Unknown",
+        classification=classification,
+        subcategory=_first_text(
+            _get(item, "classifications", 0, "subclassification", "description"),
+            _get(item, "subClassification", "description"),
+        ) or "Unknown",
+        job_url=f"{base_url}/job/{job_id}",
+        posted_date=_first_text(item.get("listingDateDisplay")) or "Recently",
+        salary=_first_text(item.get("salaryLabel"), item.get("salary")),
+        job_type=_first_text(_get(item, "workTypes", 0), item.get("workType")),
+        description=_first_text(item.get("teaser")),
+    )
+
+
+def _get(data: Any, *path) -> Any:
+    """Follow a path of keys/indexes into nested dicts and lists.
+
+    Returns:
+        The value at the path, or None if any step is missing
+    """
+    for key in path:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and isinstance(key, int) and key < len(data):
+            data = data[key]
+        else:
+            return None
+    return data
+
+
+def _first_text(*values) -> Optional[str]:
+    """Return the first non-empty string value, stripped."""
+    for value in values:
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
@@ -2,94 +2,333 @@
 
 import time
 import logging
-from typing import List, Optional
-from urllib.parse import urljoin, quote
-from playwright.sync_api import sync_playwright, Page, Browser, TimeoutError as PlaywrightTimeout
+from typing import Callable, List, Optional
+from playwright.sync_api import (
+    sync_playwright, Page, Browser,
+    Error as PlaywrightError, TimeoutError as PlaywrightTimeout
+)
 
 from ..models import Job
 from ..utils import Config
+from .selectors import (
+    JOB_CARD_SELECTOR, FIELD_SELECTORS, EXTRACT_CARDS_SCRIPT,
+    CARDS_SIGNATURE_SCRIPT, CARDS_CHANGED_SCRIPT, NEXT_PAGE_SELECTORS
+)
+from .base_scraper import BaseScraper, PageSession
+from .browser_pool import BrowserPool
+from .retry import PageLoadError, RETRYABLE_ERRORS
 
 
-class SeekScraper:
+class SeekScraper(BaseScraper):
     """Scraper for Seek.com.au job listings."""
 
-    def __init__(self, config: Config, logger: logging.Logger):
+    def __init__(
+        self,
+        config: Config,
+        logger: logging.Logger,
+        browser_pool: Optional[BrowserPool] = None,
+        is_seen: Optional[Callable[[Job], bool]] = None
+    ):
         """Initialize the scraper.
 
         Args:
             config: Configuration object
             logger: Logger instance
+            browser_pool: Shared pool to borrow a warm browser from. When
+                omitted, a browser is launched for this scrape only.
+            is_seen: Membership check against previously seen jobs. Enables
+                incremental mode (stop paginating once pages are known).
         """
-        self.config = config
-        self.logger = logger
-        self.base_url = config.get("scraper.base_url")
-        self.classification = config.get("scraper.classification")
-        self.excluded_subcategories = set(config.get("scraper.excluded_subcategories", []))
-        self.excluded_companies = set(config.get("scraper.excluded_companies", []))
-        self.max_pages = config.get("scraper.max_pages", 20)
-        self.retry_attempts = config.get("scraper.retry_attempts", 3)
-        self.retry_delay = config.get("scraper.retry_delay", 5)
-        self.headless = config.get("scraper.headless", True)
-        self.browser_type = config.get("scraper.browser_type", "chromium")
-
-    def scrape(self) -> List[Job]:
+        super().__init__(config, logger, is_seen=is_seen)
+        self.browser_pool = browser_pool
+
+    def scrape(self, resume: bool = False) -> List[Job]:
         """Scrape job listings.
 
+        Args:
+            resume: Continue from the last checkpointed page instead of
+                starting over
+
         Returns:
             List of Job objects
         """
         self.logger.info("Starting Seek scraper...")
+        self._prepare_resume(resume)
+        self._log_settings()
 
-        # Log filtering settings
-        subclassification_ids = self.config.get("scraper.subclassification_ids")
-        if subclassification_ids:
-            num_subcats = len(subclassification_ids.split(','))
-            self.logger.info(f"Using subclassification filter: {num_subcats} subcategories (excluding Recruitment - Agency at source)")
+        if self.browser_pool is not None:
+            jobs = self.browser_pool.run(self._scrape_with_browser)
         else:
-            self.logger.info(f"No subclassification filter (will filter {len(self.excluded_subcategories)} subcategories after scraping)")
+            with sync_playwright() as playwright:
+                browser = self._launch_browser(playwright)
+                try:
+                    jobs = self._scrape_with_browser(browser)
+                finally:
+                    browser.close()
 
-        self.logger.info(f"Excluding {len(self.excluded_companies)} recruitment agencies by company name")
+        # Finished cleanly, nothing left to resume
+        self._finish()
 
-        jobs = []
+        self.resource_blocker.log_summary()
+        self.logger.info(f"Total jobs scraped: {len(jobs)}")
+        return jobs
 
-        with sync_playwright() as playwright:
-            browser = self._launch_browser(playwright)
+    def _scrape_with_browser(self, browser: Browser) -> List[Job]:
+        """Run the scrape on a launched or borrowed browser.
 
-            try:
-                page = browser.new_page()
-                self._set_page_defaults(page)
+        Args:
+            browser: Browser instance
+
+        Returns:
+            List of Job objects
+        """
+        self._start_run()
+        try:
+            if self.concurrency > 1:
+                return self._scrape_concurrent(browser)
+            return self._scrape_sequential(browser)
+        finally:
+            self._end_run()
 
-                # Navigate to search results
-                search_url = self._build_search_url()
-                self.logger.info(f"Navigating to: {search_url}")
+    def _scrape_sequential(self, browser: Browser) -> List[Job]:
+        """Scrape results pages one by one by clicking "Next".
+
+        Args:
+            browser: Browser instance
 
-                page.goto(search_url, wait_until="domcontentloaded")
-                time.sleep(2)  # Allow page to fully load
+        Returns:
+            List of Job objects
+        """
+        jobs = list(self._initial_jobs)
 
-                # Scrape multiple pages
-                page_num = 1
-                while page_num <= self.max_pages:
-                    self.logger.info(f"Scraping page {page_num}...")
+        # Use an own context so a pooled browser is returned clean
+        session = PageSession(browser)
+        self._open_page(session)
 
-                    page_jobs = self._scrape_page(page)
-                    jobs.extend(page_jobs)
+        page_num = self._start_page
+        try:
+            # Navigate to search results
+            self._load_page(session, page_num)
 
-                    self.logger.info(f"Found {len(page_jobs)} jobs on page {page_num}")
+            # Scrape multiple pages
+            while page_num <= self.max_pages:
+                self.logger.info(f"Scraping page {page_num}...")
 
-                    # Check if there's a next page
-                    if not self._goto_next_page(page):
-                        self.logger.info("No more pages to scrape")
+                page_jobs = self._read_loaded_page(session, page_num)
+                if self._complete_page(page_num, session.page.url, page_jobs, jobs):
+                    break
+
+                # Check if there's a next page; from here on a failure is
+                # a failure of the next page
+                page_num += 1
+                if not self._advance(session, page_num):
+                    self.logger.info("No more pages to scrape")
+                    break
+
+        except RETRYABLE_ERRORS as e:
+            self._give_up(page_num, e)
+
+        finally:
+            self._close_session(session)
+
+        return jobs
+
+    def _scrape_concurrent(self, browser: Browser) -> List[Job]:
+        """Scrape results pages in batches over a pool of browser contexts.
+
+        Each context loads a different page number at the same time. Page
+        URLs are built directly instead of following "Next" links, and every
+        navigation takes a token from the shared pacer.
+
+        Args:
+            browser: Browser instance
+
+        Returns:
+            List of Job objects
+        """
+        self.logger.info(f"Scraping concurrently with {self.concurrency} browser contexts")
+
+        jobs = list(self._initial_jobs)
+        sessions = [PageSession(browser) for _ in range(self.concurrency)]
+
+        try:
+            for session in sessions:
+                self._open_page(session)
+
+            for page_nums in self._page_batches():
+                batch = list(zip(sessions, page_nums))
+
+                # Start every navigation in the batch; "commit" returns as soon
+                # as the response starts, so the pages load side by side.
+                # A page that cannot be loaded ends the batch there.
+                failed_page = None
+                for session, num in batch:
+                    try:
+                        self._load_page(session, num, wait_until="commit")
+                    except RETRYABLE_ERRORS as e:
+                        failed_page = (num, e)
                         break
 
-                    page_num += 1
-                    time.sleep(2)  # Be respectful
+                # Collect results in page order
+                for session, num in batch:
+                    if failed_page and num == failed_page[0]:
+                        self._give_up(num, failed_page[1])
+                        return jobs
 
-            finally:
-                browser.close()
+                    page_jobs = self._read_page_jobs(session.page)
+                    if not page_jobs:
+                        page_jobs = self._confirm_end_of_results(session, num)
+                    if not page_jobs:
+                        self.logger.info("No more pages to scrape")
+                        return jobs
+
+                    if self._complete_page(num, self._build_page_url(num), page_jobs, jobs):
+                        return jobs
+
+        finally:
+            for session in sessions:
+                self._close_session(session)
 
-        self.logger.info(f"Total jobs scraped: {len(jobs)}")
         return jobs
 
+    def _open_page(self, session: PageSession):
+        """Open a fresh context and page for a session.
+
+        Args:
+            session: Session to (re)populate
+        """
+        session.context = session.browser.new_context()
+        session.page = session.context.new_page()
+        self._set_page_defaults(session.page)
+
+    def _close_session(self, session: PageSession):
+        """Close a session's context, ignoring browser errors.
+
+        Args:
+            session: Session to close
+        """
+        if session.page is not None:
+            self._search_responses.pop(session.page, None)
+        if session.context is not None:
+            try:
+                session.context.close()
+            except PlaywrightError as e:
+                self.logger.debug(f"Error closing context: {e}")
+        session.context = None
+        session.page = None
+
+    def _recover(self, session: PageSession, failed_attempts: int):
+        """Recreate the session's context once a page keeps failing.
+
+        Args:
+            session: Session whose page failed
+            failed_attempts: Failed attempts so far
+        """
+        if self.retrier.should_recreate_context(failed_attempts):
+            self.logger.warning("Recreating browser context after repeated failures")
+            self.retrier.context_recreations += 1
+            self._close_session(session)
+            self._open_page(session)
+
+    def _navigate(self, page: Page, url: str, wait_until: str = "domcontentloaded"):
+        """Navigate to a URL, treating server errors as failures.
+
+        Args:
+            page: Playwright page
+            url: URL to load
+            wait_until: Playwright load state to wait for
+
+        Raises:
+            PageLoadError: If the server answered 429 or 5xx
+        """
+        self.pacer.acquire()
+        response = page.goto(url, wait_until=wait_until)
+        if response is not None and (response.status == 429 or response.status >= 500):
+            raise PageLoadError(f"HTTP {response.status} for {url}")
+
+    def _load_page(self, session: PageSession, page_num: int, wait_until: str = "domcontentloaded"):
+        """Navigate a session to a results page, retrying failures.
+
+        Args:
+            session: Session to navigate
+            page_num: 1-based results page number
+            wait_until: Playwright load state to wait for
+        """
+        page_url = self._build_page_url(page_num)
+        self.logger.info(f"Navigating to page {page_num}: {page_url}")
+        self.retrier.call(
+            "navigate",
+            lambda: self._navigate(session.page, page_url, wait_until),
+            on_retry=lambda failed: self._recover(session, failed)
+        )
+
+    def _read_loaded_page(self, session: PageSession, page_num: int) -> List[Job]:
+        """Read a page that is expected to have listings, reloading it on failure.
+
+        Args:
+            session: Session showing the page
+            page_num: 1-based results page number
+
+        Returns:
+            List of Job objects (unfiltered)
+        """
+        page_url = self._build_page_url(page_num)
+        reload = False
+
+        def read():
+            if reload:
+                self._navigate(session.page, page_url)
+            return self._read_page_jobs(session.page, strict=True)
+
+        def on_retry(failed):
+            nonlocal reload
+            reload = True
+            self._recover(session, failed)
+
+        return self.retrier.call("read_page", read, on_retry=on_retry)
+
+    def _confirm_end_of_results(self, session: PageSession, page_num: int) -> List[Job]:
+        """Reload an empty page once to tell a real end of results from a hiccup.
+
+        Args:
+            session: Session showing the empty page
+            page_num: 1-based results page number
+
+        Returns:
+            Jobs found after reloading (empty at the end of results)
+        """
+        self.logger.debug(f"Page {page_num} has no listings, reloading once to confirm")
+        try:
+            self._navigate(session.page, self._build_page_url(page_num))
+        except RETRYABLE_ERRORS as e:
+            self.logger.debug(f"Reload of page {page_num} failed: {e}")
+            return []
+
+        page_jobs = self._read_page_jobs(session.page)
+        if page_jobs:
+            self.retrier.recovered["read_page"] += 1
+        return page_jobs
+
+    def _advance(self, session: PageSession, page_num: int) -> bool:
+        """Move to the next results page.
+
+        Clicks "Next"; if the click itself fails, loads the next page URL
+        directly instead of ending the scrape.
+
+        Args:
+            session: Session showing the current page
+            page_num: 1-based number of the page to move to
+
+        Returns:
+            False if there is no next page
+        """
+        try:
+            return self._goto_next_page(session.page)
+        except RETRYABLE_ERRORS as e:
+            self.logger.warning(f"Next page navigation failed ({e}), loading page {page_num} directly")
+            self._load_page(session, page_num)
+            return True
+
     def _launch_browser(self, playwright) -> Browser:
         """Launch browser instance.
 
@@ -121,75 +360,120 @@ class SeekScraper:
         timeout = self.config.get("scraper.request_timeout", 30) * 1000
         page.set_default_timeout(timeout)
 
-    def _build_search_url(self) -> str:
-        """Build search URL for HR & Recruitment classification.
-
-        Returns:
-            Search URL
-        """
-        # Seek uses a slug-based URL structure for classifications
-        # HR & Recruitment: /jobs-in-human-resources-recruitment
-        classification_slug = self.config.get(
-            "scraper.classification_slug",
-            "jobs-in-human-resources-recruitment"
-        )
-        base_url = f"{self.base_url}/{classification_slug}"
+        self.resource_blocker.attach(page)
 
-        # Build query parameters
-        params = []
+        if self.use_search_api:
+            self._capture_search_responses(page)
 
-        # Add date range filter if specified
-        # daterange=3 means "last 3 days"
-        date_range = self.config.get("scraper.date_range")
-        if date_range and date_range > 0:
-            params.append(f"daterange={date_range}")
+    def _scrape_page(self, page: Page) -> List[Job]:
+        """Scrape jobs from current page.
 
-        # Add subclassification filter if specified
-        # This filters at the source (more efficient)
-        # Example: 6323,6322,6321 (all HR subcategories except Recruitment - Agency)
-        subclassification_ids = self.config.get("scraper.subclassification_ids")
-        if subclassification_ids:
-            # URL encode the comma-separated IDs
-            from urllib.parse import quote
-            encoded_ids = quote(subclassification_ids, safe='')
-            params.append(f"subclassification={encoded_ids}")
+        Args:
+            page: Playwright page
 
-        # Combine parameters
-        if params:
-            return f"{base_url}?{'&'.join(params)}"
+        Returns:
+            List of Job objects from this page
+        """
+        return self._filter_jobs(self._read_page_jobs(page))
 
-        return base_url
+    def _read_page_jobs(self, page: Page, strict: bool = False) -> List[Job]:
+        """Read every job on the current page, before filtering.
 
-    def _scrape_page(self, page: Page) -> List[Job]:
-        """Scrape jobs from current page.
+        Uses the captured search API response when there is one and falls
+        back to reading the rendered job cards otherwise.
 
         Args:
             page: Playwright page
+            strict: Raise instead of returning an empty list when no
+                listings appear
 
         Returns:
-            List of Job objects from this page
+            List of Job objects (unfiltered)
+
+        Raises:
+            PageLoadError: In strict mode, if no listings appear
         """
-        jobs = []
+        if self.use_search_api:
+            jobs = self._extract_jobs_from_search_response(page)
+            if jobs is not None:
+                return jobs
 
         # Wait for job cards to load
         try:
-            page.wait_for_selector('[data-search-sol-meta]', timeout=10000)
+            page.wait_for_selector(JOB_CARD_SELECTOR, timeout=10000)
         except PlaywrightTimeout:
+            if strict:
+                raise PageLoadError("Timeout waiting for job listings")
             self.logger.warning("Timeout waiting for job listings")
-            return jobs
+            return []
+
+        if self.use_search_api:
+            # Client-rendered cards arrive after the search response
+            jobs = self._extract_jobs_from_search_response(page)
+            if jobs is not None:
+                return jobs
+            self.logger.debug("No search response captured, falling back to DOM extraction")
+
+        if self.extraction_mode == "elements":
+            return self._extract_jobs_by_element(page)
+        return self._extract_jobs_by_evaluate(page)
+
+    def _extract_jobs_from_search_response(self, page: Page) -> Optional[List[Job]]:
+        """Build jobs from the latest captured search API response.
+
+        Captured responses are consumed, so the next page starts fresh.
+
+        Args:
+            page: Playwright page
+
+        Returns:
+            List of Job objects (unfiltered), or None if no usable
+            response was captured
+        """
+        for response in self._take_search_responses(page):
+            try:
+                payload = response.json()
+            except Exception as e:
+                self.logger.debug(f"Could not decode search response {response.url}: {e}")
+                continue
+
+            jobs = self._jobs_from_search_payload(payload)
+            if jobs is not None:
+                return jobs
 
-        # Find all job cards
-        job_cards = page.query_selector_all('[data-search-sol-meta]')
+        return None
+
+    def _extract_jobs_by_evaluate(self, page: Page) -> List[Job]:
+        """Extract all job cards with a single in-page evaluation.
+
+        Args:
+            page: Playwright page
+
+        Returns:
+            List of Job objects (unfiltered)
+        """
+        cards = page.evaluate(EXTRACT_CARDS_SCRIPT, [JOB_CARD_SELECTOR, FIELD_SELECTORS])
+        return self._jobs_from_cards(cards)
+
+    def _extract_jobs_by_element(self, page: Page) -> List[Job]:
+        """Extract job cards one element handle at a time.
+
+        Args:
+            page: Playwright page
+
+        Returns:
+            List of Job objects (unfiltered)
+        """
+        job_cards = page.query_selector_all(JOB_CARD_SELECTOR)
 
         self.logger.debug(f"Found {len(job_cards)} job cards on page")
 
+        jobs = []
         for card in job_cards:
             try:
                 job = self._extract_job_data(card, page)
-                if job and self._should_include_job(job):
+                if job:
                     jobs.append(job)
-                elif job:
-                    self.logger.debug(f"Excluded job: {job.title} ({job.subcategory})")
             except Exception as e:
                 self.logger.error(f"Error extracting job data: {e}")
 
@@ -206,218 +490,93 @@ class SeekScraper:
             Job object or None
         """
         try:
-            # Extract title and URL - try multiple selectors
-            title_elem = (
-                card.query_selector('a[data-job-id]') or
-                card.query_selector('a[data-automation="jobTitle"]') or
-                card.query_selector('a[href*="/job/"]') or
-                card.query_selector('h3 a') or
-                card.query_selector('article a')
-            )
-
-            if not title_elem:
-                self.logger.debug("Could not find title element in card")
-                return None
-
-            title = title_elem.inner_text().strip()
-            href = title_elem.get_attribute('href')
-            if not href:
-                self.logger.debug(f"No href found for title: {title}")
-                return None
-
-            job_url = urljoin(self.base_url, href)
-
-            # Extract company - try multiple selectors
-            company_elem = (
-                card.query_selector('[data-automation="jobCompany"]') or
-                card.query_selector('[data-automation="advertiser-name"]') or
-                card.query_selector('span[data-automation*="company"]') or
-                card.query_selector('span[data-automation*="advertiser"]')
-            )
-            company = company_elem.inner_text().strip() if company_elem else "Unknown"
-
-            # Extract location - try multiple selectors
-            location_elem = (
-                card.query_selector('[data-automation="jobLocation"]') or
-                card.query_selector('[data-automation="job-location"]') or
-                card.query_selector('span[data-automation*="location"]')
-            )
-            location = location_elem.inner_text().strip() if location_elem else "Unknown"
-
-            # Extract salary - try multiple selectors
-            salary_elem = (
-                card.query_selector('[data-automation="jobSalary"]') or
-                card.query_selector('[data-automation="job-salary"]') or
-                card.query_selector('span[data-automation*="salary"]')
-            )
-            salary = salary_elem.inner_text().strip() if salary_elem else None
-
-            # Extract subcategory/classification info - try multiple selectors
-            subcategory_elem = (
-                card.query_selector('[data-automation="jobClassification"]') or
-                card.query_selector('[data-automation="job-classification"]') or
-                card.query_selector('span[data-automation*="classification"]')
-            )
-            subcategory = subcategory_elem.inner_text().strip() if subcategory_elem else "Unknown"
-
-            # Extract posted date - try multiple selectors
-            posted_elem = (
-                card.query_selector('[data-automation="jobListingDate"]') or
-                card.query_selector('[data-automation="job-listing-date"]') or
-                card.query_selector('span[data-automation*="date"]') or
-                card.query_selector('time')
-            )
-            # Set default value if posted date is not found
-            posted_date = posted_elem.inner_text().strip() if posted_elem else "Recently"
-
-            # Extract job type (Full-time, Part-time, Contract, Casual) - try multiple selectors
-            job_type_elem = (
-                card.query_selector('[data-automation="jobType"]') or
-                card.query_selector('[data-automation="job-type"]') or
-                card.query_selector('span[data-automation*="type"]') or
-                card.query_selector('[data-automation="jobCardWorkType"]')
-            )
-            job_type = job_type_elem.inner_text().strip() if job_type_elem else None
-
-            # Extract description snippet - try multiple selectors
-            description_elem = (
-                card.query_selector('[data-automation="jobShortDescription"]') or
-                card.query_selector('[data-automation="job-short-description"]') or
-                card.query_selector('p[data-automation*="description"]') or
-                card.query_selector('div[data-automation*="snippet"]')
-            )
-            description = description_elem.inner_text().strip() if description_elem else None
-
-            # If job_type is null, try to infer from description and salary
-            if job_type is None and description:
-                job_type = self._infer_job_type(description, salary)
-
-            return Job(
-                title=title,
-                company=company,
-                location=location,
-                classification=self.classification,
-                subcategory=subcategory,
-                job_url=job_url,
-                salary=salary,
-                posted_date=posted_date,
-                job_type=job_type,
-                description=description
-            )
+            fields = {}
+            for name, selectors in FIELD_SELECTORS.items():
+                elem = None
+                for selector in selectors:
+                    elem = card.query_selector(selector)
+                    if elem:
+                        break
+
+                fields[name] = elem.inner_text().strip() if elem else None
+                if name == "title":
+                    fields["href"] = elem.get_attribute('href') if elem else None
+
+            return self._build_job(fields)
 
         except Exception as e:
             self.logger.error(f"Error parsing job card: {e}")
             return None
 
-    def _infer_job_type(self, description: str, salary: str = None) -> str:
-        """Infer job type from description and salary text.
+    def _goto_next_page(self, page: Page) -> bool:
+        """Navigate to next page if available.
 
         Args:
-            description: Job description text
-            salary: Salary text (optional)
+            page: Playwright page
 
         Returns:
-            Inferred job type or None
-        """
-        if not description:
-            return None
-
-        # Combine description and salary for analysis
-        text = description.lower()
-        if salary:
-            text += " " + salary.lower()
-
-        # Check for contract/temp keywords first (highest priority)
-        contract_keywords = ['contract', 'contractor', 'temp', 'temporary', 'fixed term', 'fixed-term']
-        if any(keyword in text for keyword in contract_keywords):
-            return "Contract/Temp"
-
-        # Check for casual keywords
-        casual_keywords = ['casual', 'vacation', 'on call', 'on-call', 'relief', 'fill-in']
-        if any(keyword in text for keyword in casual_keywords):
-            return "Casual"
-
-        # Check for part-time keywords
-        part_time_keywords = ['part time', 'part-time', 'p/t', 'pt ', 'parttime']
-        if any(keyword in text for keyword in part_time_keywords):
-            return "Part-time"
-
-        # Check for full-time keywords
-        full_time_keywords = ['full time', 'full-time', 'f/t', 'ft ', 'fulltime', 'permanent', 'ongoing']
-        if any(keyword in text for keyword in full_time_keywords):
-            return "Full-time"
-
-        # Default to Full-time if no specific type is mentioned (most common)
-        return "Full-time"
-
-    def _should_include_job(self, job: Job) -> bool:
-        """Check if job should be included based on filters.
-
-        Args:
-            job: Job object
+            True if navigation succeeded, False if there is no next page
 
-        Returns:
-            True if job should be included
+        Raises:
+            playwright Error: If the button was found but navigation failed
         """
-        # Check if subcategory is in excluded list
-        for excluded in self.excluded_subcategories:
-            if excluded.lower() in job.subcategory.lower():
-                self.logger.debug(f"Excluded by subcategory '{excluded}': {job.title}")
-                return False
-
-        # Check if company name contains BOTH "recruitment" AND "agency" (case-insensitive)
-        company_lower = job.company.lower()
-        if "recruitment" in company_lower and "agency" in company_lower:
-            self.logger.debug(f"Excluded by keyword filter (recruitment + agency): {job.title} at {job.company}")
-            return False
-
-        # Check if company is in excluded list (case-insensitive partial match)
-        for excluded_company in self.excluded_companies:
-            if excluded_company.lower() in job.company.lower():
-                self.logger.debug(f"Excluded by company '{excluded_company}': {job.title} at {job.company}")
-                return False
-
-        return True
-
-    def _goto_next_page(self, page: Page) -> bool:
-        """Navigate to next page if available.
+        # Look for next page button with multiple selectors
+        for selector in NEXT_PAGE_SELECTORS:
+            self.logger.debug(f"Trying selector: {selector}")
+            next_button = page.query_selector(selector)
+
+            if next_button:
+                self.logger.debug(f"Found next button with selector: {selector}")
+                is_visible = next_button.is_visible()
+                self.logger.debug(f"Button visible: {is_visible}")
+
+                if is_visible:
+                    signature = page.evaluate(CARDS_SIGNATURE_SCRIPT, JOB_CARD_SELECTOR)
+                    # Drop responses left over from the current page
+                    self._search_responses.get(page, []).clear()
+                    self.pacer.acquire()
+                    self.logger.info(f"Clicking next page button")
+                    next_button.click()
+                    self._wait_for_page_change(page, signature)
+                    return True
+
+        self.logger.debug("No next page button found with any selector")
+        return False
+
+    def _wait_for_page_change(self, page: Page, signature: Optional[str]) -> str:
+        """Wait until the next results page is ready after clicking "Next".
+
+        Returns as soon as one readiness signal fires: a new search API
+        response is captured, or the set of job cards differs from
+        ``signature``. If neither happens within scraper.ready_timeout, waits
+        for a network-idle window instead.
 
         Args:
             page: Playwright page
+            signature: Card signature taken before navigating
 
         Returns:
-            True if navigation succeeded
+            Name of the signal that fired
         """
-        try:
-            # Look for next page button with multiple selectors
-            selectors = [
-                'a[data-automation="page-next"]',
-                'a[aria-label="Next"]',
-                'nav[data-automation="pagination"] a:has-text("Next")',
-                'button:has-text("Next")',
-                'a.next',
-                '[rel="next"]'
-            ]
-
-            for selector in selectors:
-                self.logger.debug(f"Trying selector: {selector}")
-                next_button = page.query_selector(selector)
-
-                if next_button:
-                    self.logger.debug(f"Found next button with selector: {selector}")
-                    is_visible = next_button.is_visible()
-                    self.logger.debug(f"Button visible: {is_visible}")
-
-                    if is_visible:
-                        self.logger.info(f"Clicking next page button")
-                        next_button.click()
-                        page.wait_for_load_state("domcontentloaded")
-                        time.sleep(2)  # Wait for new content to load
-                        return True
-
-            self.logger.debug("No next page button found with any selector")
-            return False
+        deadline = time.monotonic() + self.ready_timeout
+        poll_ms = 250
 
-        except Exception as e:
-            self.logger.error(f"Error navigating to next page: {e}")
-            return False
+        while time.monotonic() < deadline:
+            if self._search_responses.get(page):
+                return "search_response"
+            try:
+                page.wait_for_function(
+                    CARDS_CHANGED_SCRIPT,
+                    arg=[JOB_CARD_SELECTOR, signature],
+                    timeout=poll_ms
+                )
+                return "cards_changed"
+            except PlaywrightTimeout:
+                continue
+
+        self.logger.debug("No readiness signal, waiting for network idle")
+        try:
+            page.wait_for_load_state("networkidle", timeout=self.ready_timeout * 1000)
+        except PlaywrightTimeout:
+            self.logger.warning("Timeout waiting for next page to settle")
+        return "network_idle"
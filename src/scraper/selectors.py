@@ -0,0 +1,117 @@
+"""CSS selectors and in-page scripts for Seek search results."""
+
+# Selector matching every job card on a results page
+JOB_CARD_SELECTOR = '[data-search-sol-meta]'
+
+# Selectors for the "Next" pagination link, tried in order
+NEXT_PAGE_SELECTORS = [
+    'a[data-automation="page-next"]',
+    'a[aria-label="Next"]',
+    'nav[data-automation="pagination"] a:has-text("Next")',
+    'button:has-text("Next")',
+    'a.next',
+    '[rel="next"]',
+]
+
+# Fallback selector chains for each card field, tried in order
+FIELD_SELECTORS = {
+    "title": [
+        'a[data-job-id]',
+        'a[data-automation="jobTitle"]',
+        'a[href*="/job/"]',
+        'h3 a',
+        'article a',
+    ],
+    "company": [
+        '[data-automation="jobCompany"]',
+        '[data-automation="advertiser-name"]',
+        'span[data-automation*="company"]',
+        'span[data-automation*="advertiser"]',
+    ],
+    "location": [
+        '[data-automation="jobLocation"]',
+        '[data-automation="job-location"]',
+        'span[data-automation*="location"]',
+    ],
+    "salary": [
+        '[data-automation="jobSalary"]',
+        '[data-automation="job-salary"]',
+        'span[data-automation*="salary"]',
+    ],
+    "subcategory": [
+        '[data-automation="jobClassification"]',
+        '[data-automation="job-classification"]',
+        'span[data-automation*="classification"]',
+    ],
+    "posted_date": [
+        '[data-automation="jobListingDate"]',
+        '[data-automation="job-listing-date"]',
+        'span[data-automation*="date"]',
+        'time',
+    ],
+    "job_type": [
+        '[data-automation="jobType"]',
+        '[data-automation="job-type"]',
+        'span[data-automation*="type"]',
+        '[data-automation="jobCardWorkType"]',
+    ],
+    "description": [
+        '[data-automation="jobShortDescription"]',
+        '[data-automation="job-short-description"]',
+        'p[data-automation*="description"]',
+        'div[data-automation*="snippet"]',
+    ],
+}
+
+# Extracts every card on the page in a single evaluation.
+# Called with [card_selector, field_selectors]; returns one object per card
+# mapping field name -> trimmed text (or null), plus "href" for the title link.
+EXTRACT_CARDS_SCRIPT = """
+([cardSelector, fieldSelectors]) => {
+    const first = (card, selectors) => {
+        for (const selector of selectors) {
+            const el = card.querySelector(selector);
+            if (el) return el;
+        }
+        return null;
+    };
+    return Array.from(document.querySelectorAll(cardSelector)).map((card) => {
+        const fields = {};
+        for (const [name, selectors] of Object.entries(fieldSelectors)) {
+            const el = first(card, selectors);
+            fields[name] = el ? el.innerText.trim() : null;
+            if (name === "title") {
+                fields.href = el ? el.getAttribute("href") : null;
+            }
+        }
+        return fields;
+    });
+}
+"""
+
+# Returns a string identifying the job cards currently on the page (or null
+# when there are none). Called with the card selector.
+CARDS_SIGNATURE_SCRIPT = """
+(cardSelector) => {
+    const cards = Array.from(document.querySelectorAll(cardSelector));
+    if (!cards.length) return null;
+    return cards.map((card) => {
+        const link = card.querySelector('a[href*="/job/"]');
+        return link ? link.getAttribute("href") : card.textContent.slice(0, 100);
+    }).join("|");
+}
+"""
+
+# Truthy once the page has job cards whose signature differs from the one
+# passed in. Called with [card_selector, previous_signature].
+CARDS_CHANGED_SCRIPT = """
+([cardSelector, previous]) => {
+    const cards = Array.from(document.querySelectorAll(cardSelector));
+    if (!cards.length) return false;
+    const current = cards.map((card) => {
+        const link = card.querySelector('a[href*="/job/"]');
+        return link ? link.getAttribute("href") : card.textContent.slice(0, 100);
+    }).join("|");
+    return current !== previous;
+}
+"""
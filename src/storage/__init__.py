@@ -2,6 +2,16 @@
 
 from .base_storage import BaseStorage
 from .json_storage import JSONStorage
+from .jsonl_storage import JSONLStorage
+from .partitioned_storage import PartitionedStorage
 from .csv_storage import CSVStorage
+from .seen_index import SeenIndex, seen_index_from_config
+from .compact_seen_index import CompactSeenIndex
+from .sqlite_storage import SQLiteStorage
+from .factory import storage_from_config
 
-__all__ = ["BaseStorage", "JSONStorage", "CSVStorage"]
+__all__ = [
+    "BaseStorage", "JSONStorage", "JSONLStorage", "PartitionedStorage",
+    "CSVStorage", "SQLiteStorage",
+    "SeenIndex", "CompactSeenIndex", "seen_index_from_config", "storage_from_config"
+]
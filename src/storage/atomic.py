@@ -0,0 +1,222 @@
+"""Crash-safe file replacement and advisory inter-process locks."""
+
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# Seconds to wait for another writer before giving up
+DEFAULT_LOCK_TIMEOUT = 60.0
+
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "w", encoding: Optional[str] = "utf-8", newline: Optional[str] = None):
+    """Write a file so readers see either the old or the new content.
+
+    Yields a temporary file in the same directory. When the block exits
+    without an error the file is flushed and fsynced, renamed over
+    ``path`` and the directory entry is fsynced. On error the temporary
+    file is removed and ``path`` is left untouched.
+
+    Args:
+        path: File to replace
+        mode: "w" for text or "wb" for binary
+        encoding: Text encoding (ignored for binary mode)
+        newline: Newline translation, as for open()
+
+    Yields:
+        Open file object
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp"
+    existing_mode = path.stat().st_mode & 0o777 if path.exists() else None
+    # New files get 0666 less the umask, as with open()
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+
+    try:
+        if existing_mode is not None:
+            os.chmod(tmp_path, existing_mode)
+        if "b" in mode:
+            f = os.fdopen(fd, mode)
+        else:
+            f = os.fdopen(fd, mode, encoding=encoding, newline=newline)
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    fsync_dir(path.parent)
+
+
+def ends_mid_line(path: Path) -> bool:
+    """Whether a line-oriented file's last line is missing its newline.
+
+    Appenders check this to avoid gluing a record onto a line cut short
+    by a crash.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return False
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def fsync_dir(path: Path) -> None:
+    """Persist a directory entry change such as a rename (POSIX only)."""
+    if fcntl is None:
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class FileLock:
+    """Advisory exclusive lock on a lock file, shared by processes and threads.
+
+    Holds ``flock`` (``msvcrt.locking`` on Windows) on a sidecar lock file
+    so the cron scraper and the API server take turns on the same data
+    file, plus a thread lock so threads in one process do too. The lock is
+    re-entrant for the thread holding it. Readers do not lock: writers only
+    ever replace files atomically or append whole records.
+
+    Use ``file_lock`` to get the shared instance for a path.
+    """
+
+    def __init__(self, lock_path: Path, timeout: Optional[float] = DEFAULT_LOCK_TIMEOUT):
+        """Initialize the lock.
+
+        Args:
+            lock_path: Lock file to create and lock
+            timeout: Seconds to wait for the lock (None waits forever)
+        """
+        self.lock_path = Path(lock_path)
+        self.timeout = timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Take the lock, waiting up to ``timeout`` seconds.
+
+        Raises:
+            TimeoutError: If another writer held the lock for too long
+        """
+        if not self._thread_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+            raise TimeoutError(f"Timed out waiting for {self.lock_path}")
+
+        try:
+            if self._depth == 0:
+                self._fd = self._lock_file()
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._depth += 1
+
+    def release(self) -> None:
+        """Release one level of the lock."""
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    def remove(self) -> None:
+        """Delete the lock file; call while holding the lock.
+
+        For data files that go away (such as a finished scrape's
+        checkpoint), so their lock files do not pile up. A process waiting
+        on the deleted file finds it unlinked once it gets the lock and
+        retries on a fresh one, so two writers never hold it at once.
+        Windows cannot delete an open file, so there it is kept.
+        """
+        if fcntl is not None:
+            self.lock_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    def _lock_file(self) -> int:
+        """Open the lock file and lock it against other processes."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                if fcntl is None or self._is_current(fd):
+                    return fd
+                # Removed by the previous holder; lock the file now at the path
+                os.close(fd)
+                fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                continue
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"Timed out waiting for {self.lock_path}")
+                time.sleep(0.05)
+
+    def _is_current(self, fd: int) -> bool:
+        """Whether ``fd`` is still the file at ``lock_path`` (not removed)."""
+        try:
+            stat = os.stat(self.lock_path)
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(fd)
+        return (stat.st_dev, stat.st_ino) == (opened.st_dev, opened.st_ino)
+
+
+_locks: Dict[str, FileLock] = {}
+_locks_guard = threading.Lock()
+
+
+def file_lock(path: Path, timeout: Optional[float] = DEFAULT_LOCK_TIMEOUT) -> FileLock:
+    """Return the process-wide lock guarding a data file.
+
+    Storage objects are created per request, so the lock is shared by
+    path rather than owned by an instance.
+
+    Args:
+        path: Data file to guard
+        timeout: Seconds to wait for the lock (None waits forever)
+
+    Returns:
+        FileLock on ``<path>.lock``
+    """
+    lock_path = os.path.abspath(f"{path}.lock")
+    with _locks_guard:
+        lock = _locks.get(lock_path)
+        if lock is None:
+            lock = _locks[lock_path] = FileLock(lock_path, timeout)
+        return lock
@@ -1,7 +1,11 @@
 """Base storage interface."""
 
+import heapq
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
 from ..models import Job
 
@@ -38,3 +42,163 @@ class BaseStorage(ABC):
             True if job exists
         """
         pass
+
+    def contains_many(self, jobs: List[Job]) -> List[bool]:
+        """Check a batch of jobs against storage.
+
+        Backends with an in-memory index should override this; the default
+        calls ``exists`` once per job.
+
+        Args:
+            jobs: Jobs to check
+
+        Returns:
+            One flag per job, True if it exists
+        """
+        return [self.exists(job) for job in jobs]
+
+    def data_files(self) -> List[Path]:
+        """Files whose modification time and size change on every write.
+
+        Readers that cache jobs in memory (the API job repository) stat
+        these to decide when to reload. The default is none, meaning
+        changes cannot be detected.
+
+        Returns:
+            List of file paths
+        """
+        return []
+
+    def tail_position(self) -> Optional[Any]:
+        """Mark the end of the records stored so far, for ``read_tail``.
+
+        Append-only backends override this; the default None means the
+        backend rewrites its files and readers must ``load`` them whole.
+
+        Returns:
+            Opaque marker, or None
+        """
+        return None
+
+    def read_tail(self, position: Any) -> Optional[Tuple[List[Job], Any]]:
+        """Read the records appended after a ``tail_position`` marker.
+
+        Records come in write order, so a later record of a job ID
+        supersedes an earlier one. Records written while the marker was
+        taken may be returned again.
+
+        Args:
+            position: Marker from ``tail_position`` or a previous call
+
+        Returns:
+            Tuple of (appended jobs, marker for the next call), or None if
+            the files were rewritten since (compaction, cleanup) and only a
+            full ``load`` is current
+        """
+        return None
+
+    def iter_jobs(
+        self,
+        filter: Optional[Callable[[Job], bool]] = None,
+        since: Optional[Union[str, datetime]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Job]:
+        """Stream stored jobs one at a time.
+
+        Callers can stop early, and backends that override ``_stream_jobs``
+        never hold the whole database in memory.
+
+        Args:
+            filter: Keep only jobs for which this returns True
+            since: Keep only jobs scraped at or after this time
+            limit: Stop after this many jobs
+
+        Yields:
+            Job objects in storage order
+        """
+        jobs = self._stream_jobs(since=self._since_key(since))
+        if filter is not None:
+            jobs = (job for job in jobs if filter(job))
+        if limit is not None:
+            jobs = islice(jobs, limit)
+        return jobs
+
+    def _stream_jobs(self, since: Optional[str] = None) -> Iterator[Job]:
+        """Yield stored jobs scraped at or after ``since``.
+
+        The default iterates ``load()``; backends should override it to
+        parse incrementally.
+
+        Args:
+            since: ISO timestamp lower bound, or None for all jobs
+        """
+        for job in self.load():
+            if since is None or job.scraped_at >= since:
+                yield job
+
+    @staticmethod
+    def _since_key(since: Optional[Union[str, datetime]]) -> Optional[str]:
+        """Normalize a ``since`` bound to an ISO timestamp string."""
+        if isinstance(since, datetime):
+            return since.isoformat()
+        return since
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Look up a job by its canonical ID.
+
+        The default scans ``iter_jobs()`` and stops at the first match;
+        indexed backends should override it.
+
+        Args:
+            job_id: Canonical job ID
+
+        Returns:
+            Job, or None if not stored
+        """
+        return next(self.iter_jobs(filter=lambda job: job.job_id == job_id, limit=1), None)
+
+    def query_jobs(
+        self,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[str] = None
+    ) -> Tuple[int, List[Job]]:
+        """Filter jobs by substring and return one page, newest first.
+
+        The default streams ``iter_jobs()`` and keeps only the newest
+        offset + limit matches in memory; indexed backends should
+        override it.
+
+        Args:
+            company: Case-insensitive substring of the company name
+            location: Case-insensitive substring of the location
+            limit: Maximum number of jobs to return (None = all)
+            offset: Number of matching jobs to skip
+            since: ISO timestamp; only jobs scraped at or after it
+
+        Returns:
+            Tuple of (total matching jobs, jobs in the requested page)
+        """
+        company = company.lower() if company else None
+        location = location.lower() if location else None
+        total = 0
+
+        def matches(job: Job) -> bool:
+            nonlocal total
+            if company and company not in job.company.lower():
+                return False
+            if location and location not in job.location.lower():
+                return False
+            total += 1
+            return True
+
+        jobs = self.iter_jobs(filter=matches, since=since)
+        newest = lambda x: x.scraped_at
+        if limit is None:
+            page = sorted(jobs, key=newest, reverse=True)[offset:]
+        else:
+            page = heapq.nlargest(offset + limit, jobs, key=newest)[offset:]
+
+        return total, page
@@ -0,0 +1,305 @@
+"""Compact seen-jobs index for long retention windows."""
+
+import hashlib
+import json
+import logging
+import math
+import struct
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..models import Job
+from .atomic import atomic_write, file_lock
+from .retention import retention_cutoff
+from .seen_index import canonicalize_seen_jobs
+
+
+# File layout: header, sorted uint64 hashes, uint32 timestamps (parallel to
+# the hashes), then the Bloom filter bits. Native byte order.
+MAGIC = b"SEENIDX1"
+HEADER = struct.Struct("=8sQQB")
+
+
+def hash_job_id(job_id: str) -> int:
+    """Return a 64-bit hash of a canonical job ID."""
+    return int.from_bytes(hashlib.blake2b(job_id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit hashes.
+
+    Bit positions come from double hashing the two 32-bit halves of the
+    hash, so no extra hashing is needed per lookup.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, bits: bytearray = None):
+        """Initialize the filter.
+
+        Args:
+            num_bits: Size of the bit array
+            num_hashes: Bit positions set per item
+            bits: Existing bit array to reuse
+        """
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, num_hashes)
+        self.bits = bits if bits is not None else bytearray((self.num_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, fp_rate: float) -> "BloomFilter":
+        """Size a filter for capacity items at the given false-positive rate."""
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))
+        num_hashes = round(num_bits / capacity * math.log(2))
+        return cls(num_bits, num_hashes)
+
+    def _positions(self, value: int):
+        h1 = value & 0xFFFFFFFF
+        h2 = (value >> 32) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, value: int) -> None:
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: int) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class CompactSeenIndex:
+    """Seen-jobs index stored as sorted 64-bit hashes with packed timestamps.
+
+    Drop-in replacement for SeenIndex when retention runs to months or
+    years: each job costs 12 bytes (hash + epoch seconds) instead of a JSON
+    URL/ISO-timestamp pair and its Python dict entry. Lookups binary-search
+    the sorted hash array. With ``bloom_fp_rate`` set, a Bloom filter
+    stored alongside answers most lookups for unseen jobs without the
+    search; a Bloom hit is always confirmed against the array, so results
+    stay exact. As with SeenIndex, ``flush`` holds the file's lock and
+    merges entries written by another process since this one loaded.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        retention_days: int = 30,
+        bloom_fp_rate: Optional[float] = None,
+        legacy_path: Optional[Path] = None,
+        logger: logging.Logger = None
+    ):
+        """Initialize the index.
+
+        Args:
+            path: Path to the binary index file
+            retention_days: Number of days to keep entries on flush
+            bloom_fp_rate: Target Bloom filter false-positive rate, or None
+                to skip the filter
+            legacy_path: JSON seen jobs file to import when the index file
+                does not exist yet
+            logger: Logger instance
+        """
+        self.path = Path(path)
+        self.retention_days = retention_days
+        self.bloom_fp_rate = bloom_fp_rate
+        self.legacy_path = Path(legacy_path) if legacy_path else None
+        self.logger = logger or logging.getLogger(__name__)
+        self._hashes: Optional[array] = None
+        self._timestamps: Optional[array] = None
+        self._bloom: Optional[BloomFilter] = None
+        self._pending: Dict[int, int] = {}
+        self._oldest: Optional[int] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        pending_new = sum(1 for value in self._pending if not self._in_array(value))
+        return len(self._hashes) + pending_new
+
+    def __contains__(self, job_id: str) -> bool:
+        return self._contains_hash(hash_job_id(job_id))
+
+    def contains(self, job: Job) -> bool:
+        """Check whether a job was seen before.
+
+        Args:
+            job: Job to check
+
+        Returns:
+            True if the job's ID is in the index
+        """
+        return self._contains_hash(hash_job_id(job.job_id))
+
+    def contains_many(self, jobs: Iterable[Job]) -> List[bool]:
+        """Check a batch of jobs against the index.
+
+        Args:
+            jobs: Jobs to check
+
+        Returns:
+            One flag per job, True if it was seen before
+        """
+        self._ensure_loaded()
+        return [self._contains_hash(hash_job_id(job.job_id)) for job in jobs]
+
+    def add(self, jobs: Iterable[Job], timestamp: str = None) -> None:
+        """Mark jobs as seen. Nothing is written until ``flush``.
+
+        Args:
+            jobs: Jobs to record
+            timestamp: ISO timestamp to record (defaults to now)
+        """
+        self._ensure_loaded()
+        seconds = self._to_seconds(timestamp or datetime.now().isoformat())
+        for job in jobs:
+            self._pending[hash_job_id(job.job_id)] = seconds
+
+    def flush(self) -> None:
+        """Merge pending jobs, drop expired entries and rewrite the file.
+
+        The file is left alone only when nothing is pending and the oldest
+        entry is still within retention, so quiet runs keep expiring hashes.
+        """
+        self._ensure_loaded()
+        if not self._pending and not self._has_expired():
+            return
+
+        with file_lock(self.path):
+            if self._file_stamp() != self._stamp:
+                # Another writer flushed since we loaded: merge into its copy
+                self._read()
+                if not self._pending and not self._has_expired():
+                    return
+
+            cutoff = self._to_seconds(retention_cutoff(self.retention_days))
+            merged = {
+                value: seconds
+                for value, seconds in zip(self._hashes, self._timestamps)
+                if seconds > cutoff
+            }
+            for value, seconds in self._pending.items():
+                merged[value] = max(seconds, merged.get(value, 0))
+            self._pending = {}
+
+            ordered = sorted(merged)
+            self._hashes = array("Q", ordered)
+            self._timestamps = array("I", (merged[value] for value in ordered))
+            self._oldest = min(self._timestamps) if self._timestamps else None
+            self._bloom = self._build_bloom(self._hashes)
+            self._write()
+
+        self.logger.debug(f"Updated seen jobs. Total tracked: {len(self._hashes)}")
+
+    def reload(self) -> None:
+        """Discard the in-memory copy so the next access re-reads the file."""
+        self._hashes = None
+        self._timestamps = None
+        self._bloom = None
+        self._pending = {}
+        self._oldest = None
+        self._stamp = None
+
+    def _has_expired(self) -> bool:
+        """Whether the oldest stored entry is past the retention cutoff."""
+        return self._oldest is not None and self._oldest <= self._to_seconds(retention_cutoff(self.retention_days))
+
+    def _contains_hash(self, value: int) -> bool:
+        self._ensure_loaded()
+        if value in self._pending:
+            return True
+        if self._bloom is not None and value not in self._bloom:
+            return False
+        return self._in_array(value)
+
+    def _in_array(self, value: int) -> bool:
+        pos = bisect_left(self._hashes, value)
+        return pos < len(self._hashes) and self._hashes[pos] == value
+
+    def _ensure_loaded(self) -> None:
+        if self._hashes is None:
+            self._load()
+
+    def _load(self) -> None:
+        """Read the index file, importing the legacy JSON file on first use."""
+        if not self.path.exists():
+            self._hashes = array("Q")
+            self._timestamps = array("I")
+            self._bloom = None
+            if self.legacy_path and self.legacy_path.exists():
+                self._import_legacy()
+            return
+
+        self._read()
+
+    def _read(self) -> None:
+        """Read the hash and timestamp arrays (and Bloom filter) from the file."""
+        self._hashes = array("Q")
+        self._timestamps = array("I")
+        self._bloom = None
+        self._stamp = self._file_stamp()
+        if self._stamp is None:
+            return
+
+        with open(self.path, "rb") as f:
+            magic, count, num_bits, num_hashes = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"Not a seen jobs index: {self.path}")
+            self._hashes.fromfile(f, count)
+            self._timestamps.fromfile(f, count)
+            if num_bits and self.bloom_fp_rate:
+                self._bloom = BloomFilter(num_bits, num_hashes, bytearray(f.read((num_bits + 7) // 8)))
+        self._oldest = min(self._timestamps) if self._timestamps else None
+
+        if self.bloom_fp_rate and self._bloom is None:
+            self._bloom = self._build_bloom(self._hashes)
+
+    def _import_legacy(self) -> None:
+        """Seed the index from a JSON seen jobs file."""
+        with open(self.legacy_path, "r", encoding="utf-8") as f:
+            seen_jobs = canonicalize_seen_jobs(json.load(f))
+
+        for job_id, timestamp in seen_jobs.items():
+            self._pending[hash_job_id(job_id)] = self._to_seconds(timestamp)
+
+        self.logger.info(f"Importing {len(seen_jobs)} seen jobs from {self.legacy_path}")
+        self.flush()
+
+    def _build_bloom(self, hashes: array) -> Optional[BloomFilter]:
+        if not self.bloom_fp_rate:
+            return None
+        # Leave headroom so jobs added before the next flush stay accurate
+        bloom = BloomFilter.for_capacity(int(len(hashes) * 1.25) + 1024, self.bloom_fp_rate)
+        for value in hashes:
+            bloom.add(value)
+        return bloom
+
+    def _write(self) -> None:
+        """Write the index to a temporary file and swap it in."""
+        bloom = self._bloom
+        with atomic_write(self.path, "wb") as f:
+            f.write(HEADER.pack(
+                MAGIC,
+                len(self._hashes),
+                bloom.num_bits if bloom else 0,
+                bloom.num_hashes if bloom else 0
+            ))
+            self._hashes.tofile(f)
+            self._timestamps.tofile(f)
+            if bloom:
+                f.write(bloom.bits)
+        self._stamp = self._file_stamp()
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Modification time and size of the file, or None if missing."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _to_seconds(timestamp: str) -> int:
+        return int(datetime.fromisoformat(timestamp).timestamp())
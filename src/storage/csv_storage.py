@@ -1,31 +1,68 @@
 """CSV file storage backend."""
 
 import csv
+import io
 import logging
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set
 
 from ..models import Job
+from .atomic import atomic_write, file_lock
 from .base_storage import BaseStorage
+from .expiry import ExpiryIndex, SegmentBuilder
+from .retention import retention_cutoff
+
+
+FIELDNAMES = [
+    "title",
+    "company",
+    "location",
+    "classification",
+    "subcategory",
+    "job_url",
+    "salary",
+    "posted_date",
+    "job_type",
+    "description",
+    "scraped_at"
+]
 
 
 class CSVStorage(BaseStorage):
-    """CSV file-based storage."""
+    """CSV file-based storage.
 
-    def __init__(self, output_path: Path):
+    Jobs are appended to the file, which keeps a single header row. A side
+    index (``<file>.ids``, one job ID per line) is read once per instance to
+    answer ``exists``/``contains_many`` from a set; it is rebuilt from the
+    CSV whenever it is missing or older than the CSV. Writers hold the
+    CSV's lock and re-read the index if another writer changed it. An
+    ExpiryIndex segment list (``<file>.expiry``) extended on every append
+    lets retention skip the file when nothing expired and otherwise decode
+    only the segments straddling the cutoff.
+    """
+
+    def __init__(self, output_path: Path, retention_days: Optional[int] = None):
         """Initialize CSV storage.
 
         Args:
             output_path: Path to output CSV file
+            retention_days: Number of days cleanup_old_jobs keeps jobs for
+                (None keeps everything)
         """
         self.output_path = output_path
+        self.retention_days = retention_days
+        self.index_path = output_path.with_suffix(output_path.suffix + ".ids")
         self.logger = logging.getLogger(__name__)
+        self.lock = file_lock(output_path)
+        self.expiry = ExpiryIndex(output_path, self.logger)
+        self._job_ids: Optional[Set[str]] = None
+        self._index_size: Optional[int] = None
 
         # Ensure directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
     def save(self, jobs: List[Job]) -> None:
-        """Save jobs to CSV file.
+        """Append jobs to the CSV file, skipping job IDs already stored.
 
         Args:
             jobs: List of Job objects to save
@@ -34,27 +71,44 @@ class CSVStorage(BaseStorage):
             self.logger.warning("No jobs to save")
             return
 
-        fieldnames = [
-            "title",
-            "company",
-            "location",
-            "classification",
-            "subcategory",
-            "job_url",
-            "salary",
-            "posted_date",
-            "description",
-            "scraped_at"
-        ]
-
-        with open(self.output_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
+        with self.lock:
+            self._upgrade_header()
+            if self._index_size != self._file_size(self.index_path):
+                # Another writer appended since we read the index
+                self._job_ids = None
+            job_ids = self.job_ids
+            new_jobs = []
             for job in jobs:
-                writer.writerow(job.to_dict())
+                if job.job_id not in job_ids:
+                    job_ids.add(job.job_id)
+                    new_jobs.append(job)
+
+            size = self._file_size(self.output_path) or 0
+            # Extend the segment list only if it describes the file as it is
+            segments = [] if size == 0 else self.expiry.load()
+            builder = SegmentBuilder()
+            with open(self.output_path, "ab") as f:
+                pos = size
+                if size == 0:
+                    pos += f.write(self._encode_row(dict(zip(FIELDNAMES, FIELDNAMES))))
+                for job in new_jobs:
+                    row = self._encode_row(job.to_dict())
+                    builder.add(pos, pos + len(row), job.scraped_at)
+                    pos += f.write(row)
+
+            if segments is not None:
+                self.expiry.save(segments + builder.segments)
 
-        self.logger.info(f"Saved {len(jobs)} jobs to {self.output_path}")
+            # Written after the CSV so the index is never older than the rows it covers
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.writelines(f"{job.job_id}\n" for job in new_jobs)
+            self._index_size = self._file_size(self.index_path)
+
+        self.logger.info(f"Saved {len(new_jobs)} jobs to {self.output_path}")
+
+    def data_files(self) -> List[Path]:
+        """The CSV file."""
+        return [self.output_path]
 
     def load(self) -> List[Job]:
         """Load jobs from CSV file.
@@ -62,16 +116,25 @@ class CSVStorage(BaseStorage):
         Returns:
             List of Job objects
         """
+        return list(self._stream_jobs())
+
+    def _stream_jobs(self, since: Optional[str] = None) -> Iterator[Job]:
+        """Read the CSV file one row at a time.
+
+        Args:
+            since: ISO timestamp lower bound, or None for all jobs
+
+        Yields:
+            Job objects in file order
+        """
         if not self.output_path.exists():
-            return []
+            return
 
-        jobs = []
-        with open(self.output_path, "r", encoding="utf-8") as f:
+        with open(self.output_path, "r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             for row in reader:
-                jobs.append(Job.from_dict(row))
-
-        return jobs
+                if since is None or row["scraped_at"] >= since:
+                    yield Job.from_dict(row)
 
     def exists(self, job: Job) -> bool:
         """Check if job already exists in CSV.
@@ -82,5 +145,153 @@ class CSVStorage(BaseStorage):
         Returns:
             True if job exists
         """
-        existing_jobs = self.load()
-        return job in existing_jobs
+        return job.job_id in self.job_ids
+
+    def contains_many(self, jobs: List[Job]) -> List[bool]:
+        """Check a batch of jobs against the job ID index.
+
+        Args:
+            jobs: Jobs to check
+
+        Returns:
+            One flag per job, True if it exists
+        """
+        job_ids = self.job_ids
+        return [job.job_id in job_ids for job in jobs]
+
+    def cleanup_old_jobs(self) -> int:
+        """Remove jobs older than retention_days from the CSV file.
+
+        A run with nothing expired reads only the expiry sidecar. Otherwise
+        wholly expired segments are dropped, wholly recent ones copied as
+        raw bytes and only segments straddling the cutoff are parsed; a
+        file without a valid sidecar is rewritten row by row once, which
+        rebuilds it.
+
+        Returns:
+            Number of jobs removed
+        """
+        if self.retention_days is None or not self.output_path.exists():
+            return 0
+
+        cutoff = retention_cutoff(self.retention_days)
+        segments = self.expiry.load()
+        if segments is not None and not self._has_expired(segments, cutoff):
+            return 0
+
+        removed_count = 0
+        with self.lock:
+            self._upgrade_header()
+            segments = self.expiry.load()
+            if segments is not None and not self._has_expired(segments, cutoff):
+                return 0
+
+            builder = SegmentBuilder()
+            with open(self.output_path, "rb") as src, atomic_write(self.output_path, "wb") as dst:
+                pos = dst.write(self._encode_row(dict(zip(FIELDNAMES, FIELDNAMES))))
+
+                def emit(row: Dict[str, str]) -> None:
+                    nonlocal pos, removed_count
+                    if row["scraped_at"] <= cutoff:
+                        removed_count += 1
+                        return
+                    raw = self._encode_row(row)
+                    builder.add(pos, pos + len(raw), row["scraped_at"])
+                    pos += dst.write(raw)
+
+                if segments is None:
+                    for row in csv.DictReader(io.TextIOWrapper(src, encoding="utf-8", newline="")):
+                        emit(row)
+                else:
+                    for segment in segments:
+                        start, end, oldest, newest, size = segment
+                        if newest <= cutoff:
+                            removed_count += size
+                            continue
+                        src.seek(start)
+                        raw = src.read(end - start)
+                        if oldest > cutoff:
+                            builder.copy(pos, pos + len(raw), segment)
+                            pos += dst.write(raw)
+                            continue
+                        text = io.StringIO(raw.decode("utf-8"), newline="")
+                        for row in csv.DictReader(text, fieldnames=FIELDNAMES):
+                            emit(row)
+
+            self.expiry.save(builder.segments)
+
+            # Rebuilt from the CSV on next use
+            self.index_path.unlink(missing_ok=True)
+            self._job_ids = None
+
+        self.logger.info(f"Cleaned up {removed_count} jobs older than {self.retention_days} days")
+
+        return removed_count
+
+    @staticmethod
+    def _has_expired(segments: List[list], cutoff: str) -> bool:
+        oldest = ExpiryIndex.oldest(segments)
+        return oldest is not None and oldest <= cutoff
+
+    @staticmethod
+    def _encode_row(row: Dict[str, str]) -> bytes:
+        """One CSV row (FIELDNAMES order) as written to the file."""
+        buffer = io.StringIO()
+        csv.DictWriter(buffer, fieldnames=FIELDNAMES, extrasaction="ignore").writerow(row)
+        return buffer.getvalue().encode("utf-8")
+
+    @property
+    def job_ids(self) -> Set[str]:
+        """IDs of all stored jobs, loaded once from the side index."""
+        if self._job_ids is None:
+            self._job_ids = self._load_index()
+        return self._job_ids
+
+    def _load_index(self) -> Set[str]:
+        """Read the side index, rebuilding it if it is missing or stale."""
+        if not self.output_path.exists():
+            return set()
+
+        if self.index_path.exists() and self.index_path.stat().st_mtime >= self.output_path.stat().st_mtime:
+            self._index_size = self._file_size(self.index_path)
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return {line.strip() for line in f if line.strip()}
+
+        job_ids = set()
+        with open(self.output_path, "r", newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                job_ids.add(Job.id_from_url(row["job_url"]))
+
+        with atomic_write(self.index_path) as f:
+            f.writelines(f"{job_id}\n" for job_id in job_ids)
+        self._index_size = self._file_size(self.index_path)
+
+        self.logger.debug(f"Rebuilt job ID index for {self.output_path} ({len(job_ids)} jobs)")
+        return job_ids
+
+    def _upgrade_header(self) -> None:
+        """Rewrite a file written with an older column set to FIELDNAMES."""
+        if not self.output_path.exists() or self.output_path.stat().st_size == 0:
+            return
+
+        with open(self.output_path, "r", newline="", encoding="utf-8") as f:
+            header = next(csv.reader(f), None)
+        if header == FIELDNAMES:
+            return
+
+        with open(self.output_path, "r", newline="", encoding="utf-8") as src, \
+                atomic_write(self.output_path, newline="") as dst:
+            writer = csv.DictWriter(dst, fieldnames=FIELDNAMES, extrasaction="ignore")
+            writer.writeheader()
+            for row in csv.DictReader(src):
+                writer.writerow(row)
+
+        self.logger.info(f"Upgraded {self.output_path} to columns: {', '.join(FIELDNAMES)}")
+
+    @staticmethod
+    def _file_size(path: Path) -> Optional[int]:
+        """Size of a file, or None if it does not exist."""
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return None
@@ -0,0 +1,130 @@
+"""Time-ordered sidecar for expiring records from whole-file job stores."""
+
+import json
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .atomic import atomic_write
+
+
+# Records per segment: cleanup decodes only segments straddling the cutoff
+SEGMENT_SIZE = 500
+
+
+class SegmentBuilder:
+    """Collect segments while a job file is written.
+
+    A segment is ``[start, end, min_scraped_at, max_scraped_at, count]``:
+    the byte range of ``count`` consecutive records and the range of their
+    scrape times. Callers report the byte range of each record they write
+    (``add``), or of a whole segment copied verbatim (``copy``).
+    """
+
+    def __init__(self, segment_size: int = SEGMENT_SIZE):
+        """Initialize the builder.
+
+        Args:
+            segment_size: Records per segment
+        """
+        self.segment_size = segment_size
+        self.segments: List[list] = []
+        self._open: Optional[list] = None
+
+    def add(self, start: int, end: int, scraped_at: str) -> None:
+        """Record one record written at bytes [start, end).
+
+        Args:
+            start: Offset of the record's first byte
+            end: Offset just past its last byte
+            scraped_at: Record's ISO scrape timestamp
+        """
+        segment = self._open
+        if segment is None or segment[4] >= self.segment_size:
+            segment = self._open = [start, end, scraped_at, scraped_at, 0]
+            self.segments.append(segment)
+        segment[1] = end
+        segment[2] = min(segment[2], scraped_at)
+        segment[3] = max(segment[3], scraped_at)
+        segment[4] += 1
+
+    def copy(self, start: int, end: int, segment: list) -> None:
+        """Record a whole segment copied verbatim to bytes [start, end).
+
+        Args:
+            start: New offset of the segment's first byte
+            end: New offset just past its last byte
+            segment: The segment as it was in the source file
+        """
+        self._open = None
+        self.segments.append([start, end, segment[2], segment[3], segment[4]])
+
+
+class ExpiryIndex:
+    """Segment list of a job file, stored next to it as ``<file>.expiry``.
+
+    Records whether anything in the file has expired without reading it:
+    a cleanup with nothing to do reads only this small sidecar. When
+    something has expired, the segment list tells cleanup which byte
+    ranges to drop whole, which to copy without decoding and which few to
+    decode record by record.
+
+    The sidecar holds the stamp (mtime, size) of the job file it
+    describes and is ignored when the file no longer matches it (written
+    by another tool, or a crash between the two writes); cleanup then
+    rebuilds it with one full pass.
+    """
+
+    def __init__(self, data_path: Path, logger: logging.Logger = None):
+        """Initialize the index.
+
+        Args:
+            data_path: Job file described by the sidecar
+            logger: Logger instance
+        """
+        self.data_path = Path(data_path)
+        self.path = self.data_path.with_suffix(self.data_path.suffix + ".expiry")
+        self.logger = logger or logging.getLogger(__name__)
+
+    def load(self) -> Optional[List[list]]:
+        """Return the segments, or None if the sidecar is missing or stale."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable expiry index {self.path}: {e}")
+            return None
+
+        if state.get("stamp") != list(self._data_stamp() or ()):
+            return None
+        return state["segments"]
+
+    def save(self, segments: List[list]) -> None:
+        """Write the segments of the job file as it is now.
+
+        Call after the job file has been written, under its lock.
+
+        Args:
+            segments: Segments covering every record in the file
+        """
+        with atomic_write(self.path) as f:
+            json.dump({"stamp": list(self._data_stamp() or ()), "segments": segments}, f)
+
+    def clear(self) -> None:
+        """Remove the sidecar (the job file is about to change without it)."""
+        self.path.unlink(missing_ok=True)
+
+    @staticmethod
+    def oldest(segments: List[list]) -> Optional[str]:
+        """Scrape time of the oldest record, or None if there are none."""
+        return min((segment[2] for segment in segments), default=None)
+
+    def _data_stamp(self) -> Optional[Tuple[int, int]]:
+        """Modification time and size of the job file, or None if missing."""
+        try:
+            stat = self.data_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,88 @@
+"""Storage backend selection from configuration."""
+
+import logging
+
+from .base_storage import BaseStorage
+from .csv_storage import CSVStorage
+from .json_storage import JSONStorage
+from .jsonl_storage import JSONLStorage
+from .partitioned_storage import PartitionedStorage
+from .seen_index import seen_index_from_config
+from .sqlite_storage import SQLiteStorage
+
+
+def storage_from_config(config, logger: logging.Logger = None) -> BaseStorage:
+    """Build the job database backend selected by storage.backend.
+
+    Args:
+        config: Configuration object
+        logger: Logger instance
+
+    Returns:
+        JSONStorage for "json" (default), JSONLStorage for "jsonl",
+        PartitionedStorage for "partitioned", SQLiteStorage for "sqlite"
+        or CSVStorage for "csv"
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = config.get("storage.backend", "json")
+    retention_days = config.get("deduplication.retention_days", 30)
+
+    json_storage = JSONStorage(
+        output_path=config.get_output_path("json"),
+        seen_jobs_path=config.get_seen_jobs_path(),
+        retention_days=retention_days,
+        seen_index=seen_index_from_config(config, logger)
+    )
+
+    if backend == "json":
+        return json_storage
+
+    if backend == "jsonl":
+        jsonl_path = config.get_output_path("jsonl")
+        created = not jsonl_path.exists()
+        storage = JSONLStorage(
+            output_path=jsonl_path,
+            seen_jobs_path=json_storage.seen_jobs_path,
+            retention_days=retention_days,
+            seen_index=json_storage.seen_index,
+            compact_min_waste=config.get("storage.compact_min_waste", 0.2)
+        )
+        if created:
+            # First run on JSONL: carry over the JSON database
+            jobs = json_storage.load()
+            if jobs:
+                storage.import_json(jobs)
+        return storage
+
+    if backend == "partitioned":
+        storage = PartitionedStorage(
+            partition_dir=config.get_partition_dir(),
+            seen_jobs_path=json_storage.seen_jobs_path,
+            retention_days=retention_days,
+            seen_index=json_storage.seen_index
+        )
+        if storage.created:
+            # First run on partitions: carry over the JSON database
+            jobs = json_storage.load()
+            if jobs:
+                storage.import_json(jobs)
+        return storage
+
+    if backend == "sqlite":
+        if config.get("deduplication.seen_store", "json") != "json":
+            (logger or logging.getLogger(__name__)).warning(
+                "deduplication.seen_store is ignored by the sqlite backend, "
+                "which tracks seen jobs in its own table"
+            )
+        storage = SQLiteStorage(config.get_database_path(), retention_days=retention_days)
+        if storage.created:
+            # First run on SQLite: carry over the JSON database
+            storage.import_json(json_storage.load(), json_storage.seen_jobs_path)
+        return storage
+
+    if backend == "csv":
+        return CSVStorage(config.get_output_path("csv"), retention_days=retention_days)
+
+    raise ValueError(f"Unknown storage backend: {backend}")
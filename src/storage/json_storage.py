@@ -2,29 +2,60 @@
 
 import json
 import logging
+import os
+import textwrap
 from pathlib import Path
-from typing import List
-from datetime import datetime, timedelta
+from typing import BinaryIO, Iterable, Iterator, List, Optional
 
 from ..models import Job
+from .atomic import atomic_write, ends_mid_line, file_lock
 from .base_storage import BaseStorage
+from .expiry import ExpiryIndex, SegmentBuilder
+from .retention import retention_cutoff
+from .seen_index import SeenIndex, canonicalize_seen_jobs
+from .streaming import iter_json_array
 
 
 class JSONStorage(BaseStorage):
-    """JSON file-based storage."""
-
-    def __init__(self, output_path: Path, seen_jobs_path: Path, retention_days: int = 30):
+    """JSON file-based storage.
+
+    The job file is only ever replaced atomically, so readers never see a
+    partial write. Writers (the cron scraper and API scrapes) coordinate
+    through an advisory lock on the job file and a small append-only
+    journal next to it (``<file>.pending``): ``save`` appends its jobs to
+    the journal, then whichever writer next holds the lock merges the
+    whole journal in one rewrite. Saves that arrive during a rewrite are
+    committed together by the next one instead of each rewriting the file.
+    Each rewrite also records an ExpiryIndex segment list (``<file>.expiry``)
+    so retention can tell from the sidecar alone whether anything expired.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        seen_jobs_path: Path,
+        retention_days: int = 30,
+        seen_index: Optional[SeenIndex] = None
+    ):
         """Initialize JSON storage.
 
         Args:
             output_path: Path to output JSON file
             seen_jobs_path: Path to seen jobs tracking file
             retention_days: Number of days to track seen jobs
+            seen_index: Seen-jobs index to use instead of a SeenIndex over
+                seen_jobs_path (e.g. a CompactSeenIndex)
         """
         self.output_path = output_path
         self.seen_jobs_path = seen_jobs_path
         self.retention_days = retention_days
+        self.journal_path = output_path.with_suffix(output_path.suffix + ".pending")
         self.logger = logging.getLogger(__name__)
+        if seen_index is None:
+            seen_index = SeenIndex(seen_jobs_path, retention_days, self.logger)
+        self.seen_index = seen_index
+        self.lock = file_lock(output_path)
+        self.expiry = ExpiryIndex(output_path, self.logger)
 
         # Ensure directories exist
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -33,28 +64,120 @@ class JSONStorage(BaseStorage):
     def save(self, jobs: List[Job]) -> None:
         """Save jobs to JSON file (merges with existing jobs).
 
+        Jobs whose ID is already stored are skipped.
+
         Args:
             jobs: List of NEW Job objects to add
         """
-        # Load existing jobs
-        existing_jobs = self.load()
+        if not jobs:
+            return
+
+        with file_lock(self.journal_path):
+            needs_newline = ends_mid_line(self.journal_path)
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                if needs_newline:
+                    f.write("\n")
+                f.writelines(json.dumps(job.to_dict(), ensure_ascii=False) + "\n" for job in jobs)
+                f.flush()
+                os.fsync(f.fileno())
+
+        with self.lock:
+            total = self._commit_journal()
+
+        if total is None:
+            self.logger.info(f"Saved {len(jobs)} new jobs (committed by a concurrent writer)")
+        else:
+            self.logger.info(f"Saved {len(jobs)} new jobs (total: {total} jobs in database)")
 
-        # Merge new jobs with existing jobs
-        all_jobs = existing_jobs + jobs
+        # Update seen jobs
+        self._update_seen_jobs(jobs)
 
-        # Convert to dict for saving
-        jobs_data = [job.to_dict() for job in all_jobs]
+    def _commit_journal(self) -> Optional[int]:
+        """Merge every journaled job into the job file. Caller holds ``self.lock``.
 
-        # Ensure output directory exists
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        The journal prefix that was merged is dropped only after the job
+        file has been replaced; if a crash comes in between, the next
+        commit merges it again and the duplicates are skipped by ID.
 
-        with open(self.output_path, "w", encoding="utf-8") as f:
-            json.dump(jobs_data, f, indent=2, ensure_ascii=False)
+        Returns:
+            Number of jobs in the file, or None if the journal was empty
+        """
+        with file_lock(self.journal_path):
+            if not self.journal_path.exists():
+                return None
+            with open(self.journal_path, "rb") as f:
+                journal = f.read()
+        if not journal:
+            return None
+
+        pending = []
+        for line in journal.decode("utf-8").splitlines():
+            try:
+                pending.append(Job.from_dict(json.loads(line)))
+            except (ValueError, TypeError) as e:
+                # Only a crash mid-append leaves a partial line
+                self.logger.warning(f"Skipping unreadable journal line in {self.journal_path}: {e}")
+
+        job_ids = set()
+
+        def merged() -> Iterator[Job]:
+            for job in self._stream_jobs():
+                job_ids.add(job.job_id)
+                yield job
+            for job in pending:
+                if job.job_id not in job_ids:
+                    job_ids.add(job.job_id)
+                    yield job
+
+        builder = SegmentBuilder()
+        with atomic_write(self.output_path, "wb") as f:
+            total = self._write_array(f, merged(), builder)
+        self.expiry.save(builder.segments)
+
+        with file_lock(self.journal_path):
+            with open(self.journal_path, "rb") as f:
+                f.seek(len(journal))
+                rest = f.read()
+            if rest:
+                with atomic_write(self.journal_path, "wb") as f:
+                    f.write(rest)
+            else:
+                self.journal_path.unlink()
+
+        return total
+
+    @classmethod
+    def _write_array(cls, f: BinaryIO, jobs: Iterable[Job], builder: Optional[SegmentBuilder] = None) -> int:
+        """Write jobs as an indented JSON array, one at a time.
 
-        self.logger.info(f"Saved {len(jobs)} new jobs (total: {len(all_jobs)} jobs in database)")
+        Args:
+            f: Binary file to write to
+            jobs: Jobs to write
+            builder: Collects the byte range and scrape time of each job
 
-        # Update seen jobs
-        self._update_seen_jobs(jobs)
+        Returns:
+            Number of jobs written
+        """
+        count = 0
+        pos = f.write(b"[")
+        for job in jobs:
+            pos += f.write(b",\n" if count else b"\n")
+            record = cls._encode(job)
+            if builder is not None:
+                builder.add(pos, pos + len(record), job.scraped_at)
+            pos += f.write(record)
+            count += 1
+        f.write(b"\n]" if count else b"]")
+        return count
+
+    @staticmethod
+    def _encode(job: Job) -> bytes:
+        """One array element as written to the job file."""
+        return textwrap.indent(json.dumps(job.to_dict(), indent=2, ensure_ascii=False), "  ").encode("utf-8")
+
+    def data_files(self) -> List[Path]:
+        """The job file, which every commit replaces."""
+        return [self.output_path]
 
     def load(self) -> List[Job]:
         """Load jobs from JSON file.
@@ -79,20 +202,44 @@ class JSONStorage(BaseStorage):
         Returns:
             True if job was seen before
         """
-        seen_jobs = self._load_seen_jobs()
-        return job.job_url in seen_jobs
+        return self.seen_index.contains(job)
 
-    def _load_seen_jobs(self) -> dict:
-        """Load seen jobs tracking data.
+    def contains_many(self, jobs: List[Job]) -> List[bool]:
+        """Check a batch of jobs against seen jobs.
+
+        Args:
+            jobs: Jobs to check
+
+        Returns:
+            One flag per job, True if it was seen before
+        """
+        return self.seen_index.contains_many(jobs)
+
+    def migrate_seen_jobs(self) -> int:
+        """Rewrite a seen jobs file keyed by job URL to canonical job IDs.
+
+        Older versions keyed the file by the full tracking URL, so one ad
+        could be stored under several keys. Entries are merged per job ID,
+        keeping the most recent timestamp.
 
         Returns:
-            Dictionary of job_url -> timestamp
+            Number of redundant entries removed
         """
         if not self.seen_jobs_path.exists():
-            return {}
+            return 0
 
         with open(self.seen_jobs_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+            raw = json.load(f)
+
+        seen_jobs = canonicalize_seen_jobs(raw)
+        if list(seen_jobs) != list(raw):
+            with file_lock(self.seen_jobs_path), atomic_write(self.seen_jobs_path) as f:
+                json.dump(seen_jobs, f, indent=2)
+            self.seen_index.reload()
+
+        removed = len(raw) - len(seen_jobs)
+        self.logger.info(f"Migrated seen jobs: {len(raw)} entries -> {len(seen_jobs)} job IDs")
+        return removed
 
     def _update_seen_jobs(self, jobs: List[Job]) -> None:
         """Update seen jobs tracking file.
@@ -100,55 +247,131 @@ class JSONStorage(BaseStorage):
         Args:
             jobs: List of newly scraped jobs
         """
-        seen_jobs = self._load_seen_jobs()
+        self.seen_index.add(jobs)
+        self.seen_index.flush()
 
-        # Add new jobs
-        current_time = datetime.now().isoformat()
-        for job in jobs:
-            seen_jobs[job.job_url] = current_time
+    def cleanup_old_jobs(self) -> int:
+        """Remove jobs older than retention_days from the database.
 
-        # Clean up old entries
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
-        seen_jobs = {
-            url: timestamp
-            for url, timestamp in seen_jobs.items()
-            if datetime.fromisoformat(timestamp) > cutoff_date
-        }
+        The expiry sidecar answers "has anything expired?" without opening
+        the job file, so a run with nothing to do is O(1). Otherwise the
+        file is rewritten from its segments: wholly expired segments are
+        dropped, wholly recent ones copied as raw bytes, and only segments
+        straddling the cutoff are decoded. Without a valid sidecar (older
+        files, or a crash between the two writes) the file is streamed
+        once through a full rewrite that rebuilds it.
 
-        # Save updated tracking
-        with open(self.seen_jobs_path, "w", encoding="utf-8") as f:
-            json.dump(seen_jobs, f, indent=2)
+        Returns:
+            Number of jobs removed
+        """
+        cutoff = retention_cutoff(self.retention_days)
+        removed_count = 0
+
+        segments = self.expiry.load()
+        if self.output_path.exists() and (segments is None or self._has_expired(segments, cutoff)):
+            with self.lock:
+                segments = self.expiry.load()
+                if segments is None:
+                    removed_count = self._rewrite_recent(cutoff)
+                elif self._has_expired(segments, cutoff):
+                    removed_count = self._drop_expired(segments, cutoff)
 
-        self.logger.debug(f"Updated seen jobs. Total tracked: {len(seen_jobs)}")
+        if removed_count > 0:
+            self.logger.info(f"Cleaned up {removed_count} jobs older than {self.retention_days} days")
+        else:
+            self.logger.info(f"No jobs older than {self.retention_days} days to clean up")
 
-    def cleanup_old_jobs(self) -> int:
-        """Remove jobs older than retention_days from the database.
+        return removed_count
+
+    @staticmethod
+    def _has_expired(segments: List[list], cutoff: str) -> bool:
+        oldest = ExpiryIndex.oldest(segments)
+        return oldest is not None and oldest <= cutoff
+
+    def _rewrite_recent(self, cutoff: str) -> int:
+        """Stream the file into a copy without expired jobs. Caller holds ``self.lock``.
 
         Returns:
             Number of jobs removed
         """
-        jobs = self.load()
+        removed_count = 0
+
+        def recent() -> Iterator[Job]:
+            nonlocal removed_count
+            for job in self._stream_jobs():
+                if job.scraped_at <= cutoff:
+                    removed_count += 1
+                else:
+                    yield job
+
+        builder = SegmentBuilder()
+        with atomic_write(self.output_path, "wb") as f:
+            self._write_array(f, recent(), builder)
+        self.expiry.save(builder.segments)
+        return removed_count
 
-        if not jobs:
-            return 0
+    def _drop_expired(self, segments: List[list], cutoff: str) -> int:
+        """Rewrite the file segment by segment without expired jobs. Caller holds ``self.lock``.
 
-        # Calculate cutoff date
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
+        Args:
+            segments: Current segments of the file
+            cutoff: ISO timestamp; jobs at or before it expire
 
-        # Filter out old jobs
-        original_count = len(jobs)
-        recent_jobs = [
-            job for job in jobs
-            if datetime.fromisoformat(job.scraped_at) > cutoff_date
-        ]
+        Returns:
+            Number of jobs removed
+        """
+        builder = SegmentBuilder()
+        removed_count = 0
+        count = 0
+
+        with open(self.output_path, "rb") as src, atomic_write(self.output_path, "wb") as dst:
+            pos = dst.write(b"[")
+
+            def emit(raw: bytes) -> int:
+                nonlocal pos
+                pos += dst.write(b",\n" if count else b"\n")
+                start = pos
+                pos += dst.write(raw)
+                return start
+
+            for segment in segments:
+                start, end, oldest, newest, size = segment
+                if newest <= cutoff:
+                    removed_count += size
+                    continue
+
+                src.seek(start)
+                raw = src.read(end - start)
+                if oldest > cutoff:
+                    builder.copy(emit(raw), pos, segment)
+                    count += size
+                    continue
+
+                for data in json.loads(b"[" + raw + b"]"):
+                    if data["scraped_at"] <= cutoff:
+                        removed_count += 1
+                        continue
+                    job = Job.from_dict(data)
+                    builder.add(emit(self._encode(job)), pos, job.scraped_at)
+                    count += 1
+
+            dst.write(b"\n]" if count else b"]")
+
+        self.expiry.save(builder.segments)
+        return removed_count
 
-        removed_count = original_count - len(recent_jobs)
+    def _stream_jobs(self, since: Optional[str] = None) -> Iterator[Job]:
+        """Parse the JSON array incrementally, one job at a time.
 
-        if removed_count > 0:
-            # Save filtered jobs back to file
-            self.save(recent_jobs)
-            self.logger.info(f"Cleaned up {removed_count} jobs older than {self.retention_days} days")
-        else:
-            self.logger.info(f"No jobs older than {self.retention_days} days to clean up")
+        Args:
+            since: ISO timestamp lower bound, or None for all jobs
 
-        return removed_count
+        Yields:
+            Job objects in file order
+        """
+        if not self.output_path.exists():
+            return
+
+        for data in iter_json_array(self.output_path):
+            if since is None or data["scraped_at"] >= since:
+                yield Job.from_dict(data)
@@ -0,0 +1,243 @@
+"""Append-only JSON Lines storage backend."""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ..models import Job
+from .atomic import atomic_write, ends_mid_line
+from .json_storage import JSONStorage
+from .retention import retention_cutoff
+from .seen_index import SeenIndex
+from .streaming import append_position, read_appended_lines
+
+
+class JSONLStorage(JSONStorage):
+    """Job log with one JSON record per line.
+
+    ``save`` only appends the new records, so its cost does not depend on
+    the size of the database. A job saved again later supersedes its
+    earlier record (the last line per job ID wins). Superseded records
+    stay in the file until ``compact`` rewrites it, which
+    ``cleanup_old_jobs`` does once enough of the file is waste or as soon
+    as any job is past retention, so expired jobs disappear at the same
+    cleanup as on the JSON backend.
+    Appends and compaction hold the log's lock, so records from
+    concurrent writers never interleave. Seen-jobs tracking works as in
+    JSONStorage.
+    """
+
+    def __init__(
+        self,
+        output_path: Path,
+        seen_jobs_path: Path,
+        retention_days: int = 30,
+        seen_index: Optional[SeenIndex] = None,
+        compact_min_waste: float = 0.2
+    ):
+        """Initialize JSONL storage.
+
+        Args:
+            output_path: Path to the .jsonl job log
+            seen_jobs_path: Path to seen jobs tracking file
+            retention_days: Number of days to keep jobs and seen jobs
+            seen_index: Seen-jobs index to use instead of a SeenIndex over
+                seen_jobs_path
+            compact_min_waste: Fraction of superseded records at which
+                cleanup_old_jobs rewrites the file even if no job expired
+        """
+        super().__init__(output_path, seen_jobs_path, retention_days, seen_index)
+        self.compact_min_waste = compact_min_waste
+
+    def save(self, jobs: List[Job]) -> None:
+        """Append jobs to the log.
+
+        Args:
+            jobs: List of NEW Job objects to add
+        """
+        self._append(jobs)
+
+        # Update seen jobs
+        self._update_seen_jobs(jobs)
+
+    def import_json(self, jobs: List[Job]) -> None:
+        """Copy jobs from the JSON backend without resetting their seen times.
+
+        The seen index is shared with the JSON backend, so existing entries
+        keep their original timestamps; only jobs it lacks are marked, as
+        seen when they were scraped.
+
+        Args:
+            jobs: Jobs to copy (e.g. JSONStorage.load())
+        """
+        self._append(jobs)
+
+        unseen = [job for job, seen in zip(jobs, self.seen_index.contains_many(jobs)) if not seen]
+        for job in unseen:
+            self.seen_index.add([job], job.scraped_at)
+        self.seen_index.flush()
+
+        self.logger.info(f"Imported {len(jobs)} jobs into {self.output_path} ({len(unseen)} newly marked seen)")
+
+    def _append(self, jobs: List[Job]) -> None:
+        """Append records to the log, fsynced, under the lock."""
+        with self.lock:
+            needs_newline = ends_mid_line(self.output_path)
+            with open(self.output_path, "a", encoding="utf-8") as f:
+                # Don't glue the first record onto a line cut short by a crash
+                if needs_newline:
+                    f.write("\n")
+                f.writelines(
+                    json.dumps(job.to_dict(), ensure_ascii=False) + "\n" for job in jobs
+                )
+                f.flush()
+                os.fsync(f.fileno())
+
+        self.logger.info(f"Appended {len(jobs)} new jobs to {self.output_path}")
+
+    def load(self) -> List[Job]:
+        """Load the current record of every job.
+
+        Returns:
+            List of Job objects
+        """
+        return list(self._stream_jobs())
+
+    def _stream_jobs(self, since: Optional[str] = None) -> Iterator[Job]:
+        """Stream the current record of every job without building a list.
+
+        Reads the log twice: once to find the last line of each job ID
+        (only IDs are kept in memory), then again to yield those lines.
+
+        Args:
+            since: ISO timestamp lower bound, or None for all jobs
+
+        Yields:
+            Job objects in file order
+        """
+        if not self.output_path.exists():
+            return
+
+        last_line = self._last_lines()
+        for line_num, job in self._iter_numbered():
+            if last_line.get(job.job_id) == line_num and (since is None or job.scraped_at >= since):
+                yield job
+
+    def tail_position(self) -> Optional[Tuple[int, int, int]]:
+        """Identity of the log and the offset just past its last complete line."""
+        return append_position(self.output_path)
+
+    def read_tail(self, position: Tuple[int, int, int]) -> Optional[Tuple[List[Job], Tuple[int, int, int]]]:
+        """Read the records appended since ``position``.
+
+        Args:
+            position: Marker from ``tail_position`` or a previous call
+
+        Returns:
+            Tuple of (appended jobs in file order, next marker), or None if
+            the log was compacted since
+        """
+        tail = read_appended_lines(self.output_path, position)
+        if tail is None:
+            return None
+
+        lines, position = tail
+        jobs = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                jobs.append(Job.from_dict(json.loads(line)))
+            except (ValueError, TypeError) as e:
+                self.logger.warning(f"Skipping unreadable appended line in {self.output_path}: {e}")
+        return jobs, position
+
+    def compact(self, force: bool = True) -> int:
+        """Rewrite the log without superseded records or expired jobs.
+
+        Makes two streaming passes: the first finds the last line of each
+        job, the second copies the lines that are kept to a temporary file
+        that replaces the log. Only job IDs are held in memory.
+
+        Args:
+            force: Rewrite even if no job expired and less than
+                compact_min_waste of the file would be dropped
+
+        Returns:
+            Number of jobs removed for being older than retention_days
+        """
+        with self.lock:
+            if not self.output_path.exists():
+                return 0
+
+            cutoff = retention_cutoff(self.retention_days)
+            last_line: Dict[str, int] = {}
+            expired = set()
+            total = 0
+
+            for line_num, job in self._iter_numbered(warn=False):
+                total += 1
+                last_line[job.job_id] = line_num
+                if job.scraped_at <= cutoff:
+                    expired.add(job.job_id)
+                else:
+                    expired.discard(job.job_id)
+
+            kept = len(last_line) - len(expired)
+            waste = (total - kept) / total if total else 0.0
+            if not force and not expired and waste < self.compact_min_waste:
+                self.logger.debug(f"Skipping compaction ({waste:.0%} of {total} records superseded)")
+                return 0
+
+            with atomic_write(self.output_path) as out:
+                for line_num, job in self._iter_numbered(warn=False):
+                    if last_line[job.job_id] == line_num and job.job_id not in expired:
+                        out.write(json.dumps(job.to_dict(), ensure_ascii=False) + "\n")
+
+        self.logger.info(
+            f"Compacted {self.output_path}: {total} records -> {kept} jobs "
+            f"({len(expired)} expired, {total - len(last_line)} superseded)"
+        )
+        return len(expired)
+
+    def cleanup_old_jobs(self) -> int:
+        """Drop jobs older than retention_days by compacting the log.
+
+        The file is rewritten whenever a job has expired, or once
+        compact_min_waste of it is superseded records.
+
+        Returns:
+            Number of jobs removed
+        """
+        removed_count = self.compact(force=False)
+
+        if removed_count > 0:
+            self.logger.info(f"Cleaned up {removed_count} jobs older than {self.retention_days} days")
+        else:
+            self.logger.info(f"No jobs older than {self.retention_days} days to clean up")
+
+        return removed_count
+
+    def _last_lines(self) -> Dict[str, int]:
+        """Map each job ID to the line number of its latest record."""
+        return {job.job_id: line_num for line_num, job in self._iter_numbered(warn=False)}
+
+    def _iter_numbered(self, warn: bool = True) -> Iterator:
+        """Yield (line number, Job) for every readable record.
+
+        Lines that cannot be parsed (e.g. a write cut short by a crash) are
+        skipped.
+
+        Args:
+            warn: Log a warning for each skipped line
+        """
+        with open(self.output_path, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_num, Job.from_dict(json.loads(line))
+                except (ValueError, TypeError) as e:
+                    if warn:
+                        self.logger.warning(f"Skipping unreadable line {line_num} in {self.output_path}: {e}")
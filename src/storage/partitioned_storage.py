@@ -0,0 +1,370 @@
+"""Date-partitioned storage backend."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from ..models import Job
+from .atomic import atomic_write, ends_mid_line, file_lock
+from .base_storage import BaseStorage
+from .retention import retention_cutoff
+from .seen_index import SeenIndex
+from .streaming import append_position, read_appended_lines
+
+
+MANIFEST_FILE = "manifest.json"
+
+
+class PartitionedStorage(BaseStorage):
+    """Jobs split into one append-only JSONL file per scrape day.
+
+    A manifest records each partition's file, job count and scraped_at
+    range. Retention deletes whole partitions, and time-bounded reads
+    (``since``, latest jobs) open only the partitions they need, newest
+    first. Seen-jobs tracking works as in JSONStorage. Because seen jobs
+    expire together with their partition, a job is only stored in one
+    partition at a time. Writers hold the manifest's lock and re-read the
+    manifest under it, so concurrent saves do not lose each other's
+    counts; readers re-read it whenever its mtime or size changed, so a
+    long-lived instance sees partitions written by other processes.
+    """
+
+    def __init__(
+        self,
+        partition_dir: Path,
+        seen_jobs_path: Path,
+        retention_days: int = 30,
+        seen_index: Optional[SeenIndex] = None
+    ):
+        """Initialize partitioned storage.
+
+        Args:
+            partition_dir: Directory holding the partitions and manifest
+            seen_jobs_path: Path to seen jobs tracking file
+            retention_days: Number of days to keep partitions and seen jobs
+            seen_index: Seen-jobs index to use instead of a SeenIndex over
+                seen_jobs_path
+        """
+        self.partition_dir = Path(partition_dir)
+        self.manifest_path = self.partition_dir / MANIFEST_FILE
+        self.retention_days = retention_days
+        self.logger = logging.getLogger(__name__)
+        if seen_index is None:
+            seen_index = SeenIndex(seen_jobs_path, retention_days, self.logger)
+        self.seen_index = seen_index
+        self.lock = file_lock(self.manifest_path)
+
+        self.partition_dir.mkdir(parents=True, exist_ok=True)
+        self.created = not self.manifest_path.exists()
+        self._manifest_stamp: Optional[Tuple[int, int]] = None
+        self.manifest = self._load_manifest()
+
+    def save(self, jobs: List[Job]) -> None:
+        """Append jobs to the partition of their scrape day.
+
+        Args:
+            jobs: List of NEW Job objects to add
+        """
+        if not jobs:
+            return
+
+        self._append(jobs)
+
+        # Update seen jobs
+        self.seen_index.add(jobs)
+        self.seen_index.flush()
+
+    def import_json(self, jobs: List[Job]) -> None:
+        """Copy jobs from the JSON backend without resetting their seen times.
+
+        The seen index is shared with the JSON backend, so existing entries
+        keep their original timestamps; only jobs it lacks are marked, as
+        seen when they were scraped.
+
+        Args:
+            jobs: Jobs to copy (e.g. JSONStorage.load())
+        """
+        if not jobs:
+            return
+
+        self._append(jobs)
+
+        unseen = [job for job, seen in zip(jobs, self.seen_index.contains_many(jobs)) if not seen]
+        for job in unseen:
+            self.seen_index.add([job], job.scraped_at)
+        self.seen_index.flush()
+
+        self.logger.info(f"Imported {len(jobs)} jobs into {self.partition_dir} ({len(unseen)} newly marked seen)")
+
+    def _append(self, jobs: List[Job]) -> None:
+        """Append jobs to their day's partition and update the manifest."""
+        by_day: Dict[str, List[Job]] = {}
+        for job in jobs:
+            by_day.setdefault(job.scraped_at[:10], []).append(job)
+
+        with self.lock:
+            self.manifest = self._load_manifest()
+            partitions = self.manifest["partitions"]
+            for day, day_jobs in sorted(by_day.items()):
+                entry = partitions.setdefault(day, {
+                    "file": f"jobs-{day}.jsonl",
+                    "count": 0,
+                    "min_scraped_at": day_jobs[0].scraped_at,
+                    "max_scraped_at": day_jobs[0].scraped_at,
+                })
+
+                path = self.partition_dir / entry["file"]
+                needs_newline = ends_mid_line(path)
+                with open(path, "a", encoding="utf-8") as f:
+                    # Don't glue the first record onto a line cut short by a crash
+                    if needs_newline:
+                        f.write("\n")
+                    f.writelines(json.dumps(job.to_dict(), ensure_ascii=False) + "\n" for job in day_jobs)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                entry["count"] += len(day_jobs)
+                entry["min_scraped_at"] = min(entry["min_scraped_at"], *(job.scraped_at for job in day_jobs))
+                entry["max_scraped_at"] = max(entry["max_scraped_at"], *(job.scraped_at for job in day_jobs))
+
+            self._write_manifest()
+
+        total = sum(entry["count"] for entry in partitions.values())
+        self.logger.info(f"Saved {len(jobs)} new jobs (total: {total} jobs in {len(partitions)} partitions)")
+
+    def data_files(self) -> List[Path]:
+        """The manifest, which every save and cleanup rewrites."""
+        return [self.manifest_path]
+
+    def tail_position(self) -> Dict[str, Optional[Tuple[int, int, int]]]:
+        """End of every partition file, keyed by file name."""
+        return {
+            entry["file"]: append_position(self.partition_dir / entry["file"])
+            for _, entry in self.partitions()
+        }
+
+    def read_tail(
+        self,
+        position: Dict[str, Optional[Tuple[int, int, int]]]
+    ) -> Optional[Tuple[List[Job], Dict[str, Optional[Tuple[int, int, int]]]]]:
+        """Read the jobs appended to any partition since ``position``.
+
+        Args:
+            position: Marker from ``tail_position`` or a previous call
+
+        Returns:
+            Tuple of (appended jobs, oldest partition first, next marker),
+            or None if cleanup deleted a partition since
+        """
+        files = [entry["file"] for _, entry in self.partitions()]
+        if not set(position) <= set(files):
+            return None
+
+        jobs: List[Job] = []
+        next_position = {}
+        for name in files:
+            path = self.partition_dir / name
+            tail = read_appended_lines(path, position.get(name))
+            if tail is None:
+                return None
+            lines, next_position[name] = tail
+            for line in lines:
+                job = self._decode_line(line, path)
+                if job is not None:
+                    jobs.append(job)
+        return jobs, next_position
+
+    def load(self) -> List[Job]:
+        """Load jobs from every partition.
+
+        Returns:
+            List of Job objects, oldest partition first
+        """
+        return list(self._stream_jobs())
+
+    def exists(self, job: Job) -> bool:
+        """Check if job already exists in seen jobs.
+
+        Args:
+            job: Job to check
+
+        Returns:
+            True if job was seen before
+        """
+        return self.seen_index.contains(job)
+
+    def contains_many(self, jobs: List[Job]) -> List[bool]:
+        """Check a batch of jobs against seen jobs.
+
+        Args:
+            jobs: Jobs to check
+
+        Returns:
+            One flag per job, True if it was seen before
+        """
+        return self.seen_index.contains_many(jobs)
+
+    def partitions(self, since: Optional[str] = None, newest_first: bool = False) -> List[Tuple[str, dict]]:
+        """List partitions that may hold jobs scraped at or after ``since``.
+
+        Args:
+            since: ISO timestamp lower bound, or None for all partitions
+            newest_first: Order partitions from the latest day back
+
+        Returns:
+            List of (day, manifest entry) tuples
+        """
+        self._refresh_manifest()
+        selected = [
+            (day, entry)
+            for day, entry in self.manifest["partitions"].items()
+            if since is None or entry["max_scraped_at"] >= since
+        ]
+        return sorted(selected, reverse=newest_first)
+
+    def _stream_jobs(self, since: Optional[str] = None) -> Iterator[Job]:
+        """Stream jobs from the partitions that overlap ``since``.
+
+        Args:
+            since: ISO timestamp lower bound, or None for all jobs
+
+        Yields:
+            Job objects, oldest partition first
+        """
+        for _, entry in self.partitions(since):
+            for job in self._read_partition(entry):
+                if since is None or job.scraped_at >= since:
+                    yield job
+
+    def query_jobs(
+        self,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[str] = None
+    ) -> Tuple[int, List[Job]]:
+        """Filter jobs by substring and return one page, newest first.
+
+        Without filters only partitions reaching ``since`` are considered,
+        newest first: those covering offset + limit jobs are read, and the
+        rest are counted from the manifest (reading only a partition that
+        straddles ``since``). Jobs with the same scrape time are ordered by
+        job ID, as JobIndex does.
+
+        Args:
+            company: Case-insensitive substring of the company name
+            location: Case-insensitive substring of the location
+            limit: Maximum number of jobs to return (None = all)
+            offset: Number of matching jobs to skip
+            since: ISO timestamp; only jobs scraped at or after it
+
+        Returns:
+            Tuple of (total matching jobs, jobs in the requested page)
+        """
+        if company or location or limit is None:
+            return super().query_jobs(company, location, limit, offset, since)
+
+        needed = offset + limit
+        total = 0
+        jobs: List[Job] = []
+
+        for _, entry in self.partitions(since, newest_first=True):
+            if len(jobs) >= needed and (since is None or entry["min_scraped_at"] >= since):
+                total += entry["count"]
+                continue
+            day_jobs = [job for job in self._read_partition(entry) if since is None or job.scraped_at >= since]
+            day_jobs.sort(key=lambda x: (x.scraped_at, x.job_id), reverse=True)
+            total += len(day_jobs)
+            jobs.extend(day_jobs)
+
+        return total, jobs[offset:needed]
+
+    def cleanup_old_jobs(self) -> int:
+        """Delete partitions whose whole day is older than retention_days.
+
+        Returns:
+            Number of jobs removed
+        """
+        cutoff_day = retention_cutoff(self.retention_days)[:10]
+
+        removed_count = 0
+        with self.lock:
+            self.manifest = self._load_manifest()
+            partitions = self.manifest["partitions"]
+            expired = [day for day in partitions if day < cutoff_day]
+            for day in expired:
+                entry = partitions.pop(day)
+                removed_count += entry["count"]
+                # Drop the manifest entry first so a crash never leaves it pointing at a missing file
+                self._write_manifest()
+                (self.partition_dir / entry["file"]).unlink(missing_ok=True)
+
+        if removed_count > 0:
+            self.logger.info(
+                f"Cleaned up {removed_count} jobs older than {self.retention_days} days "
+                f"({len(expired)} partitions)"
+            )
+        else:
+            self.logger.info(f"No jobs older than {self.retention_days} days to clean up")
+
+        return removed_count
+
+    def _read_partition(self, entry: dict) -> Iterator[Job]:
+        """Yield the jobs in one partition file.
+
+        Lines that cannot be parsed (e.g. a write cut short by a crash) are
+        skipped.
+        """
+        path = self.partition_dir / entry["file"]
+        if not path.exists():
+            self.logger.warning(f"Partition listed in manifest is missing: {path}")
+            return
+
+        with open(path, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                job = self._decode_line(line, path, line_num)
+                if job is not None:
+                    yield job
+
+    def _decode_line(self, line: Union[str, bytes], path: Path, line_num: Optional[int] = None) -> Optional[Job]:
+        """Parse one partition line, or return None if it is blank or unreadable."""
+        if not line.strip():
+            return None
+        try:
+            return Job.from_dict(json.loads(line))
+        except (ValueError, TypeError) as e:
+            where = f"line {line_num}" if line_num is not None else "appended line"
+            self.logger.warning(f"Skipping unreadable {where} in {path}: {e}")
+            return None
+
+    def _refresh_manifest(self) -> None:
+        """Re-read the manifest if another writer replaced it since we read it."""
+        if self._file_stamp() != self._manifest_stamp:
+            self.manifest = self._load_manifest()
+
+    def _load_manifest(self) -> dict:
+        """Read the manifest, or start an empty one."""
+        # Stamp before reading: a write in between just triggers another read
+        self._manifest_stamp = self._file_stamp()
+        if self._manifest_stamp is None:
+            return {"partitions": {}}
+
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_manifest(self) -> None:
+        """Write the manifest to a temporary file and swap it in. Caller holds ``self.lock``."""
+        with atomic_write(self.manifest_path) as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        self._manifest_stamp = self._file_stamp()
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Modification time and size of the manifest, or None if missing."""
+        try:
+            stat = self.manifest_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,74 @@
+"""Time-ordered retention for seen jobs and stored jobs."""
+
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+def retention_cutoff(retention_days: int) -> str:
+    """Return the ISO timestamp before which entries are expired.
+
+    Timestamps in this codebase are ``datetime.isoformat()`` strings in
+    local time, so they order correctly as plain strings and can be
+    compared to the cutoff without parsing.
+
+    Args:
+        retention_days: Number of days entries are kept
+
+    Returns:
+        ISO timestamp; entries at or before it are expired
+    """
+    return (datetime.now() - timedelta(days=retention_days)).isoformat()
+
+
+class RetentionQueue:
+    """Min-heap of (timestamp, key) that expires entries in O(expired).
+
+    Entries are pushed whenever a key is (re)recorded. Expiring pops from
+    the front of the heap only while the oldest timestamp is past the
+    cutoff, so a run where nothing expired costs O(1). A key recorded again
+    later leaves a stale heap item behind; it is skipped when popped by
+    comparing against the live timestamps.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, str]] = None):
+        """Initialize the queue.
+
+        Args:
+            entries: Existing key -> ISO timestamp entries
+        """
+        self._heap: List[Tuple[str, str]] = [
+            (timestamp, key) for key, timestamp in (entries or {}).items()
+        ]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, key: str, timestamp: str) -> None:
+        """Record that key was last touched at timestamp."""
+        heapq.heappush(self._heap, (timestamp, key))
+
+    def oldest(self) -> Optional[str]:
+        """Timestamp of the oldest queued entry, or None if empty."""
+        return self._heap[0][0] if self._heap else None
+
+    def expire(self, cutoff: str, live: Dict[str, str]) -> List[str]:
+        """Remove expired keys from ``live`` and return them.
+
+        Args:
+            cutoff: ISO timestamp; entries at or before it expire
+            live: Current key -> timestamp mapping, updated in place
+
+        Returns:
+            Keys removed from ``live``
+        """
+        expired = []
+        heap = self._heap
+        while heap and heap[0][0] <= cutoff:
+            timestamp, key = heapq.heappop(heap)
+            # Skip stale items for keys recorded again since
+            if live.get(key) == timestamp:
+                del live[key]
+                expired.append(key)
+        return expired
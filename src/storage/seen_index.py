@@ -0,0 +1,182 @@
+"""In-memory index of previously seen job IDs."""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..models import Job
+from .atomic import atomic_write, file_lock
+from .retention import RetentionQueue, retention_cutoff
+
+
+class SeenIndex:
+    """Seen jobs tracking file loaded once and queried in memory.
+
+    The file maps canonical job IDs to the ISO timestamp they were last
+    seen. It is read on first use, answers membership from a dict, and is
+    written back only by ``flush``, so a run parses and rewrites it once
+    no matter how many jobs are checked. Expiry goes through a
+    RetentionQueue, so only expired entries are touched. ``flush`` holds
+    the file's lock and merges in entries another process wrote since
+    this one loaded, so concurrent scrapes do not lose each other's jobs.
+    """
+
+    def __init__(self, path: Path, retention_days: int = 30, logger: logging.Logger = None):
+        """Initialize the index.
+
+        Args:
+            path: Path to the seen jobs file
+            retention_days: Number of days to keep entries on flush
+            logger: Logger instance
+        """
+        self.path = Path(path)
+        self.retention_days = retention_days
+        self.logger = logger or logging.getLogger(__name__)
+        self._entries: Optional[Dict[str, str]] = None
+        self._queue: Optional[RetentionQueue] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> Dict[str, str]:
+        """Dictionary of job_id -> timestamp, loaded on first access."""
+        if self._entries is None:
+            self._stamp = self._file_stamp()
+            self._entries = self._load()
+            self._queue = RetentionQueue(self._entries)
+        return self._entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self.entries
+
+    def contains(self, job: Job) -> bool:
+        """Check whether a job was seen before.
+
+        Args:
+            job: Job to check
+
+        Returns:
+            True if the job's ID is in the index
+        """
+        return job.job_id in self.entries
+
+    def contains_many(self, jobs: Iterable[Job]) -> List[bool]:
+        """Check a batch of jobs against the index.
+
+        Args:
+            jobs: Jobs to check
+
+        Returns:
+            One flag per job, True if it was seen before
+        """
+        entries = self.entries
+        return [job.job_id in entries for job in jobs]
+
+    def add(self, jobs: Iterable[Job], timestamp: str = None) -> None:
+        """Mark jobs as seen. Nothing is written until ``flush``.
+
+        Args:
+            jobs: Jobs to record
+            timestamp: ISO timestamp to record (defaults to now)
+        """
+        timestamp = timestamp or datetime.now().isoformat()
+        entries = self.entries
+        for job in jobs:
+            entries[job.job_id] = timestamp
+            self._queue.push(job.job_id, timestamp)
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Drop expired entries and write the index if it changed."""
+        entries = self.entries
+        with file_lock(self.path):
+            if self._file_stamp() != self._stamp:
+                # Another writer flushed since we loaded: keep its entries too
+                for job_id, timestamp in self._load().items():
+                    if timestamp > entries.get(job_id, ""):
+                        entries[job_id] = timestamp
+                        self._queue.push(job_id, timestamp)
+                self._dirty = True
+
+            expired = self._queue.expire(retention_cutoff(self.retention_days), entries)
+            if not self._dirty and not expired:
+                return
+
+            with atomic_write(self.path) as f:
+                json.dump(entries, f, indent=2)
+            self._stamp = self._file_stamp()
+
+        self._dirty = False
+        self.logger.debug(f"Updated seen jobs. Total tracked: {len(entries)}")
+
+    def reload(self) -> None:
+        """Discard the in-memory copy so the next access re-reads the file."""
+        self._entries = None
+        self._queue = None
+        self._stamp = None
+        self._dirty = False
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Modification time and size of the file, or None if missing."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self) -> Dict[str, str]:
+        """Read the seen jobs file, re-keying legacy URL keys by job ID."""
+        if not self.path.exists():
+            return {}
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            return canonicalize_seen_jobs(json.load(f))
+
+
+def canonicalize_seen_jobs(seen_jobs: dict) -> Dict[str, str]:
+    """Re-key seen jobs by canonical job ID, keeping the latest timestamp.
+
+    Args:
+        seen_jobs: Dictionary of job URL or job ID -> timestamp
+
+    Returns:
+        Dictionary of job_id -> timestamp
+    """
+    canonical = {}
+    for key, timestamp in seen_jobs.items():
+        job_id = Job.id_from_url(key)
+        if job_id not in canonical or timestamp > canonical[job_id]:
+            canonical[job_id] = timestamp
+    return canonical
+
+
+def seen_index_from_config(config, logger: logging.Logger = None):
+    """Build the seen-jobs index selected by deduplication.seen_store.
+
+    Args:
+        config: Configuration object
+        logger: Logger instance
+
+    Returns:
+        SeenIndex for "json" (default) or CompactSeenIndex for "compact"
+    """
+    retention_days = config.get("deduplication.retention_days", 30)
+    seen_jobs_path = config.get_seen_jobs_path()
+
+    if config.get("deduplication.seen_store", "json") == "compact":
+        from .compact_seen_index import CompactSeenIndex
+
+        return CompactSeenIndex(
+            config.get_seen_index_path(),
+            retention_days=retention_days,
+            bloom_fp_rate=config.get("deduplication.bloom_fp_rate"),
+            legacy_path=seen_jobs_path,
+            logger=logger
+        )
+
+    return SeenIndex(seen_jobs_path, retention_days, logger)
@@ -0,0 +1,318 @@
+"""SQLite storage backend."""
+
+import json
+import logging
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from ..models import Job
+from .base_storage import BaseStorage
+from .retention import retention_cutoff
+from .seen_index import canonicalize_seen_jobs
+
+
+JOB_COLUMNS = [
+    "title",
+    "company",
+    "location",
+    "classification",
+    "subcategory",
+    "job_url",
+    "posted_date",
+    "salary",
+    "job_type",
+    "description",
+    "scraped_at",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT,
+    location TEXT,
+    classification TEXT,
+    subcategory TEXT,
+    job_url TEXT NOT NULL,
+    posted_date TEXT,
+    salary TEXT,
+    job_type TEXT,
+    description TEXT,
+    scraped_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs (scraped_at);
+
+-- Indexes of earlier versions: substring filters (LIKE '%...%') cannot use
+-- them, so they only slowed down writes
+DROP INDEX IF EXISTS idx_jobs_company;
+DROP INDEX IF EXISTS idx_jobs_location;
+DROP INDEX IF EXISTS idx_jobs_job_type;
+DROP INDEX IF EXISTS idx_jobs_subcategory;
+
+CREATE TABLE IF NOT EXISTS seen_jobs (
+    job_id TEXT PRIMARY KEY,
+    seen_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_seen_jobs_seen_at ON seen_jobs (seen_at);
+"""
+
+# SQLite's default limit on host parameters per statement is 999
+MAX_PARAMS = 500
+
+
+class SQLiteStorage(BaseStorage):
+    """SQLite database storage with seen-jobs tracking in the same file.
+
+    Jobs are keyed by canonical job ID and indexed on scraped_at, so ID
+    lookups, newest-first pages and retention deletes do not read the whole
+    database. Company and location filters are case-insensitive substring
+    matches (``LIKE '%...%'``), which no B-tree index can serve; they scan
+    the table, without loading it into Python. The database runs in WAL
+    mode so API reads do not block a scrape that is writing.
+    """
+
+    def __init__(self, db_path: Path, retention_days: int = 30):
+        """Initialize SQLite storage.
+
+        Args:
+            db_path: Path to the database file
+            retention_days: Number of days to track seen jobs
+        """
+        self.db_path = Path(db_path)
+        self.retention_days = retention_days
+        self.logger = logging.getLogger(__name__)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.created = not self.db_path.exists()
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection and commit (or roll back) when done.
+
+        A connection per operation keeps the storage usable from the API
+        event loop and scraper threads alike.
+        """
+        with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+
+    def save(self, jobs: List[Job]) -> None:
+        """Insert new jobs and mark them as seen, skipping existing job IDs.
+
+        Args:
+            jobs: List of NEW Job objects to add
+        """
+        if not jobs:
+            return
+
+        seen_at = datetime.now().isoformat()
+        cutoff = retention_cutoff(self.retention_days)
+
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                f"INSERT OR IGNORE INTO jobs (job_id, {', '.join(JOB_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(JOB_COLUMNS) + 1))})",
+                (self._job_row(job) for job in jobs)
+            )
+            inserted = conn.total_changes - before
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO seen_jobs (job_id, seen_at) VALUES (?, ?)",
+                ((job.job_id, seen_at) for job in jobs)
+            )
+            conn.execute("DELETE FROM seen_jobs WHERE seen_at <= ?", (cutoff,))
+            total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+        self.logger.info(f"Saved {inserted} new jobs (total: {total} jobs in database)")
+
+    def data_files(self) -> List[Path]:
+        """The database and its write-ahead log, which takes commits first."""
+        return [self.db_path, self.db_path.with_name(self.db_path.name + "-wal")]
+
+    def load(self) -> List[Job]:
+        """Load all jobs, most recently scraped first.
+
+        Returns:
+            List of Job objects
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs ORDER BY scraped_at DESC"
+            ).fetchall()
+        return [Job.from_dict(dict(row)) for row in rows]
+
+    def _stream_jobs(self, since: Optional[str] = None) -> Iterator[Job]:
+        """Stream jobs from a cursor in insertion order.
+
+        Args:
+            since: ISO timestamp lower bound, or None for all jobs
+
+        Yields:
+            Job objects
+        """
+        where, params = ("WHERE scraped_at >= ?", (since,)) if since else ("", ())
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs {where} ORDER BY rowid", params
+            )
+            for row in cursor:
+                yield Job.from_dict(dict(row))
+
+    def exists(self, job: Job) -> bool:
+        """Check if job already exists in seen jobs.
+
+        Args:
+            job: Job to check
+
+        Returns:
+            True if job was seen before
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT 1 FROM seen_jobs WHERE job_id = ?", (job.job_id,)).fetchone()
+        return row is not None
+
+    def contains_many(self, jobs: List[Job]) -> List[bool]:
+        """Check a batch of jobs against seen jobs in a few queries.
+
+        Args:
+            jobs: Jobs to check
+
+        Returns:
+            One flag per job, True if it was seen before
+        """
+        job_ids = [job.job_id for job in jobs]
+        seen = set()
+
+        with self._connect() as conn:
+            for start in range(0, len(job_ids), MAX_PARAMS):
+                chunk = job_ids[start:start + MAX_PARAMS]
+                rows = conn.execute(
+                    f"SELECT job_id FROM seen_jobs WHERE job_id IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                )
+                seen.update(row[0] for row in rows)
+
+        return [job_id in seen for job_id in job_ids]
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Look up a job by its canonical ID.
+
+        Args:
+            job_id: Canonical job ID
+
+        Returns:
+            Job, or None if not stored
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return Job.from_dict(dict(row)) if row else None
+
+    def query_jobs(
+        self,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        since: Optional[str] = None
+    ) -> Tuple[int, List[Job]]:
+        """Filter jobs by substring and return one page, newest first.
+
+        Unfiltered pages and ``since`` bounds walk the scraped_at index;
+        filters scan the table.
+
+        Args:
+            company: Case-insensitive substring of the company name
+            location: Case-insensitive substring of the location
+            limit: Maximum number of jobs to return (None = all)
+            offset: Number of matching jobs to skip
+            since: ISO timestamp; only jobs scraped at or after it
+
+        Returns:
+            Tuple of (total matching jobs, jobs in the requested page)
+        """
+        clauses, params = [], []
+        if company:
+            clauses.append("company LIKE ? ESCAPE '\\'")
+            params.append(f"%{self._escape_like(company)}%")
+        if location:
+            clauses.append("location LIKE ? ESCAPE '\\'")
+            params.append(f"%{self._escape_like(location)}%")
+        if since:
+            clauses.append("scraped_at >= ?")
+            params.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM jobs {where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs {where} "
+                f"ORDER BY scraped_at DESC LIMIT ? OFFSET ?",
+                params + [limit if limit is not None else -1, offset]
+            ).fetchall()
+
+        return total, [Job.from_dict(dict(row)) for row in rows]
+
+    def cleanup_old_jobs(self) -> int:
+        """Remove jobs older than retention_days from the database.
+
+        Returns:
+            Number of jobs removed
+        """
+        cutoff = retention_cutoff(self.retention_days)
+
+        with self._connect() as conn:
+            removed_count = conn.execute("DELETE FROM jobs WHERE scraped_at <= ?", (cutoff,)).rowcount
+
+        if removed_count > 0:
+            self.logger.info(f"Cleaned up {removed_count} jobs older than {self.retention_days} days")
+        else:
+            self.logger.info(f"No jobs older than {self.retention_days} days to clean up")
+
+        return removed_count
+
+    def import_json(self, jobs: Iterable[Job], seen_jobs_path: Optional[Path] = None) -> None:
+        """Copy jobs and seen-jobs tracking from the JSON backend.
+
+        Args:
+            jobs: Jobs to copy (e.g. JSONStorage.load())
+            seen_jobs_path: JSON seen jobs file to copy
+        """
+        jobs = list(jobs)
+        seen_jobs = {}
+        if seen_jobs_path and Path(seen_jobs_path).exists():
+            with open(seen_jobs_path, "r", encoding="utf-8") as f:
+                seen_jobs = canonicalize_seen_jobs(json.load(f))
+
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO jobs (job_id, {', '.join(JOB_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(JOB_COLUMNS) + 1))})",
+                (self._job_row(job) for job in jobs)
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO seen_jobs (job_id, seen_at) VALUES (?, ?)",
+                seen_jobs.items()
+            )
+
+        self.logger.info(f"Imported {len(jobs)} jobs and {len(seen_jobs)} seen jobs into {self.db_path}")
+
+    @staticmethod
+    def _job_row(job: Job) -> tuple:
+        data = job.to_dict()
+        return (job.job_id, *(data[column] for column in JOB_COLUMNS))
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,128 @@
+"""Incremental readers for JSON job files."""
+
+import json
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+# Bytes read from disk at a time
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+def iter_json_array(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the current chunk and the element being decoded are held in
+    memory, so a file of any size can be scanned with flat memory.
+
+    Args:
+        path: Path to a file containing a JSON array
+        chunk_size: Characters to read per chunk
+
+    Yields:
+        Each array element, decoded
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON array
+    """
+    decoder = json.JSONDecoder()
+
+    with open(path, "r", encoding="utf-8") as f:
+        buffer = f.read(chunk_size).lstrip(_WHITESPACE)
+        if not buffer:
+            return
+        if not buffer.startswith("["):
+            raise ValueError(f"{path} does not contain a JSON array")
+        buffer = buffer[1:]
+        eof = False
+
+        while True:
+            buffer = buffer.lstrip(_WHITESPACE + ",")
+            if buffer.startswith("]"):
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # The element continues past the end of the buffer
+                if eof:
+                    raise ValueError(f"Truncated JSON array in {path}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+
+            yield item
+            buffer = buffer[end:]
+
+            if len(buffer) < chunk_size and not eof:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+
+
+def append_position(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Mark where the next line appended to a file will start.
+
+    Args:
+        path: Path to an append-only, line-oriented file
+
+    Returns:
+        Tuple of (device, inode, offset just past the last complete
+        line), or None if the file does not exist
+    """
+    try:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            return stat.st_dev, stat.st_ino, _last_line_end(f, stat.st_size)
+    except FileNotFoundError:
+        return None
+
+
+def read_appended_lines(
+    path: Path,
+    position: Optional[Tuple[int, int, int]]
+) -> Optional[Tuple[List[bytes], Optional[Tuple[int, int, int]]]]:
+    """Read the complete lines appended to a file since ``append_position``.
+
+    A line still being written is left for the next call.
+
+    Args:
+        path: Path to an append-only, line-oriented file
+        position: Marker from ``append_position`` or a previous call, or
+            None to read from the start
+
+    Returns:
+        Tuple of (lines, marker for the next call), or None if the file was
+        replaced, truncated or removed since ``position`` (e.g. compacted)
+    """
+    try:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            offset = 0
+            if position is not None:
+                dev, ino, offset = position
+                if (stat.st_dev, stat.st_ino) != (dev, ino) or stat.st_size < offset:
+                    return None
+            end = _last_line_end(f, stat.st_size)
+            f.seek(offset)
+            data = f.read(end - offset)
+    except FileNotFoundError:
+        return None if position is not None else ([], None)
+
+    return data.splitlines(), (stat.st_dev, stat.st_ino, end)
+
+
+def _last_line_end(f: BinaryIO, size: int, chunk_size: int = CHUNK_SIZE) -> int:
+    """Offset just past the last newline in the first ``size`` bytes of a file."""
+    end = size
+    while end > 0:
+        start = max(0, end - chunk_size)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b"\n")
+        if newline >= 0:
+            return start + newline + 1
+        end = start
+    return 0
@@ -72,7 +72,7 @@ class Config:
         """Get output file path with current date.
 
         Args:
-            file_type: Type of file (json or csv)
+            file_type: Type of file (json, jsonl or csv)
 
         Returns:
             Path to output file
@@ -83,6 +83,8 @@ class Config:
 
         if file_type == "json":
             filename = self.get("storage.json_file", "jobs_{date}.json")
+        elif file_type == "jsonl":
+            filename = self.get("storage.jsonl_file", "jobs.jsonl")
         else:
             filename = self.get("storage.csv_file", "jobs_{date}.csv")
 
@@ -93,6 +95,27 @@ class Config:
 
         return output_dir / filename
 
+    def get_database_path(self) -> Path:
+        """Get path to the SQLite job database.
+
+        Returns:
+            Path to database file
+        """
+        project_root = Path(__file__).parent.parent.parent
+        output_dir = project_root / self.get("storage.output_dir", "data")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir / self.get("storage.sqlite_file", "jobs.db")
+
+    def get_partition_dir(self) -> Path:
+        """Get directory holding date-partitioned job files.
+
+        Returns:
+            Path to partition directory
+        """
+        project_root = Path(__file__).parent.parent.parent
+        output_dir = project_root / self.get("storage.output_dir", "data")
+        return output_dir / self.get("storage.partition_dir", "jobs")
+
     def get_log_path(self) -> Path:
         """Get log file path with current date.
 
@@ -122,6 +145,26 @@ class Config:
         filename = self.get("deduplication.seen_jobs_file", "data/seen_jobs.json")
         return project_root / filename
 
+    def get_seen_index_path(self) -> Path:
+        """Get path to the compact seen jobs index file.
+
+        Returns:
+            Path to seen jobs index file
+        """
+        project_root = Path(__file__).parent.parent.parent
+        filename = self.get("deduplication.seen_index_file", "data/seen_jobs.idx")
+        return project_root / filename
+
+    def get_checkpoint_path(self) -> Path:
+        """Get base path of the scrape checkpoint files used for resuming.
+
+        Returns:
+            Path the per-search checkpoint file names are derived from
+        """
+        project_root = Path(__file__).parent.parent.parent
+        filename = self.get("scraper.checkpoint.file", "data/scrape_checkpoint.json")
+        return project_root / filename
+
     @property
     def scraper(self) -> Dict[str, Any]:
         """Get scraper configuration."""
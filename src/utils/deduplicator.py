@@ -10,15 +10,17 @@ from ..storage import BaseStorage
 class Deduplicator:
     """Handle deduplication of job listings."""
 
-    def __init__(self, storage: BaseStorage, key_field: str = "job_url"):
+    def __init__(self, storage: BaseStorage, key_field: str = "job_id"):
         """Initialize deduplicator.
 
         Args:
             storage: Storage backend for tracking seen jobs
-            key_field: Field to use as unique identifier
+            key_field: Field to use as unique identifier. "job_url" is
+                treated as "job_id", since raw URLs carry per-impression
+                tracking parameters.
         """
         self.storage = storage
-        self.key_field = key_field
+        self.key_field = "job_id" if key_field == "job_url" else key_field
         self.logger = logging.getLogger(__name__)
 
     def filter_new_jobs(self, jobs: List[Job]) -> List[Job]:
@@ -33,8 +35,8 @@ class Deduplicator:
         new_jobs = []
         seen_count = 0
 
-        for job in jobs:
-            if not self.storage.exists(job):
+        for job, seen in zip(jobs, self.storage.contains_many(jobs)):
+            if not seen:
                 new_jobs.append(job)
             else:
                 seen_count += 1